@@ -6,13 +6,15 @@ Provides endpoints to manage global application settings like:
 - Feature flags (enable_governance, enable_membership, etc.)
 """
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func
 
-from app.db.base import get_db
+from app.db.base import get_db, upsert_insert
+from app.core.cache import TTLCache
 from app.core.deps import get_current_user
+from app.core.responses import ORJSONResponse
 from app.models.user import User
 from app.models.app_setting import AppSetting
 from app.schemas.settings import (
@@ -24,9 +26,28 @@ from app.schemas.settings import (
 
 router = APIRouter()
 
+# In-process TTL cache for public settings: key -> value
+_public_cache = TTLCache(ttl=30.0)
 
-def require_superadmin(current_user: User) -> User:
-    """Verify user is a superadmin."""
+DEFAULT_FEATURES = {
+    "enable_governance": True,
+    "enable_membership": True,
+    "enable_finance": True,
+    "enable_documents": True,
+    "enable_projects": False,
+    "enable_events": False,
+}
+
+DEFAULT_BRANDING = {
+    "app_name": "OrgSuite",
+    "primary_color": "#3B82F6",
+    "support_email": "support@orgsuite.app",
+    "logo_url": None,
+}
+
+
+async def require_superadmin(current_user: User = Depends(get_current_user)) -> User:
+    """Dependency that verifies the current user is a superadmin."""
     if not current_user.is_superadmin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -35,11 +56,47 @@ def require_superadmin(current_user: User) -> User:
     return current_user
 
 
+def app_setting_to_response(setting: AppSetting) -> AppSettingResponse:
+    """
+    Convert AppSetting model to response schema.
+
+    Uses model_construct to skip validation; the input is a trusted DB row.
+    """
+    return AppSettingResponse.model_construct(
+        id=setting.id,
+        key=setting.key,
+        value=setting.value,
+        description=setting.description,
+        created=setting.created,
+        updated=setting.updated,
+    )
+
+
+def invalidate_public_cache(*keys: str) -> None:
+    """Drop cached public settings for the given keys."""
+    _public_cache.delete(*keys)
+
+
+async def get_cached_public_setting(db: AsyncSession, key: str, default: dict) -> Any:
+    """Return a public setting value, serving from the TTL cache when fresh."""
+    cached = _public_cache.get(key)
+    if cached is not None:
+        return cached
+
+    value = await db.scalar(
+        select(AppSetting.value).where(AppSetting.key == key)
+    )
+    value = value or default
+
+    _public_cache.set(key, value)
+    return value
+
+
 @router.get("", response_model=AppSettingListResponse)
 async def list_app_settings(
     key: Optional[str] = Query(None, description="Filter by key prefix"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(require_superadmin)
 ):
     """
     List all global app settings.
@@ -48,41 +105,37 @@ async def list_app_settings(
 
     Optional filter by key prefix to search specific settings.
     """
-    require_superadmin(current_user)
-
     query = select(AppSetting)
 
     if key:
         query = query.where(AppSetting.key.ilike(f"{key}%"))
 
-    query = query.order_by(AppSetting.key)
+    query = query.order_by(AppSetting.key).execution_options(yield_per=500)
 
-    result = await db.execute(query)
-    settings = result.scalars().all()
+    # Stream rows in batches and build the response in a single pass
+    result = await db.stream_scalars(query)
+    items = [app_setting_to_response(s) async for s in result]
 
-    return AppSettingListResponse(
-        items=[AppSettingResponse.model_validate(s) for s in settings],
-        total=len(settings)
-    )
+    return ORJSONResponse({
+        "items": items,
+        "total": len(items),
+    })
 
 
 @router.get("/{key}", response_model=AppSettingResponse)
 async def get_app_setting(
     key: str,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(require_superadmin)
 ):
     """
     Get a single app setting by key.
 
     Superadmin access required.
     """
-    require_superadmin(current_user)
-
-    result = await db.execute(
+    setting = await db.scalar(
         select(AppSetting).where(AppSetting.key == key)
     )
-    setting = result.scalar_one_or_none()
 
     if not setting:
         raise HTTPException(
@@ -90,7 +143,7 @@ async def get_app_setting(
             detail=f"App setting '{key}' not found"
         )
 
-    return AppSettingResponse.model_validate(setting)
+    return app_setting_to_response(setting)
 
 
 @router.put("/{key}", response_model=AppSettingResponse)
@@ -98,7 +151,7 @@ async def upsert_app_setting(
     key: str,
     data: AppSettingUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(require_superadmin)
 ):
     """
     Create or update an app setting by key (upsert).
@@ -108,13 +161,10 @@ async def upsert_app_setting(
     If the setting exists, updates its value.
     If not, creates a new setting with the given key.
     """
-    require_superadmin(current_user)
-
     # Try to find existing setting
-    result = await db.execute(
+    setting = await db.scalar(
         select(AppSetting).where(AppSetting.key == key)
     )
-    setting = result.scalar_one_or_none()
 
     if setting:
         # Update existing
@@ -122,7 +172,6 @@ async def upsert_app_setting(
             setting.value = data.value
         if data.description is not None:
             setting.description = data.description
-        setting.updated = datetime.now(timezone.utc)
     else:
         # Create new
         setting = AppSetting(
@@ -132,29 +181,27 @@ async def upsert_app_setting(
         )
         db.add(setting)
 
-    await db.flush()
-    await db.refresh(setting)
+    # id/created/updated are populated by Python-side column defaults on flush
+    await db.commit()
+    invalidate_public_cache(key)
 
-    return AppSettingResponse.model_validate(setting)
+    return app_setting_to_response(setting)
 
 
 @router.delete("/{key}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_app_setting(
     key: str,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(require_superadmin)
 ):
     """
     Delete an app setting by key.
 
     Superadmin access required.
     """
-    require_superadmin(current_user)
-
-    result = await db.execute(
+    setting = await db.scalar(
         select(AppSetting).where(AppSetting.key == key)
     )
-    setting = result.scalar_one_or_none()
 
     if not setting:
         raise HTTPException(
@@ -163,7 +210,8 @@ async def delete_app_setting(
         )
 
     await db.delete(setting)
-    await db.flush()
+    await db.commit()
+    invalidate_public_cache(key)
 
     return None
 
@@ -172,7 +220,7 @@ async def delete_app_setting(
 async def bulk_upsert_app_settings(
     settings: dict,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(require_superadmin)
 ):
     """
     Bulk create or update multiple app settings.
@@ -181,30 +229,28 @@ async def bulk_upsert_app_settings(
 
     Accepts a dict of key: value pairs and creates/updates each.
     """
-    require_superadmin(current_user)
+    if not settings:
+        return AppSettingListResponse(items=[], total=0)
 
-    updated_settings = []
-
-    for key, value in settings.items():
-        # Try to find existing setting
-        result = await db.execute(
-            select(AppSetting).where(AppSetting.key == key)
-        )
-        setting = result.scalar_one_or_none()
+    # Single INSERT ... ON CONFLICT (key) DO UPDATE for all keys
+    now = datetime.now(timezone.utc)
+    stmt = upsert_insert(db, AppSetting).values(
+        [{"key": key, "value": value, "created": now, "updated": now} for key, value in settings.items()]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[AppSetting.key],
+        set_={"value": stmt.excluded.value, "updated": func.now()},
+    ).returning(AppSetting)
 
-        if setting:
-            setting.value = value
-            setting.updated = datetime.now(timezone.utc)
-        else:
-            setting = AppSetting(key=key, value=value)
-            db.add(setting)
+    result = await db.execute(stmt, execution_options={"populate_existing": True})
+    by_key = {s.key: s for s in result.scalars().all()}
+    updated_settings = [by_key[key] for key in settings]
 
-        await db.flush()
-        await db.refresh(setting)
-        updated_settings.append(setting)
+    await db.commit()
+    invalidate_public_cache(*settings.keys())
 
     return AppSettingListResponse(
-        items=[AppSettingResponse.model_validate(s) for s in updated_settings],
+        items=[app_setting_to_response(s) for s in updated_settings],
         total=len(updated_settings)
     )
 
@@ -219,23 +265,8 @@ async def get_public_features(
     Returns enabled features for the application.
     Used by frontend to show/hide modules.
     """
-    result = await db.execute(
-        select(AppSetting).where(AppSetting.key == "features")
-    )
-    setting = result.scalar_one_or_none()
-
-    if setting and setting.value:
-        return setting.value
-
-    # Return defaults if not configured
-    return {
-        "enable_governance": True,
-        "enable_membership": True,
-        "enable_finance": True,
-        "enable_documents": True,
-        "enable_projects": False,
-        "enable_events": False,
-    }
+    value = await get_cached_public_setting(db, "features", DEFAULT_FEATURES)
+    return ORJSONResponse(value)
 
 
 @router.get("/public/branding", response_model=dict)
@@ -248,18 +279,5 @@ async def get_public_branding(
     Returns app branding for the application.
     Used by frontend for customization.
     """
-    result = await db.execute(
-        select(AppSetting).where(AppSetting.key == "branding")
-    )
-    setting = result.scalar_one_or_none()
-
-    if setting and setting.value:
-        return setting.value
-
-    # Return defaults if not configured
-    return {
-        "app_name": "OrgSuite",
-        "primary_color": "#3B82F6",
-        "support_email": "support@orgsuite.app",
-        "logo_url": None,
-    }
+    value = await get_cached_public_setting(db, "branding", DEFAULT_BRANDING)
+    return ORJSONResponse(value)
@@ -16,6 +16,7 @@ from sqlalchemy import select
 
 from app.db.base import get_db
 from app.core.deps import get_current_user
+from app.core.permissions import org_exists
 from app.models.user import User
 from app.models.organization import Organization
 from app.models.org_membership import OrgMembership, OrgMembershipRole
@@ -78,11 +79,7 @@ async def require_org_admin(
 ) -> None:
     """Verify user has admin access to the organization."""
     # First check if org exists
-    result = await db.execute(
-        select(Organization).where(Organization.id == org_id)
-    )
-    org = result.scalar_one_or_none()
-    if not org:
+    if not await org_exists(db, org_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Organization not found"
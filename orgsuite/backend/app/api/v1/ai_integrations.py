@@ -10,7 +10,6 @@ from app.db.base import get_db
 from app.core.deps import get_current_user, get_current_user_optional
 from app.models.user import User
 from app.models.ai_integration import AIIntegration as AIIntegrationModel, AIProvider
-from app.models.organization import Organization
 from app.core.permissions import require_min_role, OrgMembershipRole
 from app.schemas.ai_integration import AIIntegrationCreate, AIIntegrationUpdate, AIIntegrationResponse
 from app.schemas.common import PaginatedResponse
@@ -69,12 +68,8 @@ async def list_ai_integrations(page: int = Query(1, ge=1), perPage: int = Query(
 
 @router.post("/records", response_model=AIIntegrationResponse, status_code=status.HTTP_200_OK)
 async def create_ai_integration(data: AIIntegrationCreate, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
-    org_result = await db.execute(select(Organization).where(Organization.id == data.organization))
-    org = org_result.scalar_one_or_none()
-    if org is None:
-        raise HTTPException(status_code=404, detail="Organization not found")
-
-    # Role enforcement: admin or owner required to create AI integration
+    # Role enforcement: admin or owner required to create AI integration.
+    # require_min_role also raises 404 for an unknown organization.
     await require_min_role(db, current_user.id, data.organization, OrgMembershipRole.ADMIN)
 
     try:
@@ -1,18 +1,19 @@
 """
 Committee endpoints - compatible with PocketBase SDK.
 """
-from datetime import datetime, timezone
 from typing import Optional
 from math import ceil
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, and_, exists, union
 from sqlalchemy.orm import selectinload
 
 from app.db.base import get_db
 from app.core.deps import get_current_user, get_current_user_optional
+from app.core.filters import parse_pocketbase_filter
+from app.core.responses import ORJSONResponse
 from app.models.user import User
-from app.models.committee import Committee
+from app.models.committee import Committee, committee_admins
 from app.models.organization import Organization
 from app.models.org_membership import OrgMembership, OrgMembershipRole
 from app.schemas.committee import CommitteeCreate, CommitteeUpdate, CommitteeResponse
@@ -21,20 +22,78 @@ from app.schemas.common import PaginatedResponse
 router = APIRouter()
 
 
-def committee_to_response(committee: Committee, expand: Optional[dict] = None) -> CommitteeResponse:
-    """Convert Committee model to CommitteeResponse schema."""
-    return CommitteeResponse(
+# PocketBase filter fields supported by list_committees
+_COMMITTEE_FILTER_FIELDS = {
+    "organization": Committee.organization_id,
+}
+
+
+# Sortable columns for list_committees, resolved once at import
+_COMMITTEE_SORTABLE = {
+    "name": Committee.name,
+    "created": Committee.created,
+    "updated": Committee.updated,
+}
+
+
+def committee_to_response(
+    committee: Committee,
+    expand: Optional[dict] = None,
+    admin_ids: Optional[list[str]] = None,
+) -> CommitteeResponse:
+    """
+    Convert Committee model to CommitteeResponse schema.
+
+    Uses model_construct to skip validation; the input is a trusted DB row.
+    """
+    return CommitteeResponse.model_construct(
         id=committee.id,
         organization=committee.organization_id,
         name=committee.name,
         description=committee.description,
-        admins=[admin.id for admin in committee.admins] if committee.admins else [],
+        admins=admin_ids if admin_ids is not None else [admin.id for admin in committee.admins],
         created=committee.created,
         updated=committee.updated,
         expand=expand,
     )
 
 
+async def _authorize_org_write(db: AsyncSession, org_id: str, user_id: str, detail: str) -> None:
+    """
+    Ensure the user is the org owner or an active owner/admin member.
+
+    Organization ownership and membership role are fetched in one query.
+    """
+    result = await db.execute(
+        select(Organization.owner_id, OrgMembership.role)
+        .select_from(Organization)
+        .join(
+            OrgMembership,
+            and_(
+                OrgMembership.organization_id == Organization.id,
+                OrgMembership.user_id == user_id,
+                OrgMembership.is_active == True
+            ),
+            isouter=True
+        )
+        .where(Organization.id == org_id)
+    )
+    row = result.first()
+
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Organization not found"
+        )
+
+    owner_id, role = row
+    if owner_id != user_id and role not in (OrgMembershipRole.OWNER, OrgMembershipRole.ADMIN):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=detail
+        )
+
+
 @router.get("/records", response_model=PaginatedResponse[CommitteeResponse])
 async def list_committees(
     page: int = Query(1, ge=1),
@@ -49,29 +108,38 @@ async def list_committees(
     List committees.
     PocketBase SDK: pb.collection('committees').getList()
     """
-    query = select(Committee).options(selectinload(Committee.admins))
+    filters = [
+        _COMMITTEE_FILTER_FIELDS[field] == value
+        for field, value in parse_pocketbase_filter(filter).items()
+        if field in _COMMITTEE_FILTER_FIELDS
+    ]
+
+    # Restrict authenticated callers to committees in orgs they own or
+    # belong to; owners count even without a membership row, as in
+    # _authorize_org_write
+    if current_user is not None:
+        accessible_orgs = union(
+            select(Organization.id).where(Organization.owner_id == current_user.id),
+            select(OrgMembership.organization_id).where(
+                OrgMembership.user_id == current_user.id,
+                OrgMembership.is_active == True
+            ),
+        )
+        filters.append(Committee.organization_id.in_(accessible_orgs))
 
-    # Parse simple filters if provided
-    if filter:
-        # Simple organization filter: organization='xxx'
-        if "organization=" in filter:
-            org_id = filter.split("organization=")[1].split("'")[1] if "'" in filter else filter.split("organization=")[1].split()[0]
-            query = query.where(Committee.organization_id == org_id)
+    # Count total directly on the base table (no eager loads or ordering)
+    count_query = select(func.count(Committee.id)).where(*filters)
+    total_items = await db.scalar(count_query) or 0
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total_items = total_result.scalar() or 0
+    # Admins are eager-loaded only for the paginated slice
+    query = select(Committee).options(selectinload(Committee.admins)).where(*filters)
 
     # Apply sorting
     if sort:
-        if sort.startswith("-"):
-            field_name = sort[1:]
-            if hasattr(Committee, field_name):
-                query = query.order_by(getattr(Committee, field_name).desc())
-        else:
-            if hasattr(Committee, sort):
-                query = query.order_by(getattr(Committee, sort).asc())
+        descending = sort.startswith("-")
+        column = _COMMITTEE_SORTABLE.get(sort.lstrip("-"))
+        if column is not None:
+            query = query.order_by(column.desc() if descending else column.asc())
     else:
         query = query.order_by(Committee.created.desc())
 
@@ -85,13 +153,13 @@ async def list_committees(
     # Build response
     items = [committee_to_response(c) for c in committees]
 
-    return PaginatedResponse(
-        page=page,
-        perPage=perPage,
-        totalItems=total_items,
-        totalPages=ceil(total_items / perPage) if total_items > 0 else 1,
-        items=items
-    )
+    return ORJSONResponse({
+        "page": page,
+        "perPage": perPage,
+        "totalItems": total_items,
+        "totalPages": ceil(total_items / perPage) if total_items > 0 else 1,
+        "items": items,
+    })
 
 
 @router.post("/records", response_model=CommitteeResponse, status_code=status.HTTP_200_OK)
@@ -105,34 +173,10 @@ async def create_committee(
     PocketBase SDK: pb.collection('committees').create()
     """
     # Check organization exists and user has permission
-    org_result = await db.execute(
-        select(Organization).where(Organization.id == committee_data.organization)
-    )
-    org = org_result.scalar_one_or_none()
-
-    if org is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Organization not found"
-        )
-
-    # Check user is member of org
-    membership_result = await db.execute(
-        select(OrgMembership).where(
-            OrgMembership.organization_id == committee_data.organization,
-            OrgMembership.user_id == current_user.id,
-            OrgMembership.is_active == True
-        )
+    await _authorize_org_write(
+        db, committee_data.organization, current_user.id,
+        "Not authorized to create committees in this organization"
     )
-    membership = membership_result.scalar_one_or_none()
-
-    if org.owner_id != current_user.id and (
-        membership is None or membership.role not in [OrgMembershipRole.OWNER, OrgMembershipRole.ADMIN]
-    ):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to create committees in this organization"
-        )
 
     # Create committee
     committee = Committee(
@@ -159,12 +203,11 @@ async def get_committee(
     Get committee by ID.
     PocketBase SDK: pb.collection('committees').getOne()
     """
-    result = await db.execute(
+    committee = await db.scalar(
         select(Committee)
         .options(selectinload(Committee.admins))
         .where(Committee.id == committee_id)
     )
-    committee = result.scalar_one_or_none()
 
     if committee is None:
         raise HTTPException(
@@ -186,12 +229,9 @@ async def update_committee(
     Update committee.
     PocketBase SDK: pb.collection('committees').update()
     """
-    result = await db.execute(
-        select(Committee)
-        .options(selectinload(Committee.admins))
-        .where(Committee.id == committee_id)
+    committee = await db.scalar(
+        select(Committee).where(Committee.id == committee_id)
     )
-    committee = result.scalar_one_or_none()
 
     if committee is None:
         raise HTTPException(
@@ -200,30 +240,20 @@ async def update_committee(
         )
 
     # Check permission - must be committee admin or org owner/admin
-    is_committee_admin = any(admin.id == current_user.id for admin in committee.admins)
-
-    if not is_committee_admin:
-        org_result = await db.execute(
-            select(Organization).where(Organization.id == committee.organization_id)
+    is_committee_admin = await db.scalar(
+        select(
+            exists().where(
+                committee_admins.c.committee_id == committee_id,
+                committee_admins.c.user_id == current_user.id
+            )
         )
-        org = org_result.scalar_one_or_none()
+    )
 
-        membership_result = await db.execute(
-            select(OrgMembership).where(
-                OrgMembership.organization_id == committee.organization_id,
-                OrgMembership.user_id == current_user.id,
-                OrgMembership.is_active == True
-            )
+    if not is_committee_admin:
+        await _authorize_org_write(
+            db, committee.organization_id, current_user.id,
+            "Not authorized to update this committee"
         )
-        membership = membership_result.scalar_one_or_none()
-
-        if org.owner_id != current_user.id and (
-            membership is None or membership.role not in [OrgMembershipRole.OWNER, OrgMembershipRole.ADMIN]
-        ):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to update this committee"
-            )
 
     # Update fields
     if committee_data.name is not None:
@@ -231,10 +261,14 @@ async def update_committee(
     if committee_data.description is not None:
         committee.description = committee_data.description
 
-    committee.updated = datetime.now(timezone.utc)
+    # `updated` is bumped by TimestampMixin's onupdate on flush
     await db.flush()
 
-    return committee_to_response(committee)
+    admin_ids = (await db.scalars(
+        select(committee_admins.c.user_id).where(committee_admins.c.committee_id == committee_id)
+    )).all()
+
+    return committee_to_response(committee, admin_ids=list(admin_ids))
 
 
 @router.delete("/records/{committee_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -247,12 +281,9 @@ async def delete_committee(
     Delete committee.
     PocketBase SDK: pb.collection('committees').delete()
     """
-    result = await db.execute(
-        select(Committee)
-        .options(selectinload(Committee.admins))
-        .where(Committee.id == committee_id)
+    committee = await db.scalar(
+        select(Committee).where(Committee.id == committee_id)
     )
-    committee = result.scalar_one_or_none()
 
     if committee is None:
         raise HTTPException(
@@ -261,26 +292,10 @@ async def delete_committee(
         )
 
     # Check permission - org owner or admin only
-    org_result = await db.execute(
-        select(Organization).where(Organization.id == committee.organization_id)
+    await _authorize_org_write(
+        db, committee.organization_id, current_user.id,
+        "Not authorized to delete this committee"
     )
-    org = org_result.scalar_one_or_none()
-
-    if org.owner_id != current_user.id:
-        membership_result = await db.execute(
-            select(OrgMembership).where(
-                OrgMembership.organization_id == committee.organization_id,
-                OrgMembership.user_id == current_user.id,
-                OrgMembership.is_active == True
-            )
-        )
-        membership = membership_result.scalar_one_or_none()
-
-        if membership is None or membership.role not in [OrgMembershipRole.OWNER, OrgMembershipRole.ADMIN]:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to delete this committee"
-            )
 
     await db.delete(committee)
     await db.flush()
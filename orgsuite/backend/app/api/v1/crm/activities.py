@@ -11,33 +11,48 @@ from typing import Optional
 from math import ceil
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, update, exists
 
 from app.db.base import get_db
 from app.core.deps import get_current_user
-from app.core.permissions import require_min_role, is_admin_or_owner
+from app.core.permissions import require_min_role, is_admin_or_owner, has_min_role
+from app.core.responses import ORJSONResponse
 from app.models.user import User
 from app.models.activity import Activity, ActivityType
 from app.models.opportunity import Opportunity
-from app.models.org_membership import OrgMembershipRole
+from app.models.organization import Organization
+from app.models.org_membership import OrgMembership, OrgMembershipRole
 from app.schemas.crm import (
     ActivityCreate, ActivityUpdate, ActivityResponse, ActivityListResponse
 )
 
 router = APIRouter()
 
+# Activity type lookup by value, built once at import
+_ACTIVITY_TYPE_MAP = {t.value: t for t in ActivityType}
 
-async def activity_to_response(activity: Activity, db: AsyncSession) -> ActivityResponse:
-    """Convert Activity model to response schema with expanded fields."""
-    creator_name = None
 
-    if activity.created_by_user_id:
-        result = await db.execute(
-            select(User.name).where(User.id == activity.created_by_user_id)
-        )
-        creator_name = result.scalar_one_or_none()
+async def get_creator_names(db: AsyncSession, activities: list[Activity]) -> dict[str, str]:
+    """Fetch creator names for a batch of activities in a single query."""
+    user_ids = {a.created_by_user_id for a in activities if a.created_by_user_id}
+    if not user_ids:
+        return {}
+
+    result = await db.execute(
+        select(User.id, User.name).where(User.id.in_(user_ids))
+    )
+    return dict(result.all())
+
 
-    return ActivityResponse(
+def activity_to_response(activity: Activity, creator_names: dict[str, str]) -> ActivityResponse:
+    """
+    Convert Activity model to response schema with expanded fields.
+
+    Uses model_construct to skip validation; the input is a trusted DB row.
+    """
+    creator_name = creator_names.get(activity.created_by_user_id) if activity.created_by_user_id else None
+
+    return ActivityResponse.model_construct(
         id=activity.id,
         organization_id=activity.organization_id,
         opportunity_id=activity.opportunity_id,
@@ -54,6 +69,53 @@ async def activity_to_response(activity: Activity, db: AsyncSession) -> Activity
     )
 
 
+async def update_own_activity(
+    db: AsyncSession,
+    activity_id: str,
+    organization_id: str,
+    membership: Optional[OrgMembership],
+    current_user: User,
+    values: dict,
+    forbidden_detail: str,
+) -> Activity:
+    """
+    Apply `values` to an activity with a single UPDATE ... RETURNING.
+
+    Non-admins may only update activities they created; that check is part
+    of the UPDATE's WHERE clause. `updated` is set by TimestampMixin's onupdate.
+    """
+    stmt = update(Activity).where(
+        Activity.id == activity_id,
+        Activity.organization_id == organization_id
+    )
+    if not is_admin_or_owner(membership):
+        stmt = stmt.where(Activity.created_by_user_id == current_user.id)
+
+    activity = await db.scalar(
+        stmt.values(**values).returning(Activity),
+        execution_options={"populate_existing": True}
+    )
+    if activity is not None:
+        return activity
+
+    # Nothing updated: tell apart a missing activity from a permission failure
+    activity_exists = await db.scalar(
+        select(Activity.id).where(
+            Activity.id == activity_id,
+            Activity.organization_id == organization_id
+        )
+    )
+    if activity_exists is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Activity not found"
+        )
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail=forbidden_detail
+    )
+
+
 @router.get("/activities", response_model=ActivityListResponse)
 async def list_activities(
     organization_id: str = Query(..., description="Organization ID"),
@@ -67,22 +129,22 @@ async def list_activities(
     """List activities for an organization."""
     await require_min_role(db, current_user.id, organization_id, OrgMembershipRole.VIEWER)
 
-    query = select(Activity).where(Activity.organization_id == organization_id)
+    filters = [Activity.organization_id == organization_id]
 
     # Apply filters
     if opportunity_id:
-        query = query.where(Activity.opportunity_id == opportunity_id)
+        filters.append(Activity.opportunity_id == opportunity_id)
 
     if type:
-        try:
-            type_enum = ActivityType(type)
-            query = query.where(Activity.type == type_enum)
-        except ValueError:
-            pass
+        type_enum = _ACTIVITY_TYPE_MAP.get(type)
+        if type_enum is not None:
+            filters.append(Activity.type == type_enum)
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_items = (await db.execute(count_query)).scalar() or 0
+    # Count total directly on the base table
+    count_query = select(func.count(Activity.id)).where(*filters)
+    total_items = await db.scalar(count_query) or 0
+
+    query = select(Activity).where(*filters)
 
     # Order by created desc (most recent first)
     query = query.order_by(Activity.created.desc())
@@ -92,14 +154,15 @@ async def list_activities(
     result = await db.execute(query)
     activities = result.scalars().all()
 
-    items = [await activity_to_response(a, db) for a in activities]
-    return ActivityListResponse(
-        page=page,
-        perPage=perPage,
-        totalItems=total_items,
-        totalPages=ceil(total_items / perPage) if total_items > 0 else 1,
-        items=items
-    )
+    creator_names = await get_creator_names(db, activities)
+    items = [activity_to_response(a, creator_names) for a in activities]
+    return ORJSONResponse({
+        "page": page,
+        "perPage": perPage,
+        "totalItems": total_items,
+        "totalPages": ceil(total_items / perPage) if total_items > 0 else 1,
+        "items": items,
+    })
 
 
 @router.post("/activities", response_model=ActivityResponse, status_code=status.HTTP_201_CREATED)
@@ -110,26 +173,39 @@ async def create_activity(
     current_user: User = Depends(get_current_user)
 ):
     """Create a new activity."""
-    await require_min_role(db, current_user.id, organization_id, OrgMembershipRole.MEMBER)
+    # One round-trip: org existence, caller's role and opportunity ownership
+    row = (await db.execute(
+        select(
+            exists().where(Organization.id == organization_id).label("org_exists"),
+            select(OrgMembership.role).where(
+                OrgMembership.user_id == current_user.id,
+                OrgMembership.organization_id == organization_id
+            ).scalar_subquery().label("role"),
+            exists().where(
+                Opportunity.id == activity_data.opportunity_id,
+                Opportunity.organization_id == organization_id
+            ).label("opp_exists"),
+        )
+    )).one()
+
+    # Same checks and errors as require_min_role(..., MEMBER)
+    if not row.org_exists:
+        raise HTTPException(status_code=404, detail="Organization not found")
+    if row.role is None:
+        raise HTTPException(status_code=403, detail="Not a member of organization")
+    if not has_min_role(row.role, OrgMembershipRole.MEMBER):
+        raise HTTPException(status_code=403, detail="Insufficient role")
 
     # Verify opportunity exists and belongs to this org
-    opp_result = await db.execute(
-        select(Opportunity).where(
-            Opportunity.id == activity_data.opportunity_id,
-            Opportunity.organization_id == organization_id
-        )
-    )
-    opportunity = opp_result.scalar_one_or_none()
-    if opportunity is None:
+    if not row.opp_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Opportunity not found"
         )
 
     # Validate type
-    try:
-        type_enum = ActivityType(activity_data.type)
-    except ValueError:
+    type_enum = _ACTIVITY_TYPE_MAP.get(activity_data.type)
+    if type_enum is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid activity type: {activity_data.type}. Valid types: call, email, meeting, note, task"
@@ -150,7 +226,8 @@ async def create_activity(
     await db.flush()
     await db.refresh(activity)
 
-    return await activity_to_response(activity, db)
+    creator_names = await get_creator_names(db, [activity])
+    return activity_to_response(activity, creator_names)
 
 
 @router.get("/activities/{activity_id}", response_model=ActivityResponse)
@@ -163,13 +240,12 @@ async def get_activity(
     """Get an activity by ID."""
     await require_min_role(db, current_user.id, organization_id, OrgMembershipRole.VIEWER)
 
-    result = await db.execute(
+    activity = await db.scalar(
         select(Activity).where(
             Activity.id == activity_id,
             Activity.organization_id == organization_id
         )
     )
-    activity = result.scalar_one_or_none()
 
     if activity is None:
         raise HTTPException(
@@ -177,7 +253,8 @@ async def get_activity(
             detail="Activity not found"
         )
 
-    return await activity_to_response(activity, db)
+    creator_names = await get_creator_names(db, [activity])
+    return activity_to_response(activity, creator_names)
 
 
 @router.patch("/activities/{activity_id}", response_model=ActivityResponse)
@@ -191,51 +268,34 @@ async def update_activity(
     """Update an activity. Only creator or admin can update."""
     membership = await require_min_role(db, current_user.id, organization_id, OrgMembershipRole.MEMBER)
 
-    result = await db.execute(
-        select(Activity).where(
-            Activity.id == activity_id,
-            Activity.organization_id == organization_id
-        )
-    )
-    activity = result.scalar_one_or_none()
-
-    if activity is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Activity not found"
-        )
-
-    # Only creator or admin can update
-    if not is_admin_or_owner(membership) and activity.created_by_user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only update activities you created"
-        )
-
-    # Update fields
+    # Collect changed fields
+    values = {}
     if activity_data.contact_id is not None:
-        activity.contact_id = activity_data.contact_id or None
+        values["contact_id"] = activity_data.contact_id or None
     if activity_data.type is not None:
-        try:
-            activity.type = ActivityType(activity_data.type)
-        except ValueError:
+        type_enum = _ACTIVITY_TYPE_MAP.get(activity_data.type)
+        if type_enum is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Invalid activity type: {activity_data.type}"
             )
+        values["type"] = type_enum
     if activity_data.subject is not None:
-        activity.subject = activity_data.subject
+        values["subject"] = activity_data.subject
     if activity_data.description is not None:
-        activity.description = activity_data.description
+        values["description"] = activity_data.description
     if activity_data.due_date is not None:
-        activity.due_date = activity_data.due_date
+        values["due_date"] = activity_data.due_date
     if activity_data.completed_at is not None:
-        activity.completed_at = activity_data.completed_at
+        values["completed_at"] = activity_data.completed_at
 
-    activity.updated = datetime.now(timezone.utc)
-    await db.flush()
+    activity = await update_own_activity(
+        db, activity_id, organization_id, membership, current_user, values,
+        forbidden_detail="You can only update activities you created"
+    )
 
-    return await activity_to_response(activity, db)
+    creator_names = await get_creator_names(db, [activity])
+    return activity_to_response(activity, creator_names)
 
 
 @router.delete("/activities/{activity_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -248,13 +308,12 @@ async def delete_activity(
     """Delete an activity. Only creator or admin can delete."""
     membership = await require_min_role(db, current_user.id, organization_id, OrgMembershipRole.MEMBER)
 
-    result = await db.execute(
+    activity = await db.scalar(
         select(Activity).where(
             Activity.id == activity_id,
             Activity.organization_id == organization_id
         )
     )
-    activity = result.scalar_one_or_none()
 
     if activity is None:
         raise HTTPException(
@@ -285,29 +344,11 @@ async def complete_activity(
     """Mark an activity (especially tasks) as completed."""
     membership = await require_min_role(db, current_user.id, organization_id, OrgMembershipRole.MEMBER)
 
-    result = await db.execute(
-        select(Activity).where(
-            Activity.id == activity_id,
-            Activity.organization_id == organization_id
-        )
+    activity = await update_own_activity(
+        db, activity_id, organization_id, membership, current_user,
+        {"completed_at": datetime.now(timezone.utc)},
+        forbidden_detail="You can only complete activities you created"
     )
-    activity = result.scalar_one_or_none()
-
-    if activity is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Activity not found"
-        )
-
-    # Only creator or admin can complete
-    if not is_admin_or_owner(membership) and activity.created_by_user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only complete activities you created"
-        )
-
-    activity.completed_at = datetime.now(timezone.utc)
-    activity.updated = datetime.now(timezone.utc)
-    await db.flush()
 
-    return await activity_to_response(activity, db)
+    creator_names = await get_creator_names(db, [activity])
+    return activity_to_response(activity, creator_names)
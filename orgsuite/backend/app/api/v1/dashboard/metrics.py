@@ -3,102 +3,172 @@ Dashboard metrics endpoints for OrgSuite.
 
 Provides CRUD operations for organization metrics and metric values.
 """
-from datetime import date
-from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from typing import Optional, List, Sequence
+import hashlib
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func, insert, update, delete, exists, literal
+from sqlalchemy.orm import aliased, raiseload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.db.base import get_db
+from app.core.cache import TTLCache
 from app.core.deps import get_current_user
-from app.core.permissions import get_membership
+from app.core.permissions import ADMIN_ROLES, resolve_org_access
+from app.core.responses import ORJSONResponse
 from app.models.user import User
-from app.models.organization import Organization
-from app.models.org_membership import OrgMembershipRole
-from app.models.metric import Metric, MetricValueType, MetricFrequency
+from app.models.base import generate_id
+from app.models.metric import Metric
 from app.models.metric_value import MetricValue
 from app.schemas.metric import (
     MetricCreate, MetricUpdate, MetricResponse, MetricListResponse,
     MetricValueCreate, MetricValueResponse, MetricValueListResponse,
-    MetricSetupRequest, MetricSetupResponse, DEFAULT_METRIC_TEMPLATES, MetricTemplate
+    MetricSetupRequest, MetricSetupResponse, DEFAULT_METRIC_TEMPLATES, MetricTemplate,
+    MetricValueType, MetricFrequency
+)
+
+# Metric payloads nest several value records with dates and decimals;
+# render them with orjson rather than the stdlib encoder
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Number of recent values returned with each metric
+RECENT_HISTORY_LIMIT = 5
+
+# MetricValueResponse fields, in schema order, for column-only selects
+_METRIC_VALUE_COLUMNS = (
+    MetricValue.value,
+    MetricValue.effective_date,
+    MetricValue.notes,
+    MetricValue.id,
+    MetricValue.metric_id,
+    MetricValue.created_by_id,
+    MetricValue.created,
+    MetricValue.updated,
+)
+
+# (organization_id, include_archived) -> (etag, rendered JSON body)
+_metric_list_cache = TTLCache(ttl=300.0)
+
+
+# Templates are constant, so serialize them once at import
+_TEMPLATES_JSON = orjson.dumps(
+    [template.model_dump(mode="json") for template in DEFAULT_METRIC_TEMPLATES]
 )
 
-router = APIRouter()
 
+def invalidate_metric_list_cache(organization_id: str) -> None:
+    """Drop cached metric lists for an organization after any metric write."""
+    _metric_list_cache.delete((organization_id, False), (organization_id, True))
 
-async def require_admin(db: AsyncSession, user_id: str, org_id: str, organization: Organization) -> None:
+
+async def require_member(db: AsyncSession, user_id: str, org_id: str) -> None:
+    """Verify user is a member or owner of the organization."""
+    owner_id, role = await resolve_org_access(db, user_id, org_id)
+    if role is None and owner_id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not a member of this organization"
+        )
+
+
+async def require_admin(db: AsyncSession, user_id: str, org_id: str) -> None:
     """Verify user is admin or owner of the organization."""
-    membership = await get_membership(db, user_id, org_id)
+    owner_id, role = await resolve_org_access(db, user_id, org_id)
 
     # Allow org owner even without explicit membership record
-    if organization.owner_id == user_id:
+    if owner_id == user_id:
         return
 
-    if not membership:
+    if role is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not a member of this organization"
         )
 
-    if membership.role not in [OrgMembershipRole.ADMIN, OrgMembershipRole.OWNER]:
+    if role not in ADMIN_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin or owner role required"
         )
 
 
-async def get_org_or_404(db: AsyncSession, org_id: str) -> Organization:
-    """Get organization or raise 404."""
+async def load_recent_values(
+    db: AsyncSession, metrics: Sequence[Metric], limit: int = RECENT_HISTORY_LIMIT
+) -> None:
+    """
+    Populate metric.values with only the `limit` most recent values per metric.
+
+    Uses ROW_NUMBER() partitioned by metric so one query fetches at most
+    `limit` rows per metric instead of the full history.
+    """
+    if not metrics:
+        return
+
+    ranked = select(
+        MetricValue,
+        func.row_number().over(
+            partition_by=MetricValue.metric_id,
+            order_by=MetricValue.effective_date.desc(),
+        ).label("rn"),
+    ).where(
+        MetricValue.metric_id.in_([m.id for m in metrics])
+    ).subquery()
+    recent = aliased(MetricValue, ranked)
+
     result = await db.execute(
-        select(Organization).where(Organization.id == org_id)
+        select(recent)
+        .where(ranked.c.rn <= limit)
+        .order_by(ranked.c.metric_id, ranked.c.rn)
     )
-    org = result.scalar_one_or_none()
-    if not org:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Organization not found"
-        )
-    return org
-
-
-def build_metric_response(metric: Metric, limit_history: int = 5) -> MetricResponse:
-    """Build MetricResponse from a Metric model with values loaded."""
-    latest_val = None
-    recent_hist = []
-
-    if metric.values:
-        latest_val = MetricValueResponse(
-            id=metric.values[0].id,
-            metric_id=metric.values[0].metric_id,
-            value=metric.values[0].value,
-            effective_date=metric.values[0].effective_date,
-            notes=metric.values[0].notes,
-            created_by_id=metric.values[0].created_by_id,
-            created=metric.values[0].created,
-            updated=metric.values[0].updated
-        )
-        recent_hist = [
-            MetricValueResponse(
-                id=v.id,
-                metric_id=v.metric_id,
-                value=v.value,
-                effective_date=v.effective_date,
-                notes=v.notes,
-                created_by_id=v.created_by_id,
-                created=v.created,
-                updated=v.updated
-            )
-            for v in metric.values[:limit_history]
-        ]
+    values_by_metric = defaultdict(list)
+    for value in result.scalars():
+        values_by_metric[value.metric_id].append(value)
+
+    for metric in metrics:
+        set_committed_value(metric, "values", values_by_metric.get(metric.id, []))
+
+
+def metric_value_to_response(value: MetricValue) -> MetricValueResponse:
+    """Build MetricValueResponse from a MetricValue without re-validation."""
+    return MetricValueResponse.model_construct(
+        id=value.id,
+        metric_id=value.metric_id,
+        value=value.value,
+        effective_date=value.effective_date,
+        notes=value.notes,
+        created_by_id=value.created_by_id,
+        created=value.created,
+        updated=value.updated
+    )
+
 
-    return MetricResponse(
+def build_metric_response(
+    metric: Metric,
+    limit_history: int = RECENT_HISTORY_LIMIT,
+    values: Optional[Sequence[MetricValue]] = None,
+) -> MetricResponse:
+    """
+    Build MetricResponse from a Metric model with recent values loaded.
+
+    Pass `values` to use them instead of `metric.values` (e.g. an empty
+    tuple for freshly inserted metrics). Uses model_construct since every
+    field comes straight from the database.
+    """
+    if values is None:
+        values = metric.values
+    recent_hist = [metric_value_to_response(v) for v in values[:limit_history]]
+
+    return MetricResponse.model_construct(
         id=metric.id,
         organization_id=metric.organization_id,
         name=metric.name,
         description=metric.description,
-        value_type=metric.value_type,
-        frequency=metric.frequency,
+        # ORM and schema enums are distinct classes with the same values
+        value_type=MetricValueType(metric.value_type),
+        frequency=MetricFrequency(metric.frequency),
         currency=metric.currency,
         is_automatic=metric.is_automatic,
         auto_source=metric.auto_source,
@@ -109,7 +179,7 @@ def build_metric_response(metric: Metric, limit_history: int = 5) -> MetricRespo
         updated_by_id=metric.updated_by_id,
         created=metric.created,
         updated=metric.updated,
-        latest_value=latest_val,
+        latest_value=recent_hist[0] if recent_hist else None,
         recent_history=recent_hist
     )
 
@@ -120,6 +190,7 @@ def build_metric_response(metric: Metric, limit_history: int = 5) -> MetricRespo
 
 @router.get("/metrics", response_model=MetricListResponse)
 async def list_metrics(
+    request: Request,
     organization_id: str = Query(..., description="Organization ID"),
     include_archived: bool = Query(False, description="Include archived metrics"),
     db: AsyncSession = Depends(get_db),
@@ -129,44 +200,45 @@ async def list_metrics(
     List all metrics for an organization.
 
     Returns metrics with their latest values and recent history.
-    Requires org membership.
+    Requires org membership. The response carries an ETag derived from
+    its body; a matching If-None-Match gets 304 Not Modified.
     """
-    org = await get_org_or_404(db, organization_id)
-
-    # Check user membership
-    membership = await get_membership(db, current_user.id, organization_id)
-    if not membership and org.owner_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not a member of this organization"
-        )
-
-    # Build query
-    query = select(Metric).where(
-        Metric.organization_id == organization_id
-    ).options(
-        selectinload(Metric.values)
-    ).order_by(Metric.sort_order, Metric.name)
+    await require_member(db, current_user.id, organization_id)
+
+    cache_key = (organization_id, include_archived)
+    cached = _metric_list_cache.get(cache_key)
+    if cached is None:
+        # Build query
+        # Values are attached by load_recent_values; any other relationship
+        # access in the response builder must fail instead of lazy-loading
+        query = select(Metric).where(
+            Metric.organization_id == organization_id
+        ).options(
+            raiseload("*", sql_only=True)
+        ).order_by(Metric.sort_order, Metric.name)
 
-    if not include_archived:
-        query = query.where(Metric.is_archived == False)
+        if not include_archived:
+            query = query.where(Metric.is_archived == False)
 
-    result = await db.execute(query)
-    metrics = result.scalars().all()
+        result = await db.execute(query)
+        metrics = result.scalars().all()
+        await load_recent_values(db, metrics)
 
-    # Get total count
-    count_query = select(func.count(Metric.id)).where(
-        Metric.organization_id == organization_id
-    )
-    if not include_archived:
-        count_query = count_query.where(Metric.is_archived == False)
-    count_result = await db.execute(count_query)
-    total = count_result.scalar() or 0
+        # The list is unpaginated, so the total is simply the number of rows
+        response = MetricListResponse.model_construct(
+            items=[build_metric_response(m) for m in metrics],
+            total=len(metrics)
+        )
+        body = ORJSONResponse(response).body
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        cached = (etag, body)
+        _metric_list_cache.set(cache_key, cached)
 
-    return MetricListResponse(
-        items=[build_metric_response(m) for m in metrics],
-        total=total
-    )
+    etag, body = cached
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.post("/metrics", response_model=MetricResponse, status_code=status.HTTP_201_CREATED)
@@ -180,8 +252,7 @@ async def create_metric(
 
     Requires admin or owner role.
     """
-    org = await get_org_or_404(db, data.organization_id)
-    await require_admin(db, current_user.id, data.organization_id, org)
+    await require_admin(db, current_user.id, data.organization_id)
 
     # Get next sort order
     max_order_query = select(func.coalesce(func.max(Metric.sort_order), 0)).where(
@@ -207,11 +278,21 @@ async def create_metric(
 
     db.add(metric)
     await db.commit()
+    invalidate_metric_list_cache(data.organization_id)
     await db.refresh(metric, ["values"])
 
     return build_metric_response(metric)
 
 
+# Declared before /metrics/{metric_id} so "templates" is not taken as an ID
+@router.get("/metrics/templates", response_model=List[MetricTemplate])
+async def get_metric_templates(
+    current_user: User = Depends(get_current_user)
+):
+    """Get suggested metric templates for setup wizard."""
+    return Response(content=_TEMPLATES_JSON, media_type="application/json")
+
+
 @router.get("/metrics/{metric_id}", response_model=MetricResponse)
 async def get_metric(
     metric_id: str,
@@ -220,21 +301,13 @@ async def get_metric(
     current_user: User = Depends(get_current_user)
 ):
     """Get a single metric by ID."""
-    org = await get_org_or_404(db, organization_id)
-
-    # Check user membership
-    membership = await get_membership(db, current_user.id, organization_id)
-    if not membership and org.owner_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not a member of this organization"
-        )
+    await require_member(db, current_user.id, organization_id)
 
     result = await db.execute(
         select(Metric).where(
             Metric.id == metric_id,
             Metric.organization_id == organization_id
-        ).options(selectinload(Metric.values))
+        )
     )
     metric = result.scalar_one_or_none()
 
@@ -244,7 +317,8 @@ async def get_metric(
             detail="Metric not found"
         )
 
-    return build_metric_response(metric)
+    await load_recent_values(db, [metric])
+    return ORJSONResponse(build_metric_response(metric))
 
 
 @router.put("/metrics/{metric_id}", response_model=MetricResponse)
@@ -260,16 +334,20 @@ async def update_metric(
 
     Requires admin or owner role.
     """
-    org = await get_org_or_404(db, organization_id)
-    await require_admin(db, current_user.id, organization_id, org)
+    await require_admin(db, current_user.id, organization_id)
 
-    result = await db.execute(
-        select(Metric).where(
+    # Single UPDATE ... RETURNING; `updated` is set by TimestampMixin's onupdate
+    update_data = data.model_dump(exclude_unset=True)
+    metric = await db.scalar(
+        update(Metric)
+        .where(
             Metric.id == metric_id,
             Metric.organization_id == organization_id
-        ).options(selectinload(Metric.values))
+        )
+        .values(**update_data, updated_by_id=current_user.id)
+        .returning(Metric),
+        execution_options={"populate_existing": True}
     )
-    metric = result.scalar_one_or_none()
 
     if not metric:
         raise HTTPException(
@@ -277,14 +355,9 @@ async def update_metric(
             detail="Metric not found"
         )
 
-    # Update fields
-    update_data = data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(metric, field, value)
-    metric.updated_by_id = current_user.id
-
     await db.commit()
-    await db.refresh(metric, ["values"])
+    invalidate_metric_list_cache(organization_id)
+    await load_recent_values(db, [metric])
 
     return build_metric_response(metric)
 
@@ -301,25 +374,26 @@ async def delete_metric(
 
     Requires admin or owner role.
     """
-    org = await get_org_or_404(db, organization_id)
-    await require_admin(db, current_user.id, organization_id, org)
+    await require_admin(db, current_user.id, organization_id)
 
-    result = await db.execute(
-        select(Metric).where(
+    # Values are removed by the metric_values.metric_id ON DELETE CASCADE
+    deleted_id = await db.scalar(
+        delete(Metric)
+        .where(
             Metric.id == metric_id,
             Metric.organization_id == organization_id
         )
+        .returning(Metric.id)
     )
-    metric = result.scalar_one_or_none()
 
-    if not metric:
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Metric not found"
         )
 
-    await db.delete(metric)
     await db.commit()
+    invalidate_metric_list_cache(organization_id)
 
 
 # ============================================================================
@@ -335,15 +409,7 @@ async def list_metric_values(
     current_user: User = Depends(get_current_user)
 ):
     """List all values for a metric (history)."""
-    org = await get_org_or_404(db, organization_id)
-
-    # Check user membership
-    membership = await get_membership(db, current_user.id, organization_id)
-    if not membership and org.owner_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not a member of this organization"
-        )
+    await require_member(db, current_user.id, organization_id)
 
     # Verify metric exists and belongs to org
     metric_result = await db.execute(
@@ -359,13 +425,13 @@ async def list_metric_values(
             detail="Metric not found"
         )
 
-    # Get values
+    # Get values as plain row mappings; no ORM objects are needed here
     values_result = await db.execute(
-        select(MetricValue).where(
+        select(*_METRIC_VALUE_COLUMNS).where(
             MetricValue.metric_id == metric_id
         ).order_by(MetricValue.effective_date.desc()).limit(limit)
     )
-    values = values_result.scalars().all()
+    items = [dict(row) for row in values_result.mappings()]
 
     # Get total count
     count_result = await db.execute(
@@ -373,22 +439,7 @@ async def list_metric_values(
     )
     total = count_result.scalar() or 0
 
-    return MetricValueListResponse(
-        items=[
-            MetricValueResponse(
-                id=v.id,
-                metric_id=v.metric_id,
-                value=v.value,
-                effective_date=v.effective_date,
-                notes=v.notes,
-                created_by_id=v.created_by_id,
-                created=v.created,
-                updated=v.updated
-            )
-            for v in values
-        ],
-        total=total
-    )
+    return ORJSONResponse({"items": items, "total": total})
 
 
 @router.post("/metrics/{metric_id}/values", response_model=MetricValueResponse, status_code=status.HTTP_201_CREATED)
@@ -404,59 +455,52 @@ async def add_metric_value(
 
     Requires admin or owner role.
     """
-    org = await get_org_or_404(db, organization_id)
-    await require_admin(db, current_user.id, organization_id, org)
-
-    # Verify metric exists and belongs to org
-    metric_result = await db.execute(
-        select(Metric).where(
-            Metric.id == metric_id,
-            Metric.organization_id == organization_id
+    await require_admin(db, current_user.id, organization_id)
+
+    # INSERT ... SELECT only inserts when the metric belongs to the org, so
+    # the ownership check and the insert share one round-trip. Column
+    # defaults are not applied to INSERT ... SELECT, so they are bound here.
+    now = datetime.now(timezone.utc)
+    row = {
+        "id": generate_id(),
+        "metric_id": metric_id,
+        "value": data.value,
+        "effective_date": data.effective_date or date.today(),
+        "notes": data.notes,
+        "created_by_id": current_user.id,
+        "created": now,
+        "updated": now,
+    }
+    columns = MetricValue.__table__.c
+    value = await db.scalar(
+        insert(MetricValue)
+        .from_select(
+            list(row),
+            select(*[literal(v, columns[k].type) for k, v in row.items()]).where(
+                exists().where(
+                    Metric.id == metric_id,
+                    Metric.organization_id == organization_id
+                )
+            )
         )
+        .returning(MetricValue)
     )
-    metric = metric_result.scalar_one_or_none()
-    if not metric:
+    if value is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Metric not found"
         )
 
-    value = MetricValue(
-        metric_id=metric_id,
-        value=data.value,
-        effective_date=data.effective_date or date.today(),
-        notes=data.notes,
-        created_by_id=current_user.id
-    )
-
-    db.add(value)
     await db.commit()
-    await db.refresh(value)
+    invalidate_metric_list_cache(organization_id)
 
-    return MetricValueResponse(
-        id=value.id,
-        metric_id=value.metric_id,
-        value=value.value,
-        effective_date=value.effective_date,
-        notes=value.notes,
-        created_by_id=value.created_by_id,
-        created=value.created,
-        updated=value.updated
-    )
+    return metric_value_to_response(value)
 
 
 # ============================================================================
 # SETUP / WIZARD ENDPOINTS
 # ============================================================================
 
-@router.get("/metrics/templates", response_model=List[MetricTemplate])
-async def get_metric_templates(
-    current_user: User = Depends(get_current_user)
-):
-    """Get suggested metric templates for setup wizard."""
-    return DEFAULT_METRIC_TEMPLATES
-
-
 @router.post("/metrics/setup", response_model=MetricSetupResponse)
 async def setup_metrics(
     data: MetricSetupRequest,
@@ -468,35 +512,40 @@ async def setup_metrics(
 
     Requires admin or owner role.
     """
-    org = await get_org_or_404(db, data.organization_id)
-    await require_admin(db, current_user.id, data.organization_id, org)
+    await require_admin(db, current_user.id, data.organization_id)
+
+    rows = [
+        {
+            "organization_id": data.organization_id,
+            "name": metric_data.name,
+            "description": metric_data.description,
+            "value_type": metric_data.value_type,
+            "frequency": metric_data.frequency,
+            "currency": metric_data.currency,
+            "is_automatic": metric_data.is_automatic,
+            "auto_source": metric_data.auto_source,
+            "target_value": metric_data.target_value,
+            "sort_order": i + 1,
+            "created_by_id": current_user.id,
+            "updated_by_id": current_user.id,
+        }
+        for i, metric_data in enumerate(data.metrics)
+    ]
 
     created_metrics = []
-    for i, metric_data in enumerate(data.metrics):
-        metric = Metric(
-            organization_id=data.organization_id,
-            name=metric_data.name,
-            description=metric_data.description,
-            value_type=metric_data.value_type,
-            frequency=metric_data.frequency,
-            currency=metric_data.currency,
-            is_automatic=metric_data.is_automatic,
-            auto_source=metric_data.auto_source,
-            target_value=metric_data.target_value,
-            sort_order=i + 1,
-            created_by_id=current_user.id,
-            updated_by_id=current_user.id
+    if rows:
+        # Single batched INSERT ... RETURNING instead of a refresh per metric
+        result = await db.scalars(
+            insert(Metric).returning(Metric, sort_by_parameter_order=True),
+            rows,
         )
-        db.add(metric)
-        created_metrics.append(metric)
+        created_metrics = result.all()
 
     await db.commit()
+    invalidate_metric_list_cache(data.organization_id)
 
-    # Refresh all metrics
-    for metric in created_metrics:
-        await db.refresh(metric, ["values"])
-
-    return MetricSetupResponse(
+    # New metrics have no values yet, so there is no history to load
+    return ORJSONResponse(MetricSetupResponse.model_construct(
         metrics_created=len(created_metrics),
-        metrics=[build_metric_response(m) for m in created_metrics]
-    )
+        metrics=[build_metric_response(m, values=()) for m in created_metrics]
+    ))
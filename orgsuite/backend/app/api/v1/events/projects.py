@@ -15,14 +15,16 @@ Permissions:
 """
 from datetime import datetime, timezone
 from typing import Optional
-from math import ceil
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
+from sqlalchemy.orm import raiseload
 
 from app.db.base import get_db
+from app.core.cache import TTLCache
 from app.core.deps import get_current_user
 from app.core.permissions import require_min_role, OrgMembershipRole
+from app.core.responses import ORJSONResponse
 from app.models.user import User
 from app.models.project import Project, ProjectStatus
 from app.schemas.project import (
@@ -31,10 +33,24 @@ from app.schemas.project import (
 
 router = APIRouter()
 
+# (organization_id, status filter or None) -> total project count
+_project_count_cache = TTLCache(ttl=60.0)
+
+# Bumped on every invalidation. A total counted before an invalidation is not
+# cached, as it may predate the committed write.
+_project_count_generation = 0
+
+
+def invalidate_project_count_cache(organization_id: str) -> None:
+    """Drop cached project totals for an organization after a write commits."""
+    global _project_count_generation
+    _project_count_generation += 1
+    _project_count_cache.delete_where(lambda key: key[0] == organization_id)
+
 
 def project_to_response(project: Project) -> ProjectResponse:
-    """Convert Project model to response schema."""
-    return ProjectResponse(
+    """Convert Project model to response schema without re-validation."""
+    return ProjectResponse.model_construct(
         id=project.id,
         organization_id=project.organization_id,
         name=project.name,
@@ -62,35 +78,54 @@ async def list_projects(
     # Role check: viewer can list
     await require_min_role(db, current_user.id, organization_id, OrgMembershipRole.VIEWER)
 
-    query = select(Project).where(Project.organization_id == organization_id)
+    filters = [Project.organization_id == organization_id]
+    status_key = None
 
     if status:
         try:
             status_enum = ProjectStatus(status)
-            query = query.where(Project.status == status_enum)
+            filters.append(Project.status == status_enum)
+            status_key = status_enum
         except ValueError:
             pass  # Ignore invalid status filter
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_items = (await db.execute(count_query)).scalar() or 0
-
-    # Order by created desc
-    query = query.order_by(Project.created.desc())
+    # project_to_response reads columns only; fail loudly on lazy loads
+    page_query = (
+        select(Project)
+        .options(raiseload("*", sql_only=True))
+        .where(*filters)
+        .order_by(Project.created.desc())
+        .offset((page - 1) * perPage)
+        .limit(perPage)
+    )
 
-    # Pagination
-    query = query.offset((page - 1) * perPage).limit(perPage)
-    result = await db.execute(query)
-    projects = result.scalars().all()
+    cache_key = (organization_id, status_key)
+    total_items = _project_count_cache.get(cache_key)
+    if total_items is not None:
+        # Known total: only the requested page needs to be read
+        projects = (await db.scalars(page_query)).all()
+    else:
+        generation = _project_count_generation
+        # The window count is evaluated before OFFSET/LIMIT, so every row
+        # carries the total of the filtered set
+        rows = (await db.execute(page_query.add_columns(func.count().over().label("total")))).all()
+        projects = [row.Project for row in rows]
+        if rows:
+            total_items = rows[0].total
+        else:
+            # Empty page: no rows to read the total from
+            total_items = await db.scalar(select(func.count(Project.id)).where(*filters)) or 0
+        if _project_count_generation == generation:
+            _project_count_cache.set(cache_key, total_items)
 
     items = [project_to_response(p) for p in projects]
-    return ProjectListResponse(
+    return ORJSONResponse(ProjectListResponse.model_construct(
         page=page,
         perPage=perPage,
         totalItems=total_items,
-        totalPages=ceil(total_items / perPage) if total_items > 0 else 1,
+        totalPages=(total_items + perPage - 1) // perPage if total_items > 0 else 1,
         items=items
-    )
+    ))
 
 
 @router.post("", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
@@ -125,7 +160,8 @@ async def create_project(
     )
 
     db.add(project)
-    await db.flush()
+    await db.commit()
+    invalidate_project_count_cache(organization_id)
     await db.refresh(project)
 
     return project_to_response(project)
@@ -156,7 +192,7 @@ async def get_project(
             detail="Project not found"
         )
 
-    return project_to_response(project)
+    return ORJSONResponse(project_to_response(project))
 
 
 @router.patch("/{project_id}", response_model=ProjectResponse)
@@ -206,7 +242,9 @@ async def update_project(
         project.committee_id = project_data.committee_id
 
     project.updated = datetime.now(timezone.utc)
-    await db.flush()
+    await db.commit()
+    if project_data.status is not None:
+        invalidate_project_count_cache(organization_id)
 
     return project_to_response(project)
 
@@ -237,6 +275,7 @@ async def delete_project(
         )
 
     await db.delete(project)
-    await db.flush()
+    await db.commit()
+    invalidate_project_count_cache(organization_id)
 
     return None
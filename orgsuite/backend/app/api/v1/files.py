@@ -9,7 +9,8 @@ Endpoints:
 - DELETE /api/collections/files/records/{file_id} - Delete file
 
 Storage:
-- Files are stored in UPLOAD_DIR/{org_id}/files/
+- Files are stored in UPLOAD_DIR/{org_id}/files/{id[:2]}/{id[2:4]}/
+  so no single directory grows past 256 subdirectories
 - Naming: {uuid15}_{original_filename}
 - Max file size: configurable via settings.MAX_UPLOAD_SIZE
 
@@ -18,38 +19,77 @@ Permissions:
 - Download: requires 'member' role in organization
 - Delete: requires 'admin' role in organization
 """
+import mimetypes
 import os
 import uuid
+from urllib.parse import quote
+import aiofiles
+import aiofiles.os
 from datetime import datetime, timezone
 from typing import Optional
 from math import ceil
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File as UploadFileField, Form
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response, UploadFile, File as UploadFileField, Form
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
 from app.db.base import get_db
 from app.core.deps import get_current_user, get_current_user_optional
+from app.core.filters import parse_pocketbase_filter
 from app.core.config import settings
 from app.models.user import User
 from app.models.file import File as FileModel, FileType
 from app.schemas.file import FileCreate, FileUpdate, FileResponse as FileSchema
 from app.core.permissions import require_min_role, OrgMembershipRole
+from app.core.responses import ZeroCopyFileResponse
 from app.models.meeting import Meeting
 from app.models.committee import Committee
 from app.schemas.common import PaginatedResponse
 
 router = APIRouter()
 
+# PocketBase filter fields supported by list_files
+_FILE_FILTER_FIELDS = {
+    "organization": FileModel.organization_id,
+    "meeting": FileModel.meeting_id,
+}
 
-def ensure_upload_dir(org_id: str):
-    org_dir = os.path.join(settings.UPLOAD_DIR, org_id, "files")
-    os.makedirs(org_dir, exist_ok=True)
-    return org_dir
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+
+async def ensure_upload_dir(org_id: str, file_id: str):
+    """Create and return the hashed bucket directory for a new file."""
+    bucket_dir = os.path.join(settings.UPLOAD_DIR, org_id, "files", file_id[:2], file_id[2:4])
+    await aiofiles.os.makedirs(bucket_dir, exist_ok=True)
+    return bucket_dir
+
+
+async def _remove_quietly(path: str) -> None:
+    try:
+        await aiofiles.os.remove(path)
+    except OSError:
+        pass
+
+
+def accel_redirect_response(rel_path: str, filename: str) -> Response:
+    """Let nginx serve a stored file from its internal uploads location."""
+    quoted_name = quote(filename)
+    if quoted_name != filename:
+        disposition = f"attachment; filename*=utf-8''{quoted_name}"
+    else:
+        disposition = f'attachment; filename="{filename}"'
+    return Response(
+        headers={
+            "X-Accel-Redirect": settings.X_ACCEL_REDIRECT_PREFIX.rstrip("/") + "/" + quote(rel_path),
+            "Content-Disposition": disposition,
+        },
+        media_type=mimetypes.guess_type(filename)[0] or "application/octet-stream",
+    )
 
 
 def file_to_response(f: FileModel) -> FileSchema:
-    return FileSchema(
+    """Convert a File row to FileSchema without re-validation (fields come from the DB)."""
+    return FileSchema.model_construct(
         id=f.id,
         name=f.name,
         description=f.description,
@@ -77,19 +117,15 @@ async def list_files(
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """List files with optional filtering and pagination."""
-    query = select(FileModel)
-
-    if filter:
-        # Simple filters organization='xyz' meeting='abc'
-        if "organization=" in filter:
-            org_id = filter.split("organization=")[1].split("'")[1] if "'" in filter else filter.split("organization=")[1].split()[0]
-            query = query.where(FileModel.organization_id == org_id)
-        if "meeting=" in filter:
-            meeting_id = filter.split("meeting=")[1].split("'")[1] if "'" in filter else filter.split("meeting=")[1].split()[0]
-            query = query.where(FileModel.meeting_id == meeting_id)
+    filters = [
+        _FILE_FILTER_FIELDS[field] == value
+        for field, value in parse_pocketbase_filter(filter).items()
+        if field in _FILE_FILTER_FIELDS
+    ]
 
-    count_query = select(func.count()).select_from(query.subquery())
-    total_items = (await db.execute(count_query)).scalar() or 0
+    # The window count is evaluated before OFFSET/LIMIT, so every row carries
+    # the filtered total and the page and count come back in one round trip
+    query = select(FileModel, func.count().over().label("total")).where(*filters)
 
     if sort:
         if sort.startswith("-"):
@@ -103,8 +139,13 @@ async def list_files(
         query = query.order_by(FileModel.created.desc())
 
     query = query.offset((page - 1) * perPage).limit(perPage)
-    result = await db.execute(query)
-    files = result.scalars().all()
+    rows = (await db.execute(query)).all()
+    files = [row.File for row in rows]
+    if rows:
+        total_items = rows[0].total
+    else:
+        # Empty page: no rows to read the total from
+        total_items = await db.scalar(select(func.count()).select_from(FileModel).where(*filters)) or 0
 
     items = [file_to_response(f) for f in files]
     return PaginatedResponse(
@@ -132,22 +173,35 @@ async def upload_file(
     """Upload a file. Requires member role in the organization."""
     # Role enforcement: require member to upload into organization
     await require_min_role(db, current_user.id, organization, OrgMembershipRole.MEMBER)
-    org_dir = ensure_upload_dir(organization)
 
     original_name = upload.filename or "uploaded_file"
     final_name = name or original_name
 
     file_id = uuid.uuid4().hex[:15]
+    bucket_dir = await ensure_upload_dir(organization, file_id)
     stored_filename = f"{file_id}_{original_name}"
-    stored_path = os.path.join(org_dir, stored_filename)
+    stored_path = os.path.join(bucket_dir, stored_filename)
 
-    content = await upload.read()
+    # Stream to disk in chunks so memory stays O(chunk) regardless of file size
+    file_size = 0
     try:
-        with open(stored_path, "wb") as f:
-            f.write(content)
+        async with aiofiles.open(stored_path, "wb") as f:
+            while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+                file_size += len(chunk)
+                if file_size > settings.MAX_UPLOAD_SIZE:
+                    break
+                await f.write(chunk)
     except OSError as e:
+        await _remove_quietly(stored_path)
         raise HTTPException(status_code=500, detail=f"Failed to store file: {e}")
 
+    if file_size > settings.MAX_UPLOAD_SIZE:
+        await _remove_quietly(stored_path)
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File exceeds maximum size of {settings.MAX_UPLOAD_SIZE} bytes"
+        )
+
     file_type_enum = None
     if file_type:
         try:
@@ -156,6 +210,7 @@ async def upload_file(
             file_type_enum = None
 
     rel_path = os.path.relpath(stored_path, settings.UPLOAD_DIR)
+    now = datetime.now(timezone.utc)
     file_model = FileModel(
         id=file_id,
         file=rel_path,
@@ -166,10 +221,10 @@ async def upload_file(
         name=final_name,
         description=description,
         file_type=file_type_enum,
-        file_size=len(content),
+        file_size=file_size,
         uploaded_by_id=current_user.id,
-        created=datetime.now(timezone.utc),
-        updated=datetime.now(timezone.utc),
+        created=now,
+        updated=now,
     )
     db.add(file_model)
     await db.flush()
@@ -205,12 +260,7 @@ async def delete_file(
     if f.organization_id:
         await require_min_role(db, current_user.id, f.organization_id, OrgMembershipRole.ADMIN)
 
-    abs_path = os.path.join(settings.UPLOAD_DIR, f.file)
-    try:
-        if os.path.exists(abs_path):
-            os.remove(abs_path)
-    except OSError:
-        pass
+    await _remove_quietly(os.path.join(settings.UPLOAD_DIR, f.file))
 
     await db.delete(f)
     await db.flush()
@@ -233,7 +283,13 @@ async def download_file(
             await require_min_role(db, current_user.id, f.organization_id, OrgMembershipRole.MEMBER)
         except HTTPException:
             raise HTTPException(status_code=403, detail="Insufficient role to download file")
+    if settings.X_ACCEL_REDIRECT_PREFIX:
+        # nginx opens the file itself and answers 404 if it is missing
+        return accel_redirect_response(f.file, f.name)
     abs_path = os.path.join(settings.UPLOAD_DIR, f.file)
-    if not os.path.exists(abs_path):
+    try:
+        # One stat both checks existence and feeds the response headers
+        stat_result = await aiofiles.os.stat(abs_path)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Stored file missing")
-    return FileResponse(abs_path, filename=f.name)
+    return ZeroCopyFileResponse(abs_path, filename=f.name, stat_result=stat_result)
@@ -10,9 +10,10 @@ from sqlalchemy import select, func
 
 from app.db.base import get_db
 from app.core.deps import get_current_user
+from app.core.permissions import ADMIN_ROLES
 from app.models.user import User
 from app.models.account import Account, AccountType, AccountSubType
-from app.models.org_membership import OrgMembership, OrgMembershipRole
+from app.models.org_membership import OrgMembership
 from app.schemas.account import (
     AccountCreate, AccountUpdate, AccountResponse, AccountListResponse
 )
@@ -46,20 +47,19 @@ async def check_org_access(
     require_admin: bool = False
 ) -> bool:
     """Check if user has access to the organization."""
-    result = await db.execute(
-        select(OrgMembership).where(
+    role = await db.scalar(
+        select(OrgMembership.role).where(
             OrgMembership.organization_id == org_id,
             OrgMembership.user_id == user.id,
             OrgMembership.is_active == True
         )
     )
-    membership = result.scalar_one_or_none()
 
-    if membership is None:
+    if role is None:
         return False
 
     if require_admin:
-        return membership.role in [OrgMembershipRole.OWNER, OrgMembershipRole.ADMIN]
+        return role in ADMIN_ROLES
 
     return True
 
@@ -15,11 +15,12 @@ from sqlalchemy import select, func
 
 from app.db.base import get_db
 from app.core.deps import get_current_user
+from app.core.permissions import ADMIN_ROLES
 from app.models.user import User
 from app.models.donation import Donation, DonationStatus, PaymentMethod
 from app.models.member import Member
 from app.models.contact import Contact
-from app.models.org_membership import OrgMembership, OrgMembershipRole
+from app.models.org_membership import OrgMembership
 from app.schemas.donation import (
     DonationCreate, DonationUpdate, DonationResponse,
     DonationListResponse, DonationSummary, DonorInfo
@@ -88,20 +89,19 @@ async def check_org_access(
     require_admin: bool = False
 ) -> bool:
     """Check if user has access to the organization."""
-    result = await db.execute(
-        select(OrgMembership).where(
+    role = await db.scalar(
+        select(OrgMembership.role).where(
             OrgMembership.organization_id == org_id,
             OrgMembership.user_id == user.id,
             OrgMembership.is_active == True
         )
     )
-    membership = result.scalar_one_or_none()
 
-    if membership is None:
+    if role is None:
         return False
 
     if require_admin:
-        return membership.role in [OrgMembershipRole.OWNER, OrgMembershipRole.ADMIN]
+        return role in ADMIN_ROLES
 
     return True
 
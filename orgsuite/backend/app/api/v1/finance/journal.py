@@ -1,17 +1,23 @@
 """
 Journal Entry endpoints for OrgSuite Finance module.
 """
+import asyncio
+from collections import defaultdict
 from datetime import datetime, timezone, date
 from typing import Optional
 from decimal import Decimal
 from math import ceil
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, insert, and_
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.selectable import ScalarSelect
 
 from app.db.base import get_db
 from app.core.deps import get_current_user
+from app.core.permissions import ADMIN_ROLES
 from app.models.user import User
 from app.models.account import Account
 from app.models.journal_entry import JournalEntry, JournalEntryStatus
@@ -27,8 +33,8 @@ router = APIRouter()
 
 
 def journal_line_to_response(line: JournalLine) -> JournalLineResponse:
-    """Convert JournalLine model to JournalLineResponse schema."""
-    return JournalLineResponse(
+    """Convert JournalLine model to JournalLineResponse schema without re-validation."""
+    return JournalLineResponse.model_construct(
         id=line.id,
         journal_entry_id=line.journal_entry_id,
         line_number=line.line_number,
@@ -46,20 +52,30 @@ def journal_line_to_response(line: JournalLine) -> JournalLineResponse:
     )
 
 
-def journal_entry_to_response(entry: JournalEntry, lines_list: list = None) -> JournalEntryResponse:
-    """Convert JournalEntry model to JournalEntryResponse schema.
+def journal_entry_to_response(
+    entry: JournalEntry,
+    lines_list: list = None,
+    totals: Optional[tuple[Decimal, Decimal]] = None
+) -> JournalEntryResponse:
+    """Convert JournalEntry model to JournalEntryResponse schema without re-validation.
+
+    Fields come from trusted DB rows, so Pydantic validation is skipped.
 
     Args:
         entry: The journal entry model
         lines_list: Optional pre-loaded list of lines to avoid lazy loading in async context
+        totals: Optional (total_debits, total_credits) already aggregated in SQL
     """
     # Use provided lines_list or try to access entry.lines (if eagerly loaded)
     entry_lines = lines_list if lines_list is not None else (entry.lines if hasattr(entry, '_sa_instance_state') and 'lines' in entry.__dict__ else [])
     lines = [journal_line_to_response(line) for line in entry_lines] if entry_lines else []
-    total_debits = sum(line.debit or Decimal(0) for line in entry_lines) if entry_lines else Decimal(0)
-    total_credits = sum(line.credit or Decimal(0) for line in entry_lines) if entry_lines else Decimal(0)
+    if totals is not None:
+        total_debits, total_credits = totals
+    else:
+        total_debits = sum(line.debit or Decimal(0) for line in entry_lines) if entry_lines else Decimal(0)
+        total_credits = sum(line.credit or Decimal(0) for line in entry_lines) if entry_lines else Decimal(0)
 
-    return JournalEntryResponse(
+    return JournalEntryResponse.model_construct(
         id=entry.id,
         organization_id=entry.organization_id,
         entry_number=entry.entry_number,
@@ -84,40 +100,143 @@ def journal_entry_to_response(entry: JournalEntry, lines_list: list = None) -> J
     )
 
 
-async def check_org_access(
-    org_id: str,
-    user: User,
-    db: AsyncSession,
-    require_admin: bool = False
-) -> bool:
-    """Check if user has access to the organization."""
-    result = await db.execute(
-        select(OrgMembership).where(
-            OrgMembership.organization_id == org_id,
-            OrgMembership.user_id == user.id,
-            OrgMembership.is_active == True
-        )
+def _line_total(column) -> ScalarSelect:
+    """Correlated SUM of a journal line amount column for the enclosing entry."""
+    return (
+        select(func.coalesce(func.sum(column), 0))
+        .where(JournalLine.journal_entry_id == JournalEntry.id)
+        .correlate(JournalEntry)
+        .scalar_subquery()
     )
-    membership = result.scalar_one_or_none()
 
-    if membership is None:
+
+async def get_org_role(
+    request: Request,
+    organization_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+) -> Optional[OrgMembershipRole]:
+    """
+    Get the current user's active role in the organization, or None.
+
+    Memoized on request.state so the membership is read at most once per
+    request, however many times the role is needed.
+    """
+    org_roles = getattr(request.state, "org_roles", None)
+    if org_roles is None:
+        org_roles = request.state.org_roles = {}
+
+    key = (current_user.id, organization_id)
+    if key not in org_roles:
+        org_roles[key] = await db.scalar(
+            select(OrgMembership.role).where(
+                OrgMembership.organization_id == organization_id,
+                OrgMembership.user_id == current_user.id,
+                OrgMembership.is_active == True
+            )
+        )
+    return org_roles[key]
+
+
+def check_org_access(role: Optional[OrgMembershipRole], require_admin: bool = False) -> bool:
+    """Check if a role grants access to the organization."""
+    if role is None:
         return False
 
     if require_admin:
-        return membership.role in [OrgMembershipRole.OWNER, OrgMembershipRole.ADMIN]
+        return role in ADMIN_ROLES
 
     return True
 
 
-async def generate_entry_number(org_id: str, db: AsyncSession) -> str:
-    """Generate a sequential entry number for the organization."""
-    result = await db.execute(
-        select(func.count()).select_from(JournalEntry).where(
-            JournalEntry.organization_id == org_id
+async def fetch_entry_with_role(
+    db: AsyncSession,
+    organization_id: str,
+    entry_id: str,
+    user_id: str,
+    *columns,
+    load_lines: bool = True
+) -> Optional[Row]:
+    """
+    Fetch the user's active role and a journal entry in a single query.
+
+    The membership is the driving table with the entry outer-joined, so the
+    result is None when the user is not an active member, and otherwise a
+    row whose JournalEntry is None if the entry is not in the organization.
+    Extra `columns` (e.g. line totals) are appended to the row.
+    """
+    query = (
+        select(OrgMembership.role, JournalEntry, *columns)
+        .select_from(OrgMembership)
+        .outerjoin(
+            JournalEntry,
+            and_(
+                JournalEntry.id == entry_id,
+                JournalEntry.organization_id == OrgMembership.organization_id
+            )
+        )
+        .where(
+            OrgMembership.organization_id == organization_id,
+            OrgMembership.user_id == user_id,
+            OrgMembership.is_active == True
+        )
+    )
+    if load_lines:
+        query = query.options(selectinload(JournalEntry.lines))
+    return (await db.execute(query)).one_or_none()
+
+
+ENTRY_NUMBER_PREFIX = "JE-"
+
+# Attempts at inserting an entry before giving up on number collisions
+ENTRY_NUMBER_ATTEMPTS = 3
+
+# Last issued entry number per organization, primed from the database. The
+# API runs as a single worker, so the counter normally stays authoritative;
+# the unique (organization_id, entry_number) index catches drift from other
+# writers, after which the counter is re-primed.
+_entry_number_counters: dict[str, int] = {}
+_entry_number_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+async def _max_entry_number(org_id: str, db: AsyncSession) -> int:
+    """Return the highest numeric suffix of the organization's JE- numbers."""
+    # Order by length first so JE-1000000 sorts above JE-999999
+    last = await db.scalar(
+        select(JournalEntry.entry_number)
+        .where(
+            JournalEntry.organization_id == org_id,
+            JournalEntry.entry_number.like(f"{ENTRY_NUMBER_PREFIX}%"),
         )
+        .order_by(func.length(JournalEntry.entry_number).desc(), JournalEntry.entry_number.desc())
+        .limit(1)
     )
-    count = result.scalar() or 0
-    return f"JE-{count + 1:06d}"
+    if last is None:
+        return 0
+    try:
+        return int(last[len(ENTRY_NUMBER_PREFIX):])
+    except ValueError:
+        return 0
+
+
+async def generate_entry_number(org_id: str, db: AsyncSession, resync: bool = False) -> str:
+    """
+    Generate a sequential entry number for the organization.
+
+    Pass `resync` after a number collision to re-prime the counter from the
+    highest number in the database.
+    """
+    if resync or org_id not in _entry_number_counters:
+        async with _entry_number_locks[org_id]:
+            if resync or org_id not in _entry_number_counters:
+                _entry_number_counters[org_id] = await _max_entry_number(org_id, db)
+    _entry_number_counters[org_id] += 1
+    return f"{ENTRY_NUMBER_PREFIX}{_entry_number_counters[org_id]:06d}"
+
+
+def discard_entry_number_counter(org_id: str) -> None:
+    """Forget the counter so numbers drawn by a failed request are reissued."""
+    _entry_number_counters.pop(org_id, None)
 
 
 @router.get("/journal-entries", response_model=JournalEntryListResponse)
@@ -128,56 +247,72 @@ async def list_journal_entries(
     status_filter: Optional[str] = Query(None, alias="status"),
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
+    expand: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    role: Optional[OrgMembershipRole] = Depends(get_org_role)
 ):
     """
     List journal entries.
     Requires org membership.
+
+    Totals are always included; line items only with `expand=lines`.
     """
     # Check access
-    if not await check_org_access(organization_id, current_user, db):
+    if not check_org_access(role):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to access this organization"
         )
 
-    # Base query with eager loading of lines
-    query = select(JournalEntry).options(
-        selectinload(JournalEntry.lines)
-    ).where(JournalEntry.organization_id == organization_id)
-
-    # Apply filters
+    filters = [JournalEntry.organization_id == organization_id]
     if status_filter:
         try:
-            status_enum = JournalEntryStatus(status_filter)
-            query = query.where(JournalEntry.status == status_enum)
+            filters.append(JournalEntry.status == JournalEntryStatus(status_filter))
         except ValueError:
             pass
 
     if start_date:
-        query = query.where(JournalEntry.entry_date >= start_date)
+        filters.append(JournalEntry.entry_date >= start_date)
 
     if end_date:
-        query = query.where(JournalEntry.entry_date <= end_date)
-
-    # Count total (without eager loading)
-    count_query = select(func.count()).select_from(
-        select(JournalEntry).where(JournalEntry.organization_id == organization_id).subquery()
-    )
-    total_result = await db.execute(count_query)
-    total_items = total_result.scalar() or 0
+        filters.append(JournalEntry.entry_date <= end_date)
+
+    # Page query with line totals aggregated in SQL. The window count is
+    # evaluated before OFFSET/LIMIT, so every row carries the filtered total.
+    query = select(
+        JournalEntry,
+        _line_total(JournalLine.debit).label("total_debits"),
+        _line_total(JournalLine.credit).label("total_credits"),
+        func.count().over().label("total"),
+    ).where(*filters)
+
+    # Line rows are only loaded when the caller asks for them
+    include_lines = bool(expand and "lines" in expand)
+    if include_lines:
+        query = query.options(selectinload(JournalEntry.lines))
 
     # Apply pagination and ordering
     query = query.offset((page - 1) * perPage).limit(perPage)
     query = query.order_by(JournalEntry.entry_date.desc(), JournalEntry.created.desc())
 
     # Execute query
-    result = await db.execute(query)
-    entries = result.scalars().unique().all()
+    rows = (await db.execute(query)).all()
+    if rows:
+        total_items = rows[0].total
+    else:
+        # Empty page: no rows to read the total from
+        count_query = select(func.count()).select_from(JournalEntry).where(*filters)
+        total_items = (await db.scalar(count_query)) or 0
 
     # Build response
-    items = [journal_entry_to_response(e) for e in entries]
+    items = [
+        journal_entry_to_response(
+            row.JournalEntry,
+            lines_list=None if include_lines else [],
+            totals=(row.total_debits, row.total_credits)
+        )
+        for row in rows
+    ]
 
     return JournalEntryListResponse(
         page=page,
@@ -188,11 +323,85 @@ async def list_journal_entries(
     )
 
 
+async def _insert_journal_entry(
+    organization_id: str,
+    entry_data: JournalEntryCreate,
+    current_user: User,
+    db: AsyncSession
+) -> JournalEntry:
+    """Insert a draft entry under the next free entry number."""
+    # The entry and its lines share one timestamp
+    now = datetime.now(timezone.utc)
+    resync = False
+    for _ in range(ENTRY_NUMBER_ATTEMPTS):
+        entry = JournalEntry(
+            organization_id=organization_id,
+            entry_number=await generate_entry_number(organization_id, db, resync=resync),
+            entry_date=entry_data.entry_date,
+            description=entry_data.description,
+            notes=entry_data.notes,
+            reference=entry_data.reference,
+            source_type=entry_data.source_type,
+            source_id=entry_data.source_id,
+            status=JournalEntryStatus.DRAFT,
+            created_by_id=current_user.id,
+            created=now,
+            updated=now,
+        )
+        # The savepoint keeps the transaction usable if the number is taken
+        try:
+            async with db.begin_nested():
+                db.add(entry)
+        except IntegrityError:
+            resync = True
+            continue
+        return entry
+
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="Could not allocate a journal entry number, please retry"
+    )
+
+
+async def _insert_journal_lines(
+    entry: JournalEntry,
+    entry_data: JournalEntryCreate,
+    db: AsyncSession
+) -> list[JournalLine]:
+    """Insert the entry's lines in a single batched INSERT ... RETURNING."""
+    now = entry.created
+
+    rows = [
+        {
+            "journal_entry_id": entry.id,
+            "line_number": i,
+            "account_id": line_data.account_id,
+            "debit": line_data.debit or Decimal(0),
+            "credit": line_data.credit or Decimal(0),
+            "description": line_data.description,
+            "department_id": line_data.department_id,
+            "project_id": line_data.project_id,
+            "class_id": line_data.class_id,
+            "location_id": line_data.location_id,
+            "custom_dimensions": line_data.custom_dimensions,
+            "created": now,
+            "updated": now,
+        }
+        for i, line_data in enumerate(entry_data.lines, start=1)
+    ]
+    result = await db.scalars(
+        insert(JournalLine).returning(JournalLine, sort_by_parameter_order=True),
+        rows,
+    )
+    return list(result.all())
+
+
 @router.post("/journal-entries", response_model=JournalEntryResponse, status_code=status.HTTP_201_CREATED)
 async def create_journal_entry(
     organization_id: str,
     entry_data: JournalEntryCreate,
     db: AsyncSession = Depends(get_db),
+    role: Optional[OrgMembershipRole] = Depends(get_org_role),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -200,71 +409,39 @@ async def create_journal_entry(
     Requires org membership. Entry must be balanced (debits = credits).
     """
     # Check access
-    if not await check_org_access(organization_id, current_user, db):
+    if not check_org_access(role):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to create journal entries"
         )
 
     # Validate all accounts exist and belong to this org
-    account_ids = [line.account_id for line in entry_data.lines]
-    result = await db.execute(
-        select(Account).where(
+    # Lines often repeat an account; bind each id once
+    account_ids = {line.account_id for line in entry_data.lines}
+    result = await db.scalars(
+        select(Account.id).where(
             Account.id.in_(account_ids),
             Account.organization_id == organization_id,
             Account.is_active == True
         )
     )
-    valid_accounts = {a.id for a in result.scalars().all()}
+    valid_accounts = set(result.all())
 
-    invalid_accounts = set(account_ids) - valid_accounts
+    invalid_accounts = account_ids - valid_accounts
     if invalid_accounts:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid or inactive account IDs: {list(invalid_accounts)}"
         )
 
-    # Generate entry number
-    entry_number = await generate_entry_number(organization_id, db)
-
-    # Create journal entry
-    entry = JournalEntry(
-        organization_id=organization_id,
-        entry_number=entry_number,
-        entry_date=entry_data.entry_date,
-        description=entry_data.description,
-        notes=entry_data.notes,
-        reference=entry_data.reference,
-        source_type=entry_data.source_type,
-        source_id=entry_data.source_id,
-        status=JournalEntryStatus.DRAFT,
-        created_by_id=current_user.id,
-    )
-    db.add(entry)
-    await db.flush()
-
-    # Create journal lines
-    lines_created = []
-    for i, line_data in enumerate(entry_data.lines, start=1):
-        line = JournalLine(
-            journal_entry_id=entry.id,
-            line_number=i,
-            account_id=line_data.account_id,
-            debit=line_data.debit or Decimal(0),
-            credit=line_data.credit or Decimal(0),
-            description=line_data.description,
-            department_id=line_data.department_id,
-            project_id=line_data.project_id,
-            class_id=line_data.class_id,
-            location_id=line_data.location_id,
-            custom_dimensions=line_data.custom_dimensions,
-        )
-        db.add(line)
-        # Note: Don't append to entry.lines here - it triggers lazy loading
-        # The line is already linked via journal_entry_id foreign key
-        lines_created.append(line)
-
-    await db.flush()
+    try:
+        entry = await _insert_journal_entry(organization_id, entry_data, current_user, db)
+        lines_created = await _insert_journal_lines(entry, entry_data, db)
+        await db.commit()
+    except Exception:
+        # The numbers drawn for this request were never committed
+        discard_entry_number_counter(organization_id)
+        raise
 
     # Return with the lines we just created (avoiding lazy load)
     return journal_entry_to_response(entry, lines_list=lines_created)
@@ -281,22 +458,20 @@ async def get_journal_entry(
     Get a journal entry by ID with all lines.
     Requires org membership.
     """
+    # Role and entry come back from one query
+    row = await fetch_entry_with_role(
+        db, organization_id, entry_id, current_user.id,
+        _line_total(JournalLine.debit).label("total_debits"),
+        _line_total(JournalLine.credit).label("total_credits")
+    )
+
     # Check access
-    if not await check_org_access(organization_id, current_user, db):
+    if row is None or not check_org_access(row.role):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to access this organization"
         )
-
-    result = await db.execute(
-        select(JournalEntry).options(
-            selectinload(JournalEntry.lines)
-        ).where(
-            JournalEntry.id == entry_id,
-            JournalEntry.organization_id == organization_id
-        )
-    )
-    entry = result.scalar_one_or_none()
+    entry = row.JournalEntry
 
     if entry is None:
         raise HTTPException(
@@ -304,7 +479,7 @@ async def get_journal_entry(
             detail="Journal entry not found"
         )
 
-    return journal_entry_to_response(entry)
+    return journal_entry_to_response(entry, totals=(row.total_debits, row.total_credits))
 
 
 @router.patch("/journal-entries/{entry_id}", response_model=JournalEntryResponse)
@@ -319,22 +494,16 @@ async def update_journal_entry(
     Update a journal entry (only draft entries can be updated).
     Requires org membership.
     """
+    # Role and entry come back from one query
+    row = await fetch_entry_with_role(db, organization_id, entry_id, current_user.id)
+
     # Check access
-    if not await check_org_access(organization_id, current_user, db):
+    if row is None or not check_org_access(row.role):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to update journal entries"
         )
-
-    result = await db.execute(
-        select(JournalEntry).options(
-            selectinload(JournalEntry.lines)
-        ).where(
-            JournalEntry.id == entry_id,
-            JournalEntry.organization_id == organization_id
-        )
-    )
-    entry = result.scalar_one_or_none()
+    entry = row.JournalEntry
 
     if entry is None:
         raise HTTPException(
@@ -376,28 +545,27 @@ async def post_journal_entry(
     Post a journal entry (mark as posted).
     Requires org admin access. Entry must be balanced.
     """
+    # Role and entry come back from one query
+    row = await fetch_entry_with_role(
+        db, organization_id, entry_id, current_user.id,
+        _line_total(JournalLine.debit).label("total_debits"),
+        _line_total(JournalLine.credit).label("total_credits")
+    )
+
     # Check admin access
-    if not await check_org_access(organization_id, current_user, db, require_admin=True):
+    if row is None or not check_org_access(row.role, require_admin=True):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to post journal entries"
         )
-
-    result = await db.execute(
-        select(JournalEntry).options(
-            selectinload(JournalEntry.lines)
-        ).where(
-            JournalEntry.id == entry_id,
-            JournalEntry.organization_id == organization_id
-        )
-    )
-    entry = result.scalar_one_or_none()
+    entry = row.JournalEntry
 
     if entry is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Journal entry not found"
         )
+    total_debits, total_credits = row.total_debits, row.total_credits
 
     # Only draft entries can be posted
     if entry.status != JournalEntryStatus.DRAFT:
@@ -407,9 +575,6 @@ async def post_journal_entry(
         )
 
     # Validate entry is balanced
-    total_debits = sum(line.debit or Decimal(0) for line in entry.lines)
-    total_credits = sum(line.credit or Decimal(0) for line in entry.lines)
-
     if abs(total_debits - total_credits) > Decimal('0.01'):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -417,14 +582,15 @@ async def post_journal_entry(
         )
 
     # Post the entry
+    now = datetime.now(timezone.utc)
     entry.status = JournalEntryStatus.POSTED
-    entry.posted_at = datetime.now(timezone.utc).date()
+    entry.posted_at = now.date()
     entry.posted_by_id = current_user.id
-    entry.updated = datetime.now(timezone.utc)
+    entry.updated = now
 
     await db.flush()
 
-    return journal_entry_to_response(entry)
+    return journal_entry_to_response(entry, totals=(total_debits, total_credits))
 
 
 @router.post("/journal-entries/{entry_id}/void", response_model=JournalEntryResponse)
@@ -439,22 +605,16 @@ async def void_journal_entry(
     Void a posted journal entry.
     Requires org admin access.
     """
+    # Role and entry come back from one query
+    row = await fetch_entry_with_role(db, organization_id, entry_id, current_user.id)
+
     # Check admin access
-    if not await check_org_access(organization_id, current_user, db, require_admin=True):
+    if row is None or not check_org_access(row.role, require_admin=True):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to void journal entries"
         )
-
-    result = await db.execute(
-        select(JournalEntry).options(
-            selectinload(JournalEntry.lines)
-        ).where(
-            JournalEntry.id == entry_id,
-            JournalEntry.organization_id == organization_id
-        )
-    )
-    entry = result.scalar_one_or_none()
+    entry = row.JournalEntry
 
     if entry is None:
         raise HTTPException(
@@ -470,11 +630,12 @@ async def void_journal_entry(
         )
 
     # Void the entry
+    now = datetime.now(timezone.utc)
     entry.status = JournalEntryStatus.VOIDED
-    entry.voided_at = datetime.now(timezone.utc).date()
+    entry.voided_at = now.date()
     entry.voided_by_id = current_user.id
     entry.void_reason = void_data.reason
-    entry.updated = datetime.now(timezone.utc)
+    entry.updated = now
 
     await db.flush()
 
@@ -492,20 +653,19 @@ async def delete_journal_entry(
     Delete a journal entry (only draft entries can be deleted).
     Requires org admin access.
     """
+    # Role and entry come back from one query
+    row = await fetch_entry_with_role(
+        db, organization_id, entry_id, current_user.id,
+        load_lines=False
+    )
+
     # Check admin access
-    if not await check_org_access(organization_id, current_user, db, require_admin=True):
+    if row is None or not check_org_access(row.role, require_admin=True):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to delete journal entries"
         )
-
-    result = await db.execute(
-        select(JournalEntry).where(
-            JournalEntry.id == entry_id,
-            JournalEntry.organization_id == organization_id
-        )
-    )
-    entry = result.scalar_one_or_none()
+    entry = row.JournalEntry
 
     if entry is None:
         raise HTTPException(
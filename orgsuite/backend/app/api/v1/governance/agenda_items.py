@@ -9,13 +9,17 @@ from typing import Optional
 from math import ceil
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, insert, update, func, tuple_, and_, lambda_stmt
+from sqlalchemy.engine import Row
 
 from app.db.base import get_db
 from app.core.deps import get_current_user
+from app.core.pagination import encode_cursor, decode_cursor
+from app.core.responses import ORJSONResponse
 from app.models.user import User
 from app.models.meeting import Meeting
-from app.core.permissions import require_min_role, OrgMembershipRole, resolve_meeting_org_id
+from app.models.committee import Committee
+from app.core.permissions import require_min_role, OrgMembershipRole
 from app.models.participant import Participant, ParticipantRole
 from app.models.agenda_item import AgendaItem, AgendaItemType, AgendaItemStatus
 from app.schemas.governance_v1 import (
@@ -27,21 +31,67 @@ router = APIRouter()
 
 
 def agenda_item_to_response(item: AgendaItem) -> AgendaItemV1Response:
-    """Convert AgendaItem model to AgendaItemV1Response schema."""
-    return AgendaItemV1Response(
+    """Convert AgendaItem model to AgendaItemV1Response schema without re-validation."""
+    return AgendaItemV1Response.model_construct(
         id=item.id,
         meeting_id=item.meeting_id,
         title=item.title,
         description=item.description,
         order=item.order,
         duration_minutes=item.duration_minutes,
-        item_type=item.item_type.value if isinstance(item.item_type, AgendaItemType) else item.item_type,
-        status=item.status.value if isinstance(item.status, AgendaItemStatus) else item.status,
+        item_type=item.item_type.value,
+        status=item.status.value,
         created=item.created,
         updated=item.updated,
     )
 
 
+def has_meeting_access(
+    created_by_id: str,
+    participant_role: Optional[ParticipantRole],
+    user: User,
+    require_admin: bool = False
+) -> bool:
+    """Apply the meeting access rules to an already-loaded creator and participant role."""
+    # Creator has full access
+    if created_by_id == user.id:
+        return True
+
+    if participant_role is None:
+        return False
+
+    if require_admin:
+        return participant_role in [ParticipantRole.ADMIN, ParticipantRole.MODERATOR]
+
+    return True
+
+
+async def get_meeting_access(meeting_id: str, user: User, db: AsyncSession) -> Optional[Row]:
+    """
+    Load a meeting's creator, its organization (direct FK, else the
+    committee's) and the user's participant role in a single query.
+
+    Returns None if the meeting does not exist.
+    """
+    # lambda_stmt caches the constructed statement; meeting_id and user_id
+    # are extracted from the closure as bound parameters on each call
+    user_id = user.id
+    result = await db.execute(lambda_stmt(lambda: (
+        select(
+            Meeting.created_by_id,
+            Participant.role,
+            func.coalesce(Meeting.organization_id, Committee.organization_id).label("organization_id"),
+        )
+        .outerjoin(Committee, Committee.id == Meeting.committee_id)
+        .outerjoin(Participant, and_(
+            Participant.meeting_id == Meeting.id,
+            Participant.user_id == user_id
+        ))
+        .where(Meeting.id == meeting_id)
+    )))
+    return result.first()
+
+
 async def check_meeting_access(
     meeting_id: str,
     user: User,
@@ -49,35 +99,61 @@ async def check_meeting_access(
     require_admin: bool = False
 ) -> bool:
     """Check if user has access to the meeting."""
-    # Get meeting
-    result = await db.execute(
-        select(Meeting).where(Meeting.id == meeting_id)
-    )
-    meeting = result.scalar_one_or_none()
+    access = await get_meeting_access(meeting_id, user, db)
 
-    if meeting is None:
+    if access is None:
         return False
 
-    # Creator has full access
-    if meeting.created_by_id == user.id:
-        return True
+    return has_meeting_access(access.created_by_id, access.role, user, require_admin)
 
-    # Check if user is participant
-    participant_result = await db.execute(
-        select(Participant).where(
-            Participant.meeting_id == meeting_id,
-            Participant.user_id == user.id
-        )
-    )
-    participant = participant_result.scalar_one_or_none()
 
-    if participant is None:
-        return False
+async def get_agenda_item_for_user(
+    item_id: str,
+    user: User,
+    db: AsyncSession,
+    require_admin: bool = False
+) -> tuple[AgendaItem, Optional[str]]:
+    """
+    Load an agenda item, check meeting access and resolve the meeting's
+    organization (direct FK, else the committee's) in a single query.
 
-    if require_admin:
-        return participant.role in [ParticipantRole.ADMIN, ParticipantRole.MODERATOR]
+    Returns (item, organization_id). Raises 404 if the item does not exist
+    and 403 if the user lacks access.
+    """
+    # Cached like the statement in get_meeting_access
+    user_id = user.id
+    result = await db.execute(lambda_stmt(lambda: (
+        select(
+            AgendaItem,
+            Meeting.created_by_id,
+            Participant.role,
+            func.coalesce(Meeting.organization_id, Committee.organization_id).label("organization_id"),
+        )
+        .join(Meeting, Meeting.id == AgendaItem.meeting_id)
+        .outerjoin(Committee, Committee.id == Meeting.committee_id)
+        .outerjoin(Participant, and_(
+            Participant.meeting_id == AgendaItem.meeting_id,
+            Participant.user_id == user_id
+        ))
+        .where(AgendaItem.id == item_id)
+    )))
+    row = result.first()
+
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Agenda item not found"
+        )
 
-    return True
+    if not has_meeting_access(row.created_by_id, row.role, user, require_admin):
+        if require_admin:
+            raise HTTPException(status_code=403, detail="Not authorized (meeting participant role)")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this agenda item"
+        )
+
+    return row.AgendaItem, row.organization_id
 
 
 @router.get("", response_model=AgendaItemV1ListResponse)
@@ -85,12 +161,17 @@ async def list_agenda_items(
     meeting_id: str = Query(..., description="Meeting ID"),
     page: int = Query(1, ge=1),
     perPage: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's nextCursor"),
+    includeTotal: bool = Query(False, description="Also return totalItems/totalPages"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     List agenda items for a meeting.
     Requires meeting access.
+
+    Pass `cursor` to page by keyset on (order, id) instead of OFFSET.
+    The total count costs a second scan, so it is only run with includeTotal.
     """
     # Check access
     if not await check_meeting_access(meeting_id, current_user, db):
@@ -101,28 +182,38 @@ async def list_agenda_items(
 
     query = select(AgendaItem).where(AgendaItem.meeting_id == meeting_id)
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total_items = total_result.scalar() or 0
+    total_items = total_pages = None
+    if includeTotal:
+        count_query = select(func.count()).select_from(query.subquery())
+        total_items = await db.scalar(count_query) or 0
+        total_pages = ceil(total_items / perPage) if total_items > 0 else 1
 
-    # Apply pagination and sorting (by order)
-    query = query.order_by(AgendaItem.order.asc())
-    query = query.offset((page - 1) * perPage).limit(perPage)
+    if cursor:
+        key = decode_cursor(cursor, order=int, id=str)
+        query = query.where(tuple_(AgendaItem.order, AgendaItem.id) > tuple_(key["order"], key["id"]))
+    else:
+        query = query.offset((page - 1) * perPage)
 
-    # Execute query
-    result = await db.execute(query)
-    items = result.scalars().all()
+    # Sort by order, with id as a tiebreaker so the keyset is unique;
+    # fetch one extra row to tell whether another page follows
+    query = query.order_by(AgendaItem.order.asc(), AgendaItem.id.asc()).limit(perPage + 1)
+    items = list(await db.scalars(query))
 
-    response_items = [agenda_item_to_response(item) for item in items]
+    has_more = len(items) > perPage
+    items = items[:perPage]
+    next_cursor = None
+    if has_more:
+        next_cursor = encode_cursor({"order": items[-1].order, "id": items[-1].id})
 
-    return AgendaItemV1ListResponse(
+    return ORJSONResponse(AgendaItemV1ListResponse.model_construct(
         page=page,
         perPage=perPage,
         totalItems=total_items,
-        totalPages=ceil(total_items / perPage) if total_items > 0 else 1,
-        items=response_items
-    )
+        totalPages=total_pages,
+        items=[agenda_item_to_response(item) for item in items],
+        nextCursor=next_cursor,
+        hasMore=has_more
+    ))
 
 
 @router.post("", response_model=AgendaItemV1Response, status_code=status.HTTP_201_CREATED)
@@ -135,26 +226,22 @@ async def create_agenda_item(
     Create an agenda item.
     Requires meeting admin access.
     """
-    # Check meeting exists
-    meeting_result = await db.execute(
-        select(Meeting).where(Meeting.id == item_data.meeting_id)
-    )
-    meeting = meeting_result.scalar_one_or_none()
+    # Check meeting exists; its creator, org and the user's role come back together
+    access = await get_meeting_access(item_data.meeting_id, current_user, db)
 
-    if meeting is None:
+    if access is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Meeting not found"
         )
 
     # Check meeting admin access (legacy participant rule)
-    if not await check_meeting_access(item_data.meeting_id, current_user, db, require_admin=True):
+    if not has_meeting_access(access.created_by_id, access.role, current_user, require_admin=True):
         raise HTTPException(status_code=403, detail="Not authorized (meeting participant role)")
 
     # Organization membership enforcement: require member
-    org_id = await resolve_meeting_org_id(db, meeting)
-    if org_id:
-        await require_min_role(db, current_user.id, org_id, OrgMembershipRole.MEMBER)
+    if access.organization_id:
+        await require_min_role(db, current_user.id, access.organization_id, OrgMembershipRole.MEMBER)
 
     # Parse enums
     try:
@@ -167,32 +254,31 @@ async def create_agenda_item(
     except ValueError:
         status_enum = AgendaItemStatus.PENDING
 
-    # Get next order number if not provided
+    # Next order number if not provided, computed inside the INSERT
     if item_data.order == 0:
-        max_order_result = await db.execute(
-            select(func.max(AgendaItem.order)).where(
-                AgendaItem.meeting_id == item_data.meeting_id
-            )
+        order = (
+            select(func.coalesce(func.max(AgendaItem.order), 0) + 1)
+            .where(AgendaItem.meeting_id == item_data.meeting_id)
+            .scalar_subquery()
         )
-        max_order = max_order_result.scalar() or 0
-        order = max_order + 1
     else:
         order = item_data.order
 
-    # Create item
-    item = AgendaItem(
-        meeting_id=item_data.meeting_id,
-        title=item_data.title,
-        description=item_data.description,
-        order=order,
-        duration_minutes=item_data.duration_minutes or 0,
-        item_type=item_type_enum,
-        status=status_enum,
+    # Single INSERT ... RETURNING gives back the stored row, defaults included
+    item = await db.scalar(
+        insert(AgendaItem)
+        .values(
+            meeting_id=item_data.meeting_id,
+            title=item_data.title,
+            description=item_data.description,
+            order=order,
+            duration_minutes=item_data.duration_minutes or 0,
+            item_type=item_type_enum,
+            status=status_enum,
+        )
+        .returning(AgendaItem)
     )
 
-    db.add(item)
-    await db.flush()
-
     return agenda_item_to_response(item)
 
 
@@ -206,23 +292,7 @@ async def get_agenda_item(
     Get agenda item by ID.
     Requires meeting access.
     """
-    result = await db.execute(
-        select(AgendaItem).where(AgendaItem.id == item_id)
-    )
-    item = result.scalar_one_or_none()
-
-    if item is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Agenda item not found"
-        )
-
-    # Check access
-    if not await check_meeting_access(item.meeting_id, current_user, db):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this agenda item"
-        )
+    item, _ = await get_agenda_item_for_user(item_id, current_user, db)
 
     return agenda_item_to_response(item)
 
@@ -238,48 +308,40 @@ async def update_agenda_item(
     Update agenda item.
     Requires meeting admin access.
     """
-    result = await db.execute(
-        select(AgendaItem).where(AgendaItem.id == item_id)
-    )
-    item = result.scalar_one_or_none()
-
-    if item is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Agenda item not found"
-        )
-
-    # Check meeting admin access
-    if not await check_meeting_access(item.meeting_id, current_user, db, require_admin=True):
-        raise HTTPException(status_code=403, detail="Not authorized (meeting participant role)")
+    item, org_id = await get_agenda_item_for_user(item_id, current_user, db, require_admin=True)
 
     # Organization membership enforcement: require member
-    org_id = await resolve_meeting_org_id(db, meeting)
     if org_id:
         await require_min_role(db, current_user.id, org_id, OrgMembershipRole.MEMBER)
 
-    # Update fields
+    # Collect changed fields for a single UPDATE ... RETURNING
+    changes = {}
     if item_data.title is not None:
-        item.title = item_data.title
+        changes["title"] = item_data.title
     if item_data.description is not None:
-        item.description = item_data.description
+        changes["description"] = item_data.description
     if item_data.order is not None:
-        item.order = item_data.order
+        changes["order"] = item_data.order
     if item_data.duration_minutes is not None:
-        item.duration_minutes = item_data.duration_minutes
+        changes["duration_minutes"] = item_data.duration_minutes
     if item_data.item_type is not None:
         try:
-            item.item_type = AgendaItemType(item_data.item_type)
+            changes["item_type"] = AgendaItemType(item_data.item_type)
         except ValueError:
             pass
     if item_data.status is not None:
         try:
-            item.status = AgendaItemStatus(item_data.status)
+            changes["status"] = AgendaItemStatus(item_data.status)
         except ValueError:
             pass
 
-    item.updated = datetime.now(timezone.utc)
-    await db.flush()
+    item = await db.scalar(
+        update(AgendaItem)
+        .where(AgendaItem.id == item.id)
+        .values(**changes, updated=datetime.now(timezone.utc))
+        .returning(AgendaItem),
+        execution_options={"populate_existing": True}
+    )
 
     return agenda_item_to_response(item)
 
@@ -294,25 +356,9 @@ async def delete_agenda_item(
     Delete agenda item.
     Requires meeting admin access.
     """
-    result = await db.execute(
-        select(AgendaItem).where(AgendaItem.id == item_id)
-    )
-    item = result.scalar_one_or_none()
-
-    if item is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Agenda item not found"
-        )
-
-    # Check meeting admin access
-    if not await check_meeting_access(item.meeting_id, current_user, db, require_admin=True):
-        raise HTTPException(status_code=403, detail="Not authorized (meeting participant role)")
+    item, org_id = await get_agenda_item_for_user(item_id, current_user, db, require_admin=True)
 
     # Organization membership enforcement: require admin for delete
-    org_id_result = await db.execute(select(Meeting).where(Meeting.id == item.meeting_id))
-    meeting_parent = org_id_result.scalar_one_or_none()
-    org_id = await resolve_meeting_org_id(db, meeting_parent) if meeting_parent else None
     if org_id:
         await require_min_role(db, current_user.id, org_id, OrgMembershipRole.ADMIN)
 
@@ -332,22 +378,7 @@ async def start_agenda_item(
     Start an agenda item (set status to in_progress).
     Requires meeting admin access.
     """
-    result = await db.execute(
-        select(AgendaItem).where(AgendaItem.id == item_id)
-    )
-    item = result.scalar_one_or_none()
-
-    if item is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Agenda item not found"
-        )
-
-    if not await check_meeting_access(item.meeting_id, current_user, db, require_admin=True):
-        raise HTTPException(status_code=403, detail="Not authorized (meeting participant role)")
-    org_id_result = await db.execute(select(Meeting).where(Meeting.id == item.meeting_id))
-    meeting_parent = org_id_result.scalar_one_or_none()
-    org_id = await resolve_meeting_org_id(db, meeting_parent) if meeting_parent else None
+    item, org_id = await get_agenda_item_for_user(item_id, current_user, db, require_admin=True)
     if org_id:
         await require_min_role(db, current_user.id, org_id, OrgMembershipRole.MEMBER)
 
@@ -368,22 +399,7 @@ async def complete_agenda_item(
     Complete an agenda item (set status to completed).
     Requires meeting admin access.
     """
-    result = await db.execute(
-        select(AgendaItem).where(AgendaItem.id == item_id)
-    )
-    item = result.scalar_one_or_none()
-
-    if item is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Agenda item not found"
-        )
-
-    if not await check_meeting_access(item.meeting_id, current_user, db, require_admin=True):
-        raise HTTPException(status_code=403, detail="Not authorized (meeting participant role)")
-    org_id_result = await db.execute(select(Meeting).where(Meeting.id == item.meeting_id))
-    meeting_parent = org_id_result.scalar_one_or_none()
-    org_id = await resolve_meeting_org_id(db, meeting_parent) if meeting_parent else None
+    item, org_id = await get_agenda_item_for_user(item_id, current_user, db, require_admin=True)
     if org_id:
         await require_min_role(db, current_user.id, org_id, OrgMembershipRole.MEMBER)
 
@@ -404,22 +420,7 @@ async def skip_agenda_item(
     Skip an agenda item (set status to skipped).
     Requires meeting admin access.
     """
-    result = await db.execute(
-        select(AgendaItem).where(AgendaItem.id == item_id)
-    )
-    item = result.scalar_one_or_none()
-
-    if item is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Agenda item not found"
-        )
-
-    if not await check_meeting_access(item.meeting_id, current_user, db, require_admin=True):
-        raise HTTPException(status_code=403, detail="Not authorized (meeting participant role)")
-    org_id_result = await db.execute(select(Meeting).where(Meeting.id == item.meeting_id))
-    meeting_parent = org_id_result.scalar_one_or_none()
-    org_id = await resolve_meeting_org_id(db, meeting_parent) if meeting_parent else None
+    item, org_id = await get_agenda_item_for_user(item_id, current_user, db, require_admin=True)
     if org_id:
         await require_min_role(db, current_user.id, org_id, OrgMembershipRole.MEMBER)
 
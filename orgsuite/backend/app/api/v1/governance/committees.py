@@ -14,10 +14,11 @@ from sqlalchemy.orm import selectinload
 
 from app.db.base import get_db
 from app.core.deps import get_current_user
+from app.core.permissions import ADMIN_ROLES, org_exists
 from app.models.user import User
 from app.models.committee import Committee
 from app.models.organization import Organization
-from app.models.org_membership import OrgMembership, OrgMembershipRole
+from app.models.org_membership import OrgMembership
 from app.schemas.governance_v1 import (
     CommitteeV1Create, CommitteeV1Update, CommitteeV1Response,
     CommitteeV1ListResponse
@@ -47,30 +48,29 @@ async def check_org_access(
 ) -> bool:
     """Check if user has access to the organization."""
     # Check if user is owner
-    result = await db.execute(
-        select(Organization).where(
+    is_owner = await db.scalar(
+        select(Organization.id).where(
             Organization.id == org_id,
             Organization.owner_id == user.id
         )
     )
-    if result.scalar_one_or_none():
+    if is_owner:
         return True
 
     # Check membership
-    result = await db.execute(
-        select(OrgMembership).where(
+    role = await db.scalar(
+        select(OrgMembership.role).where(
             OrgMembership.organization_id == org_id,
             OrgMembership.user_id == user.id,
             OrgMembership.is_active == True
         )
     )
-    membership = result.scalar_one_or_none()
 
-    if membership is None:
+    if role is None:
         return False
 
     if require_admin:
-        return membership.role in [OrgMembershipRole.OWNER, OrgMembershipRole.ADMIN]
+        return role in ADMIN_ROLES
 
     return True
 
@@ -141,12 +141,7 @@ async def create_committee(
     Requires org admin access.
     """
     # Check organization exists
-    org_result = await db.execute(
-        select(Organization).where(Organization.id == committee_data.organization_id)
-    )
-    org = org_result.scalar_one_or_none()
-
-    if org is None:
+    if not await org_exists(db, committee_data.organization_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Organization not found"
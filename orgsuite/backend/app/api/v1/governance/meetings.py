@@ -4,17 +4,18 @@ Meeting endpoints for OrgSuite Governance module - v1 API.
 This provides the new /api/v1/governance/meetings/* endpoints that follow
 the same patterns as the membership and finance modules.
 """
-import uuid
+import os
 from datetime import datetime, timezone
 from typing import Optional
 from math import ceil
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, or_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func, tuple_, union
 
 from app.db.base import get_db
 from app.core.deps import get_current_user
+from app.core.pagination import encode_cursor, decode_cursor, cursor_datetime
+from app.core.responses import ORJSONResponse
 from app.models.user import User
 from app.models.meeting import Meeting, MeetingStatus, MeetingType
 from app.models.participant import Participant, ParticipantRole, AttendanceStatus
@@ -29,23 +30,43 @@ router = APIRouter()
 
 def generate_jitsi_room() -> str:
     """Generate a unique Jitsi room name."""
-    return f"orgmeet-{uuid.uuid4().hex[:12]}"
+    return f"orgmeet-{os.urandom(6).hex()}"
+
+
+def meeting_search_clause(db: AsyncSession, search: str):
+    """
+    Match meetings whose title or description contains `search`.
+
+    On PostgreSQL this uses the GIN-indexed Meeting.search_vec column
+    for whole words, plus trigram-indexed ILIKEs on title and description for
+    partial words. SQLite, which backs the test suite, uses only the ILIKEs.
+    """
+    if db.bind.dialect.name == "postgresql":
+        return (
+            Meeting.search_vec.bool_op("@@")(func.plainto_tsquery("simple", search)) |
+            Meeting.title.ilike(f"%{search}%") |
+            Meeting.description.ilike(f"%{search}%")
+        )
+    return (
+        Meeting.title.ilike(f"%{search}%") |
+        Meeting.description.ilike(f"%{search}%")
+    )
 
 
 def meeting_to_response(meeting: Meeting) -> MeetingV1Response:
-    """Convert Meeting model to MeetingV1Response schema."""
-    return MeetingV1Response(
+    """Convert Meeting model to MeetingV1Response schema without re-validation."""
+    return MeetingV1Response.model_construct(
         id=meeting.id,
         title=meeting.title,
         description=meeting.description,
         start_time=meeting.start_time,
         end_time=meeting.end_time,
-        status=meeting.status.value if isinstance(meeting.status, MeetingStatus) else meeting.status,
+        status=meeting.status.value,
         jitsi_room=meeting.jitsi_room,
         settings=meeting.settings,
         created_by_id=meeting.created_by_id,
         committee_id=meeting.committee_id,
-        meeting_type=meeting.meeting_type.value if isinstance(meeting.meeting_type, MeetingType) else meeting.meeting_type,
+        meeting_type=meeting.meeting_type.value if meeting.meeting_type else None,
         quorum_required=meeting.quorum_required,
         quorum_met=meeting.quorum_met,
         minutes_generated=meeting.minutes_generated,
@@ -61,24 +82,28 @@ async def list_meetings(
     page: int = Query(1, ge=1),
     perPage: int = Query(30, ge=1, le=500),
     search: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's nextCursor"),
+    includeTotal: bool = Query(False, description="Also return totalItems/totalPages"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     List meetings the user has access to.
     Returns meetings where user is creator or participant.
+
+    Pass `cursor` to page by keyset on (start_time, id) instead of OFFSET.
+    The total count costs a second scan, so it is only run with includeTotal.
     """
-    # Get meetings user created or is participant of
-    participant_subquery = select(Participant.meeting_id).where(
-        Participant.user_id == current_user.id
-    )
+    # Get meetings user created or is participant of. A UNION of two indexed
+    # lookups replaces `created_by_id = :u OR id IN (...)`, which the planner
+    # cannot serve from either index; UNION rather than UNION ALL because
+    # creators are normally participants too.
+    accessible_ids = union(
+        select(Meeting.id.label("id")).where(Meeting.created_by_id == current_user.id),
+        select(Participant.meeting_id.label("id")).where(Participant.user_id == current_user.id),
+    ).subquery()
 
-    query = select(Meeting).where(
-        or_(
-            Meeting.created_by_id == current_user.id,
-            Meeting.id.in_(participant_subquery)
-        )
-    )
+    query = select(Meeting).join(accessible_ids, Meeting.id == accessible_ids.c.id)
 
     # Apply committee filter
     if committee_id:
@@ -94,33 +119,42 @@ async def list_meetings(
 
     # Apply search filter
     if search:
-        query = query.where(
-            Meeting.title.ilike(f"%{search}%") |
-            Meeting.description.ilike(f"%{search}%")
-        )
-
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total_items = total_result.scalar() or 0
-
-    # Apply pagination and sorting
-    query = query.order_by(Meeting.start_time.desc())
-    query = query.offset((page - 1) * perPage).limit(perPage)
-
-    # Execute query
-    result = await db.execute(query)
-    meetings = result.scalars().all()
-
-    items = [meeting_to_response(m) for m in meetings]
-
-    return MeetingV1ListResponse(
+        query = query.where(meeting_search_clause(db, search))
+
+    total_items = total_pages = None
+    if includeTotal:
+        count_query = select(func.count()).select_from(query.subquery())
+        total_items = await db.scalar(count_query) or 0
+        total_pages = ceil(total_items / perPage) if total_items > 0 else 1
+
+    if cursor:
+        key = decode_cursor(cursor, start_time=str, id=str)
+        start_time = cursor_datetime(key["start_time"])
+        query = query.where(tuple_(Meeting.start_time, Meeting.id) < tuple_(start_time, key["id"]))
+    else:
+        query = query.offset((page - 1) * perPage)
+
+    # Newest first, with id as a tiebreaker so the keyset is unique;
+    # fetch one extra row to tell whether another page follows
+    query = query.order_by(Meeting.start_time.desc(), Meeting.id.desc()).limit(perPage + 1)
+    meetings = list(await db.scalars(query))
+
+    has_more = len(meetings) > perPage
+    meetings = meetings[:perPage]
+    next_cursor = None
+    if has_more:
+        last = meetings[-1]
+        next_cursor = encode_cursor({"start_time": last.start_time.isoformat(), "id": last.id})
+
+    return ORJSONResponse(MeetingV1ListResponse.model_construct(
         page=page,
         perPage=perPage,
         totalItems=total_items,
-        totalPages=ceil(total_items / perPage) if total_items > 0 else 1,
-        items=items
-    )
+        totalPages=total_pages,
+        items=[meeting_to_response(m) for m in meetings],
+        nextCursor=next_cursor,
+        hasMore=has_more
+    ))
 
 
 @router.post("", response_model=MeetingV1Response, status_code=status.HTTP_201_CREATED)
@@ -142,10 +176,7 @@ async def create_meeting(
 
     # If committee_id provided, verify it exists
     if meeting_data.committee_id:
-        committee_result = await db.execute(
-            select(Committee).where(Committee.id == meeting_data.committee_id)
-        )
-        if not committee_result.scalar_one_or_none():
+        if await db.get(Committee, meeting_data.committee_id) is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Committee not found"
@@ -180,12 +211,10 @@ async def create_meeting(
         jitsi_room=generate_jitsi_room(),
     )
 
-    db.add(meeting)
-    await db.flush()
-
-    # Add creator as admin participant
+    # Add creator as admin participant; linking through the relationship lets
+    # one flush insert the meeting and then the participant with its id
     participant = Participant(
-        meeting_id=meeting.id,
+        meeting=meeting,
         user_id=current_user.id,
         role=ParticipantRole.ADMIN,
         is_present=False,
@@ -193,7 +222,7 @@ async def create_meeting(
         can_vote=True,
         vote_weight=1,
     )
-    db.add(participant)
+    db.add_all([meeting, participant])
     await db.flush()
 
     return meeting_to_response(meeting)
@@ -209,12 +238,7 @@ async def get_meeting(
     Get meeting by ID.
     Requires being creator or participant.
     """
-    result = await db.execute(
-        select(Meeting)
-        .options(selectinload(Meeting.created_by))
-        .where(Meeting.id == meeting_id)
-    )
-    meeting = result.scalar_one_or_none()
+    meeting = await db.get(Meeting, meeting_id)
 
     if meeting is None:
         raise HTTPException(
@@ -250,8 +274,7 @@ async def update_meeting(
     Update meeting.
     Requires being creator or admin/moderator participant.
     """
-    result = await db.execute(select(Meeting).where(Meeting.id == meeting_id))
-    meeting = result.scalar_one_or_none()
+    meeting = await db.get(Meeting, meeting_id)
 
     if meeting is None:
         raise HTTPException(
@@ -316,8 +339,7 @@ async def delete_meeting(
     Delete meeting.
     Only the creator can delete a meeting.
     """
-    result = await db.execute(select(Meeting).where(Meeting.id == meeting_id))
-    meeting = result.scalar_one_or_none()
+    meeting = await db.get(Meeting, meeting_id)
 
     if meeting is None:
         raise HTTPException(
@@ -348,8 +370,7 @@ async def close_meeting(
     Close a meeting (set status to completed).
     Requires being creator or admin participant.
     """
-    result = await db.execute(select(Meeting).where(Meeting.id == meeting_id))
-    meeting = result.scalar_one_or_none()
+    meeting = await db.get(Meeting, meeting_id)
 
     if meeting is None:
         raise HTTPException(
@@ -372,9 +393,10 @@ async def close_meeting(
                 detail="Not authorized to close this meeting"
             )
 
+    now = datetime.now(timezone.utc)
     meeting.status = MeetingStatus.COMPLETED
-    meeting.end_time = meeting.end_time or datetime.now(timezone.utc)
-    meeting.updated = datetime.now(timezone.utc)
+    meeting.end_time = meeting.end_time or now
+    meeting.updated = now
     await db.flush()
 
     return meeting_to_response(meeting)
@@ -390,8 +412,7 @@ async def reopen_meeting(
     Reopen a completed meeting (set status to in_progress).
     Requires being creator or admin participant.
     """
-    result = await db.execute(select(Meeting).where(Meeting.id == meeting_id))
-    meeting = result.scalar_one_or_none()
+    meeting = await db.get(Meeting, meeting_id)
 
     if meeting is None:
         raise HTTPException(
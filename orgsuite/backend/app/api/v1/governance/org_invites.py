@@ -12,7 +12,7 @@ from sqlalchemy import select, func
 
 from app.db.base import get_db
 from app.core.deps import get_current_user, get_current_user_optional
-from app.core.permissions import require_role
+from app.core.permissions import ADMIN_ROLES, require_role, invalidate_membership_cache
 from app.models.user import User
 from app.models.organization import Organization
 from app.models.org_membership import OrgMembership, OrgMembershipRole
@@ -62,7 +62,7 @@ async def create_invite(
     # Check user has admin/owner role
     await require_role(
         db, current_user.id, invite_data.organization_id,
-        [OrgMembershipRole.ADMIN, OrgMembershipRole.OWNER]
+        ADMIN_ROLES
     )
 
     # Get organization name
@@ -156,7 +156,7 @@ async def list_org_invites(
     # Check user has admin/owner role
     await require_role(
         db, current_user.id, organization_id,
-        [OrgMembershipRole.ADMIN, OrgMembershipRole.OWNER]
+        ADMIN_ROLES
     )
 
     # Get org name
@@ -237,7 +237,7 @@ async def get_invite(
     if not is_invitee:
         await require_role(
             db, current_user.id, invite.organization_id,
-            [OrgMembershipRole.ADMIN, OrgMembershipRole.OWNER]
+            ADMIN_ROLES
         )
 
     # Get org and inviter names
@@ -370,7 +370,8 @@ async def accept_invite(
     invite.accepted_by_id = current_user.id
     invite.accepted_at = datetime.now(timezone.utc)
 
-    await db.flush()
+    await db.commit()
+    invalidate_membership_cache(current_user.id, invite.organization_id)
 
     return OrgInviteAcceptResponse(
         success=True,
@@ -403,7 +404,7 @@ async def cancel_invite(
     # Check user has admin/owner role
     await require_role(
         db, current_user.id, invite.organization_id,
-        [OrgMembershipRole.ADMIN, OrgMembershipRole.OWNER]
+        ADMIN_ROLES
     )
 
     if invite.status != OrgInviteStatus.PENDING:
@@ -442,7 +443,7 @@ async def resend_invite(
     # Check user has admin/owner role
     await require_role(
         db, current_user.id, invite.organization_id,
-        [OrgMembershipRole.ADMIN, OrgMembershipRole.OWNER]
+        ADMIN_ROLES
     )
 
     if invite.status == OrgInviteStatus.ACCEPTED:
@@ -6,15 +6,20 @@ Migrated from PocketBase to FastAPI.
 from datetime import datetime, timezone
 from typing import Optional
 from math import ceil
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, update, delete, func, tuple_, or_, and_, exists
+from sqlalchemy.orm import aliased, selectinload
 
-from app.db.base import get_db
+from app.db.base import get_db, upsert_insert
 from app.core.deps import get_current_user
+from app.core.permissions import (
+    ADMIN_ROLES, get_effective_role, invalidate_membership_cache, membership_list_cache,
+    membership_list_generation
+)
+from app.core.responses import ORJSONResponse
+from app.core.pagination import encode_cursor, decode_cursor, cursor_datetime
 from app.models.user import User
-from app.models.organization import Organization
 from app.models.org_membership import OrgMembership, OrgMembershipRole
 from app.schemas.org_membership import (
     OrgMembershipCreate,
@@ -34,31 +39,33 @@ def membership_to_response(
     include_user: bool = False,
     include_org: bool = False
 ) -> OrgMembershipResponse:
-    """Convert OrgMembership model to response schema."""
+    """Convert OrgMembership model to response schema without re-validation."""
     user_info = None
     org_info = None
 
     if include_user and membership.user:
-        user_info = UserInfo(
-            id=membership.user.id,
-            email=membership.user.email,
-            name=membership.user.name,
-            avatar=membership.user.avatar
+        user = membership.user
+        user_info = UserInfo.model_construct(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            avatar=user.avatar
         )
 
     if include_org and membership.organization:
-        org_info = OrganizationInfo(
-            id=membership.organization.id,
-            name=membership.organization.name,
-            description=membership.organization.description,
-            logo=membership.organization.logo
+        org = membership.organization
+        org_info = OrganizationInfo.model_construct(
+            id=org.id,
+            name=org.name,
+            description=org.description,
+            logo=org.logo
         )
 
-    return OrgMembershipResponse(
+    return OrgMembershipResponse.model_construct(
         id=membership.id,
         organization_id=membership.organization_id,
         user_id=membership.user_id,
-        role=membership.role.value if isinstance(membership.role, OrgMembershipRole) else membership.role,
+        role=membership.role.value,
         is_active=membership.is_active,
         invited_by_id=membership.invited_by_id,
         invited_at=membership.invited_at,
@@ -71,75 +78,118 @@ def membership_to_response(
     )
 
 
+def other_owner_exists(organization_id: str, membership_id: str):
+    """EXISTS clause: the organization has an active owner besides this membership."""
+    other = aliased(OrgMembership)
+    return exists().where(
+        other.organization_id == organization_id,
+        other.role == OrgMembershipRole.OWNER,
+        other.is_active == True,
+        other.id != membership_id
+    )
+
+
+async def upsert_membership(db: AsyncSession, **values) -> Optional[OrgMembership]:
+    """
+    Insert a membership, or reactivate an inactive one for the same user and
+    organization, in a single statement.
+
+    A reactivated membership takes the new role; its other fields are kept.
+    Returns None if the user is already an active member.
+    """
+    stmt = upsert_insert(db, OrgMembership).values(**values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[OrgMembership.organization_id, OrgMembership.user_id],
+        set_={"is_active": True, "role": stmt.excluded.role, "updated": datetime.now(timezone.utc)},
+        where=OrgMembership.is_active == False,
+    ).returning(OrgMembership)
+    return await db.scalar(stmt, execution_options={"populate_existing": True})
+
+
 async def check_org_admin_access(
     organization_id: str,
     user: User,
     db: AsyncSession
 ) -> bool:
     """Check if user has admin/owner access to the organization."""
-    # Check if user is org owner
-    org_result = await db.execute(
-        select(Organization).where(Organization.id == organization_id)
-    )
-    org = org_result.scalar_one_or_none()
-    if org and org.owner_id == user.id:
-        return True
-
-    # Check membership
-    result = await db.execute(
-        select(OrgMembership).where(
-            OrgMembership.organization_id == organization_id,
-            OrgMembership.user_id == user.id,
-            OrgMembership.is_active == True
-        )
-    )
-    membership = result.scalar_one_or_none()
-
-    if membership is None:
-        return False
-
-    return membership.role in [OrgMembershipRole.OWNER, OrgMembershipRole.ADMIN]
+    return await get_effective_role(db, user.id, organization_id) in ADMIN_ROLES
 
 
 @router.get("/my", response_model=OrgMembershipListResponse)
 async def get_my_memberships(
     page: int = Query(1, ge=1),
     perPage: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="nextCursor from the previous page"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get all memberships for the current user.
     Returns organizations the user belongs to.
+
+    Pass `cursor` for keyset pagination; cursor requests skip the total count.
+    Responses are cached per user until one of their memberships changes.
     """
-    query = select(OrgMembership).options(
-        selectinload(OrgMembership.organization)
-    ).where(
+    cache_key = (current_user.id, page, perPage, cursor)
+    cached = membership_list_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+    generation = membership_list_generation()
+
+    filters = [
         OrgMembership.user_id == current_user.id,
         OrgMembership.is_active == True
-    )
-
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total_items = total_result.scalar() or 0
-
-    # Apply pagination
-    query = query.order_by(OrgMembership.created.desc())
-    query = query.offset((page - 1) * perPage).limit(perPage)
+    ]
+    query = select(OrgMembership).options(
+        selectinload(OrgMembership.organization)
+    ).where(*filters)
+
+    total_items = total_pages = None
+    if cursor:
+        key = decode_cursor(cursor, created=str, id=str)
+        created = cursor_datetime(key["created"])
+        query = query.where(tuple_(OrgMembership.created, OrgMembership.id) < tuple_(created, key["id"]))
+    else:
+        # The window count is evaluated before OFFSET/LIMIT, so every row
+        # carries the filtered total
+        query = query.add_columns(func.count().over().label("total"))
+        query = query.offset((page - 1) * perPage)
+
+    # Fetch one extra row to learn whether another page follows
+    query = query.order_by(OrgMembership.created.desc(), OrgMembership.id.desc()).limit(perPage + 1)
+    rows = (await db.execute(query)).all()
+    has_more = len(rows) > perPage
+    rows = rows[:perPage]
+    memberships = [row.OrgMembership for row in rows]
+
+    if not cursor:
+        if rows:
+            total_items = rows[0].total
+        else:
+            # Empty page: no rows to read the total from
+            count_query = select(func.count()).select_from(OrgMembership).where(*filters)
+            total_items = await db.scalar(count_query) or 0
+        total_pages = ceil(total_items / perPage) if total_items > 0 else 1
 
-    result = await db.execute(query)
-    memberships = result.scalars().all()
+    next_cursor = None
+    if has_more:
+        last = memberships[-1]
+        next_cursor = encode_cursor({"created": last.created.isoformat(), "id": last.id})
 
     items = [membership_to_response(m, include_user=False, include_org=True) for m in memberships]
 
-    return OrgMembershipListResponse(
+    response = ORJSONResponse(OrgMembershipListResponse.model_construct(
         page=page,
         perPage=perPage,
         totalItems=total_items,
-        totalPages=ceil(total_items / perPage) if total_items > 0 else 1,
-        items=items
-    )
+        totalPages=total_pages,
+        items=items,
+        nextCursor=next_cursor,
+        hasMore=has_more
+    ))
+    if membership_list_generation() == generation:
+        membership_list_cache.set(cache_key, response.body)
+    return response
 
 
 @router.get("/org/{organization_id}", response_model=OrgMembershipListResponse)
@@ -148,60 +198,90 @@ async def get_org_members(
     role: Optional[str] = Query(None, description="Filter by role"),
     page: int = Query(1, ge=1),
     perPage: int = Query(200, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="nextCursor from the previous page"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get all members of an organization.
     Requires membership in the organization.
+
+    Pass `cursor` for keyset pagination; cursor requests skip the total count.
     """
-    # Check user has access to this org
-    user_membership = await db.execute(
-        select(OrgMembership).where(
-            OrgMembership.organization_id == organization_id,
-            OrgMembership.user_id == current_user.id,
-            OrgMembership.is_active == True
-        )
-    )
-    if not user_membership.scalar_one_or_none():
-        # Also check if user is org owner
-        org_result = await db.execute(
-            select(Organization).where(Organization.id == organization_id)
+    # Check user is a member or the org owner
+    if await get_effective_role(db, current_user.id, organization_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to view this organization's members"
         )
-        org = org_result.scalar_one_or_none()
-        if not org or org.owner_id != current_user.id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to view this organization's members"
-            )
 
-    # Build query
-    query = select(OrgMembership).options(
-        selectinload(OrgMembership.user)
-    ).where(
+    filters = [
         OrgMembership.organization_id == organization_id,
         OrgMembership.is_active == True
-    )
+    ]
 
     # Filter by role
     if role:
         try:
             role_enum = OrgMembershipRole(role)
-            query = query.where(OrgMembership.role == role_enum)
+            filters.append(OrgMembership.role == role_enum)
         except ValueError:
             pass
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total_items = total_result.scalar() or 0
-
-    # Apply pagination and sorting
-    query = query.order_by(OrgMembership.role, OrgMembership.created.desc())
-    query = query.offset((page - 1) * perPage).limit(perPage)
+    # Build query
+    query = select(OrgMembership).options(
+        selectinload(OrgMembership.user)
+    ).where(*filters)
 
-    result = await db.execute(query)
-    memberships = result.scalars().all()
+    total_items = total_pages = None
+    if cursor:
+        key = decode_cursor(cursor, role=str, created=str, id=str)
+        try:
+            last_role = OrgMembershipRole(key["role"])
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+        created = cursor_datetime(key["created"])
+        # Rows after (role, created, id) under ORDER BY role ASC, created DESC, id DESC
+        query = query.where(or_(
+            OrgMembership.role > last_role,
+            and_(
+                OrgMembership.role == last_role,
+                tuple_(OrgMembership.created, OrgMembership.id) < tuple_(created, key["id"])
+            )
+        ))
+    else:
+        # The window count is evaluated before OFFSET/LIMIT, so every row
+        # carries the filtered total
+        query = query.add_columns(func.count().over().label("total"))
+        query = query.offset((page - 1) * perPage)
+
+    # Fetch one extra row to learn whether another page follows
+    query = query.order_by(
+        OrgMembership.role, OrgMembership.created.desc(), OrgMembership.id.desc()
+    ).limit(perPage + 1)
+    rows = (await db.execute(query)).all()
+    has_more = len(rows) > perPage
+    rows = rows[:perPage]
+    memberships = [row.OrgMembership for row in rows]
+
+    if not cursor:
+        if rows:
+            total_items = rows[0].total
+        else:
+            # Empty page: no rows to read the total from
+            count_query = select(func.count()).select_from(OrgMembership).where(*filters)
+            total_items = await db.scalar(count_query) or 0
+        total_pages = ceil(total_items / perPage) if total_items > 0 else 1
+
+    next_cursor = None
+    if has_more:
+        last = memberships[-1]
+        next_cursor = encode_cursor({
+            "role": last.role.value, "created": last.created.isoformat(), "id": last.id
+        })
 
     items = [membership_to_response(m, include_user=True, include_org=False) for m in memberships]
 
@@ -209,8 +289,10 @@ async def get_org_members(
         page=page,
         perPage=perPage,
         totalItems=total_items,
-        totalPages=ceil(total_items / perPage) if total_items > 0 else 1,
-        items=items
+        totalPages=total_pages,
+        items=items,
+        nextCursor=next_cursor,
+        hasMore=has_more
     )
 
 
@@ -295,62 +377,41 @@ async def add_member_by_email(
         )
 
     # Find user by email
-    user_result = await db.execute(
-        select(User).where(User.email == request.email)
-    )
-    user = user_result.scalar_one_or_none()
+    user_id = await db.scalar(select(User.id).where(User.email == request.email))
 
-    if user is None:
+    if user_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found with that email"
         )
 
-    # Check if already a member
-    existing_result = await db.execute(
-        select(OrgMembership).where(
-            OrgMembership.organization_id == organization_id,
-            OrgMembership.user_id == user.id
-        )
-    )
-    existing = existing_result.scalar_one_or_none()
-
-    if existing:
-        if existing.is_active:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="User is already a member of this organization"
-            )
-        else:
-            # Reactivate membership
-            existing.is_active = True
-            try:
-                existing.role = OrgMembershipRole(request.role)
-            except ValueError:
-                existing.role = OrgMembershipRole.MEMBER
-            existing.updated = datetime.now(timezone.utc)
-            await db.flush()
-            return membership_to_response(existing)
-
     # Parse role
     try:
         role_enum = OrgMembershipRole(request.role)
     except ValueError:
         role_enum = OrgMembershipRole.MEMBER
 
-    # Create membership
-    membership = OrgMembership(
+    # Create membership, or reactivate a previous one
+    now = datetime.now(timezone.utc)
+    membership = await upsert_membership(
+        db,
         organization_id=organization_id,
-        user_id=user.id,
+        user_id=user_id,
         role=role_enum,
         is_active=True,
         invited_by_id=current_user.id,
-        invited_at=datetime.now(timezone.utc),
-        joined_at=datetime.now(timezone.utc),
+        invited_at=now,
+        joined_at=now,
     )
 
-    db.add(membership)
-    await db.flush()
+    if membership is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User is already a member of this organization"
+        )
+
+    await db.commit()
+    invalidate_membership_cache(membership.user_id, membership.organization_id)
 
     return membership_to_response(membership)
 
@@ -375,16 +436,14 @@ async def create_membership(
     # Get user ID
     user_id = membership_data.user_id
     if not user_id and membership_data.user_email:
-        user_result = await db.execute(
-            select(User).where(User.email == membership_data.user_email)
+        user_id = await db.scalar(
+            select(User.id).where(User.email == membership_data.user_email)
         )
-        user = user_result.scalar_one_or_none()
-        if user is None:
+        if user_id is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
-        user_id = user.id
 
     if not user_id:
         raise HTTPException(
@@ -392,49 +451,34 @@ async def create_membership(
             detail="Either user_id or user_email is required"
         )
 
-    # Check if already a member
-    existing_result = await db.execute(
-        select(OrgMembership).where(
-            OrgMembership.organization_id == membership_data.organization_id,
-            OrgMembership.user_id == user_id
-        )
-    )
-    existing = existing_result.scalar_one_or_none()
-
-    if existing and existing.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User is already a member of this organization"
-        )
-
     # Parse role
     try:
         role_enum = OrgMembershipRole(membership_data.role)
     except ValueError:
         role_enum = OrgMembershipRole.MEMBER
 
-    if existing:
-        # Reactivate
-        existing.is_active = True
-        existing.role = role_enum
-        existing.updated = datetime.now(timezone.utc)
-        await db.flush()
-        return membership_to_response(existing)
-
-    # Create new membership
-    membership = OrgMembership(
+    # Create new membership, or reactivate a previous one
+    now = datetime.now(timezone.utc)
+    membership = await upsert_membership(
+        db,
         organization_id=membership_data.organization_id,
         user_id=user_id,
         role=role_enum,
         is_active=True,
         invited_by_id=current_user.id,
-        invited_at=datetime.now(timezone.utc),
-        joined_at=datetime.now(timezone.utc),
+        invited_at=now,
+        joined_at=now,
         permissions=membership_data.permissions,
     )
 
-    db.add(membership)
-    await db.flush()
+    if membership is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User is already a member of this organization"
+        )
+
+    await db.commit()
+    invalidate_membership_cache(membership.user_id, membership.organization_id)
 
     return membership_to_response(membership)
 
@@ -468,56 +512,49 @@ async def update_membership(
             detail="Not authorized to update this membership"
         )
 
-    # Prevent demoting/removing the last owner
-    if membership_data.role and membership.role == OrgMembershipRole.OWNER:
-        if membership_data.role != "owner":
-            # Count other owners
-            owner_count = await db.execute(
-                select(func.count()).select_from(OrgMembership).where(
-                    OrgMembership.organization_id == membership.organization_id,
-                    OrgMembership.role == OrgMembershipRole.OWNER,
-                    OrgMembership.is_active == True,
-                    OrgMembership.id != membership_id
-                )
-            )
-            if owner_count.scalar() == 0:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Cannot demote the last owner"
-                )
-
     # Update fields
+    changes = {"updated": datetime.now(timezone.utc)}
     if membership_data.role is not None:
         try:
-            membership.role = OrgMembershipRole(membership_data.role)
+            changes["role"] = OrgMembershipRole(membership_data.role)
         except ValueError:
             pass
-
     if membership_data.is_active is not None:
-        # Prevent deactivating the last owner
-        if not membership_data.is_active and membership.role == OrgMembershipRole.OWNER:
-            owner_count = await db.execute(
-                select(func.count()).select_from(OrgMembership).where(
-                    OrgMembership.organization_id == membership.organization_id,
-                    OrgMembership.role == OrgMembershipRole.OWNER,
-                    OrgMembership.is_active == True,
-                    OrgMembership.id != membership_id
-                )
-            )
-            if owner_count.scalar() == 0:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Cannot deactivate the last owner"
-                )
-        membership.is_active = membership_data.is_active
-
+        changes["is_active"] = membership_data.is_active
     if membership_data.permissions is not None:
-        membership.permissions = membership_data.permissions
+        changes["permissions"] = membership_data.permissions
 
-    membership.updated = datetime.now(timezone.utc)
-    await db.flush()
+    # Prevent demoting/deactivating the last owner. The check is part of the
+    # UPDATE itself, so no other owner can be removed in between.
+    stmt = update(OrgMembership).where(OrgMembership.id == membership_id)
+    last_owner_detail = None
+    if membership.role == OrgMembershipRole.OWNER:
+        if membership_data.role and membership_data.role != "owner":
+            last_owner_detail = "Cannot demote the last owner"
+        elif membership_data.is_active is False:
+            last_owner_detail = "Cannot deactivate the last owner"
+        if last_owner_detail:
+            stmt = stmt.where(other_owner_exists(membership.organization_id, membership_id))
+
+    updated = await db.scalar(
+        stmt.values(**changes).returning(OrgMembership),
+        execution_options={"populate_existing": True}
+    )
+    if updated is None:
+        if last_owner_detail is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Membership not found"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=last_owner_detail
+        )
 
-    return membership_to_response(membership)
+    await db.commit()
+    invalidate_membership_cache(updated.user_id, updated.organization_id)
+
+    return membership_to_response(updated)
 
 
 @router.delete("/{membership_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -551,23 +588,19 @@ async def delete_membership(
             detail="Not authorized to remove this membership"
         )
 
-    # Prevent removing the last owner
+    # Prevent removing the last owner, checked within the DELETE itself
+    stmt = delete(OrgMembership).where(OrgMembership.id == membership_id)
     if membership.role == OrgMembershipRole.OWNER:
-        owner_count = await db.execute(
-            select(func.count()).select_from(OrgMembership).where(
-                OrgMembership.organization_id == membership.organization_id,
-                OrgMembership.role == OrgMembershipRole.OWNER,
-                OrgMembership.is_active == True,
-                OrgMembership.id != membership_id
-            )
+        stmt = stmt.where(other_owner_exists(membership.organization_id, membership_id))
+
+    result = await db.execute(stmt)
+    if result.rowcount == 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot remove the last owner"
         )
-        if owner_count.scalar() == 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Cannot remove the last owner"
-            )
 
-    await db.delete(membership)
-    await db.flush()
+    await db.commit()
+    invalidate_membership_cache(membership.user_id, membership.organization_id)
 
     return None
@@ -9,11 +9,14 @@ from typing import Optional
 from math import ceil
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, or_
+from sqlalchemy import select, func, or_, and_, tuple_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 
 from app.db.base import get_db
 from app.core.deps import get_current_user
+from app.core.permissions import ADMIN_ROLES, get_effective_role, invalidate_membership_cache
+from app.core.pagination import encode_cursor, decode_cursor, cursor_datetime
 from app.models.user import User
 from app.models.organization import Organization
 from app.models.org_membership import OrgMembership, OrgMembershipRole
@@ -25,8 +28,16 @@ from app.schemas.organization_v1 import (
 router = APIRouter()
 
 
-def org_to_response(org: Organization, membership: Optional[OrgMembership] = None) -> OrganizationV1Response:
-    """Convert Organization model to OrganizationV1Response schema."""
+def org_to_response(
+    org: Organization,
+    membership: Optional[OrgMembership] = None,
+    user_role: Optional[str] = None
+) -> OrganizationV1Response:
+    """
+    Convert Organization model to OrganizationV1Response schema.
+
+    The user's role comes from `membership` when given, else `user_role`.
+    """
     return OrganizationV1Response(
         id=org.id,
         name=org.name,
@@ -36,7 +47,7 @@ def org_to_response(org: Organization, membership: Optional[OrgMembership] = Non
         owner_id=org.owner_id,
         created=org.created,
         updated=org.updated,
-        user_role=membership.role.value if membership else None,
+        user_role=membership.role.value if membership else user_role,
     )
 
 
@@ -63,22 +74,13 @@ async def check_org_access(
     require_admin: bool = False
 ) -> bool:
     """Check if user has access to the organization."""
-    membership = await get_user_org_membership(org_id, user, db)
-
-    if membership is None:
-        # Check if user is owner
-        result = await db.execute(
-            select(Organization).where(
-                Organization.id == org_id,
-                Organization.owner_id == user.id
-            )
-        )
-        if result.scalar_one_or_none():
-            return True
+    role = await get_effective_role(db, user.id, org_id)
+
+    if role is None:
         return False
 
     if require_admin:
-        return membership.role in [OrgMembershipRole.OWNER, OrgMembershipRole.ADMIN]
+        return role in ADMIN_ROLES
 
     return True
 
@@ -88,72 +90,90 @@ async def list_organizations(
     page: int = Query(1, ge=1),
     perPage: int = Query(30, ge=1, le=500),
     search: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="nextCursor from the previous page"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     List organizations the user has access to.
     Returns organizations where user is owner or member.
+
+    Pass `cursor` for keyset pagination; cursor requests skip the total count.
     """
-    # Get orgs where user is member or owner
-    member_subquery = select(OrgMembership.organization_id).where(
+    # Get orgs where user is member or owner, with the user's role in each
+    membership_join = and_(
+        OrgMembership.organization_id == Organization.id,
         OrgMembership.user_id == current_user.id,
         OrgMembership.is_active == True
     )
-
-    query = select(Organization).where(
-        or_(
-            Organization.owner_id == current_user.id,
-            Organization.id.in_(member_subquery)
-        )
-    )
+    filters = [or_(
+        Organization.owner_id == current_user.id,
+        OrgMembership.id.is_not(None)
+    )]
 
     # Apply search filter
     if search:
-        query = query.where(
+        filters.append(
             Organization.name.ilike(f"%{search}%") |
             Organization.description.ilike(f"%{search}%")
         )
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total_items = total_result.scalar() or 0
-
-    # Apply pagination and sorting
-    query = query.order_by(Organization.created.desc())
-    query = query.offset((page - 1) * perPage).limit(perPage)
-
-    # Execute query
-    result = await db.execute(query)
-    organizations = result.scalars().all()
-
-    # Get memberships for each org to include user_role
-    items = []
-    for org in organizations:
-        membership = await get_user_org_membership(org.id, current_user, db)
-        # If no membership but user is owner, create a virtual owner membership
-        if not membership and org.owner_id == current_user.id:
-            items.append(OrganizationV1Response(
-                id=org.id,
-                name=org.name,
-                description=org.description,
-                logo=org.logo,
-                settings=org.settings,
-                owner_id=org.owner_id,
-                created=org.created,
-                updated=org.updated,
-                user_role="owner",
-            ))
+    query = (
+        select(Organization, OrgMembership.role)
+        .outerjoin(OrgMembership, membership_join)
+        .where(*filters)
+    )
+
+    total_items = total_pages = None
+    if cursor:
+        key = decode_cursor(cursor, created=str, id=str)
+        created = cursor_datetime(key["created"])
+        query = query.where(tuple_(Organization.created, Organization.id) < tuple_(created, key["id"]))
+    else:
+        # The window count is evaluated before OFFSET/LIMIT, so every row
+        # carries the filtered total
+        query = query.add_columns(func.count().over().label("total"))
+        query = query.offset((page - 1) * perPage)
+
+    # Fetch one extra row to learn whether another page follows
+    query = query.order_by(Organization.created.desc(), Organization.id.desc()).limit(perPage + 1)
+    rows = (await db.execute(query)).all()
+    has_more = len(rows) > perPage
+    rows = rows[:perPage]
+
+    if not cursor:
+        if rows:
+            total_items = rows[0].total
         else:
-            items.append(org_to_response(org, membership))
+            # Empty page: no rows to read the total from
+            count_query = (
+                select(func.count())
+                .select_from(Organization)
+                .outerjoin(OrgMembership, membership_join)
+                .where(*filters)
+            )
+            total_items = await db.scalar(count_query) or 0
+        total_pages = ceil(total_items / perPage) if total_items > 0 else 1
+
+    next_cursor = None
+    if has_more:
+        last = rows[-1].Organization
+        next_cursor = encode_cursor({"created": last.created.isoformat(), "id": last.id})
+
+    # Rows without a membership are orgs the user owns: report a virtual owner role
+    items = [
+        org_to_response(row.Organization, user_role=row.role.value if row.role else "owner")
+        for row in rows
+    ]
 
     return OrganizationV1ListResponse(
         page=page,
         perPage=perPage,
         totalItems=total_items,
-        totalPages=ceil(total_items / perPage) if total_items > 0 else 1,
-        items=items
+        totalPages=total_pages,
+        items=items,
+        nextCursor=next_cursor,
+        hasMore=has_more
     )
 
 
@@ -167,39 +187,33 @@ async def create_organization(
     Create a new organization.
     The current user becomes the owner.
     """
-    # Check if name exists
-    result = await db.execute(
-        select(Organization).where(Organization.name == org_data.name)
-    )
-    existing_org = result.scalar_one_or_none()
-
-    if existing_org:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Organization name already exists"
-        )
-
-    # Create organization
     org = Organization(
         name=org_data.name,
         description=org_data.description,
         settings=org_data.settings,
         owner_id=current_user.id,
     )
-
-    db.add(org)
-    await db.flush()
-
-    # Create owner membership
     membership = OrgMembership(
-        organization_id=org.id,
+        organization=org,
         user_id=current_user.id,
         role=OrgMembershipRole.OWNER,
         is_active=True,
         joined_at=datetime.now(timezone.utc),
     )
-    db.add(membership)
-    await db.flush()
+
+    # Both rows go out in one flush; the unique index on name rejects
+    # duplicates, and the savepoint keeps the transaction usable if it does
+    try:
+        async with db.begin_nested():
+            db.add_all([org, membership])
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Organization name already exists"
+        )
+
+    await db.commit()
+    invalidate_membership_cache(current_user.id, org.id)
 
     return org_to_response(org, membership)
 
@@ -280,29 +294,26 @@ async def update_organization(
             detail="Not authorized to update this organization"
         )
 
-    # Update fields
-    if org_data.name is not None:
-        # Check if new name exists
-        if org_data.name != org.name:
-            name_result = await db.execute(
-                select(Organization).where(Organization.name == org_data.name)
-            )
-            if name_result.scalar_one_or_none():
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Organization name already exists"
-                )
-        org.name = org_data.name
-
-    if org_data.description is not None:
-        org.description = org_data.description
-    if org_data.settings is not None:
-        org.settings = org_data.settings
-    if org_data.logo is not None:
-        org.logo = org_data.logo
-
-    org.updated = datetime.now(timezone.utc)
-    await db.flush()
+    # Update fields; the unique index on name rejects a taken name
+    try:
+        async with db.begin_nested():
+            if org_data.name is not None:
+                org.name = org_data.name
+            if org_data.description is not None:
+                org.description = org_data.description
+            if org_data.settings is not None:
+                org.settings = org_data.settings
+            if org_data.logo is not None:
+                org.logo = org_data.logo
+            org.updated = datetime.now(timezone.utc)
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Organization name already exists"
+        )
+
+    await db.commit()
+    invalidate_membership_cache(organization_id=org_id)
 
     membership = await get_user_org_membership(org_id, current_user, db)
     return org_to_response(org, membership)
@@ -335,6 +346,7 @@ async def delete_organization(
         )
 
     await db.delete(org)
-    await db.flush()
+    await db.commit()
+    invalidate_membership_cache(organization_id=org_id)
 
     return None
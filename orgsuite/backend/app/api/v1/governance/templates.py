@@ -15,8 +15,8 @@ from app.core.deps import get_current_user
 from app.models.user import User
 from app.models.meeting_template import MeetingTemplate, OrgType
 from app.models.meeting import MeetingType
-from app.models.org_membership import OrgMembership, OrgMembershipRole
-from app.core.permissions import require_min_role, OrgMembershipRole as RRole
+from app.models.org_membership import OrgMembership
+from app.core.permissions import ADMIN_ROLES, require_min_role, OrgMembershipRole as RRole
 from app.schemas.meeting_template import (
     MeetingTemplateCreate,
     MeetingTemplateUpdate,
@@ -53,20 +53,19 @@ async def check_org_access(
     require_admin: bool = False
 ) -> bool:
     """Check if user has access to the organization."""
-    result = await db.execute(
-        select(OrgMembership).where(
+    role = await db.scalar(
+        select(OrgMembership.role).where(
             OrgMembership.organization_id == org_id,
             OrgMembership.user_id == user.id,
             OrgMembership.is_active == True
         )
     )
-    membership = result.scalar_one_or_none()
 
-    if membership is None:
+    if role is None:
         return False
 
     if require_admin:
-        return membership.role in [OrgMembershipRole.OWNER, OrgMembershipRole.ADMIN]
+        return role in ADMIN_ROLES
 
     return True
 
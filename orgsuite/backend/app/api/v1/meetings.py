@@ -1,7 +1,7 @@
 """
 Meeting endpoints - compatible with PocketBase SDK.
 """
-import uuid
+import os
 from datetime import datetime, timezone
 from typing import Optional
 from math import ceil
@@ -28,7 +28,7 @@ router = APIRouter()
 
 def generate_jitsi_room() -> str:
     """Generate a unique Jitsi room name."""
-    return f"orgmeet-{uuid.uuid4().hex[:12]}"
+    return f"orgmeet-{os.urandom(6).hex()}"
 
 
 def meeting_to_response(meeting: Meeting, expand: Optional[dict] = None) -> MeetingResponse:
@@ -11,6 +11,7 @@ from sqlalchemy.orm import selectinload
 
 from app.db.base import get_db
 from app.core.deps import get_current_user, get_current_user_optional
+from app.core.permissions import invalidate_membership_cache
 from app.models.user import User
 from app.models.organization import Organization
 from app.models.org_membership import OrgMembership, OrgMembershipRole
@@ -157,7 +158,8 @@ async def create_organization(
         joined_at=datetime.now(timezone.utc),
     )
     db.add(membership)
-    await db.flush()
+    await db.commit()
+    invalidate_membership_cache(current_user.id, org.id)
 
     return org_to_response(org)
 
@@ -256,7 +258,8 @@ async def update_organization(
         org.settings = org_data.settings
 
     org.updated = datetime.now(timezone.utc)
-    await db.flush()
+    await db.commit()
+    invalidate_membership_cache(organization_id=org_id)
 
     return org_to_response(org)
 
@@ -288,6 +291,7 @@ async def delete_organization(
         )
 
     await db.delete(org)
-    await db.flush()
+    await db.commit()
+    invalidate_membership_cache(organization_id=org_id)
 
     return None
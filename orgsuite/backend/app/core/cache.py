@@ -0,0 +1,57 @@
+"""
+In-process TTL cache for hot, rarely-changing lookups.
+
+The API runs as a single uvicorn worker, so an in-process cache with
+explicit invalidation on writes stays consistent across requests.
+"""
+import time
+from typing import Any, Callable, Hashable
+
+
+class TTLCache:
+    """Dict-backed cache whose entries expire `ttl` seconds after being set."""
+
+    def __init__(self, ttl: float, maxsize: int = 10000):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or `default` if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self._data.pop(key, None)
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache a value for `ttl` seconds."""
+        if len(self._data) >= self.maxsize and key not in self._data:
+            self._evict()
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def delete(self, *keys: Hashable) -> None:
+        """Drop the given keys if present."""
+        for key in keys:
+            self._data.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every key for which `predicate(key)` is true."""
+        for key in [k for k in self._data if predicate(k)]:
+            del self._data[key]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def _evict(self) -> None:
+        """Drop expired entries, or the oldest entry if none have expired."""
+        now = time.monotonic()
+        expired = [k for k, (expires_at, _) in self._data.items() if expires_at <= now]
+        if expired:
+            for key in expired:
+                del self._data[key]
+        else:
+            self._data.pop(next(iter(self._data)))
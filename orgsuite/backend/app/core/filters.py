@@ -0,0 +1,19 @@
+"""
+Parsing for the simple PocketBase filter strings sent by the frontend SDK.
+
+Only `field = 'value'` clauses joined with `&&` are understood; each router
+maps the field names it supports to columns.
+"""
+import re
+from typing import Optional
+
+
+# Matches `field = 'value'` clauses (quotes optional) in a PocketBase filter
+_FILTER_CLAUSE_RE = re.compile(r"""(\w+)\s*=\s*['"]?([\w-]+)['"]?""")
+
+
+def parse_pocketbase_filter(filter: Optional[str]) -> dict[str, str]:
+    """Parse a simple PocketBase filter like "organization='x' && meeting='y'"."""
+    if not filter:
+        return {}
+    return dict(_FILTER_CLAUSE_RE.findall(filter))
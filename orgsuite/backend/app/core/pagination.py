@@ -0,0 +1,55 @@
+"""
+Opaque cursors for keyset pagination.
+
+A cursor is the URL-safe base64 encoding of a small JSON object holding the
+sort key of the last row on the previous page. Clients pass it back as-is.
+"""
+import base64
+from datetime import datetime
+from typing import Any
+
+import orjson
+from fastapi import HTTPException, status
+
+
+def encode_cursor(key: dict[str, Any]) -> str:
+    """Encode a sort key as an opaque cursor string."""
+    return base64.urlsafe_b64encode(orjson.dumps(key)).decode().rstrip("=")
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid cursor"
+    )
+
+
+def decode_cursor(cursor: str, **fields: type) -> dict[str, Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    `fields` maps each required key to its expected JSON type, e.g.
+    ``decode_cursor(cursor, created=str, id=str)``. Raises 400 if the cursor
+    is malformed, lacks a field or holds a value of the wrong type, so a
+    tampered cursor never reaches the database.
+    """
+    try:
+        key = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        key = None
+    if not isinstance(key, dict):
+        raise _invalid_cursor()
+    for field, expected in fields.items():
+        value = key.get(field)
+        # bool is a subclass of int, but never a valid sort key
+        if not isinstance(value, expected) or isinstance(value, bool):
+            raise _invalid_cursor()
+    return key
+
+
+def cursor_datetime(value: Any) -> datetime:
+    """Parse an ISO timestamp taken from a decoded cursor, raising 400 if invalid."""
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise _invalid_cursor()
@@ -2,14 +2,75 @@
 from typing import Iterable, Sequence, Optional
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, and_, exists
 
+from app.core.cache import TTLCache
 from app.models.org_membership import OrgMembership, OrgMembershipRole
 from app.models.organization import Organization
 from app.models.meeting import Meeting
 from app.models.committee import Committee
 
 
+# Roles allowed to administer an organization
+ADMIN_ROLES = frozenset({OrgMembershipRole.ADMIN, OrgMembershipRole.OWNER})
+
+_ROLE_RANKS = {
+    role: rank
+    for rank, role in enumerate(
+        [OrgMembershipRole.VIEWER, OrgMembershipRole.MEMBER, OrgMembershipRole.ADMIN, OrgMembershipRole.OWNER]
+    )
+}
+
+# (user_id, organization_id) -> role, for existing memberships only.
+# Misses are never cached so newly added members are not denied.
+_membership_role_cache = TTLCache(ttl=30.0)
+
+# (user_id, organization_id) -> effective role (owner or active membership),
+# for users with access only; misses are never cached.
+_effective_role_cache = TTLCache(ttl=30.0)
+
+# (user_id, page, perPage, cursor) -> rendered body of the user's own
+# membership list (GET /org-memberships/my), which embeds organization details
+membership_list_cache = TTLCache(ttl=60.0)
+
+# Bumped on every membership list invalidation. A list read before an
+# invalidation is not cached, as it may predate the committed change.
+_membership_list_generation = 0
+
+
+def membership_list_generation() -> int:
+    """Return the current membership list cache generation."""
+    return _membership_list_generation
+
+
+def invalidate_membership_cache(
+    user_id: Optional[str] = None,
+    organization_id: Optional[str] = None,
+) -> None:
+    """
+    Drop cached roles for a user, an organization, or a single membership,
+    along with the affected users' cached membership lists.
+
+    Call after the change is committed, so the caches cannot be refilled
+    from the old rows.
+    """
+    global _membership_list_generation
+    for cache in (_membership_role_cache, _effective_role_cache):
+        if user_id is not None and organization_id is not None:
+            cache.delete((user_id, organization_id))
+        elif user_id is not None:
+            cache.delete_where(lambda key: key[0] == user_id)
+        elif organization_id is not None:
+            cache.delete_where(lambda key: key[1] == organization_id)
+
+    _membership_list_generation += 1
+    if user_id is not None:
+        membership_list_cache.delete_where(lambda key: key[0] == user_id)
+    elif organization_id is not None:
+        # Any member's list may include the organization
+        membership_list_cache.clear()
+
+
 async def get_membership(db: AsyncSession, user_id: str, organization_id: str):
     result = await db.execute(
         select(OrgMembership).where(
@@ -20,6 +81,11 @@ async def get_membership(db: AsyncSession, user_id: str, organization_id: str):
     return result.scalar_one_or_none()
 
 
+async def org_exists(db: AsyncSession, organization_id: str) -> bool:
+    """Return True if the organization exists, without loading the row."""
+    return bool(await db.scalar(select(exists().where(Organization.id == organization_id))))
+
+
 async def ensure_org_exists(db: AsyncSession, organization_id: str):
     result = await db.execute(select(Organization).where(Organization.id == organization_id))
     org = result.scalar_one_or_none()
@@ -28,9 +94,76 @@ async def ensure_org_exists(db: AsyncSession, organization_id: str):
     return org
 
 
+async def resolve_org_access(
+    db: AsyncSession, user_id: str, organization_id: str
+) -> tuple[Optional[str], Optional[OrgMembershipRole]]:
+    """
+    Load an organization's owner and the user's role in it with a single query.
+
+    Returns (owner_id, role); role is None when the user has no membership
+    row. Raises 404 if the organization does not exist.
+    """
+    result = await db.execute(
+        select(Organization.owner_id, OrgMembership.role)
+        .outerjoin(
+            OrgMembership,
+            and_(
+                OrgMembership.organization_id == Organization.id,
+                OrgMembership.user_id == user_id,
+            ),
+        )
+        .where(Organization.id == organization_id)
+    )
+    row = result.first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Organization not found")
+    return row.owner_id, row.role
+
+
+async def get_effective_role(
+    db: AsyncSession, user_id: str, organization_id: str
+) -> Optional[OrgMembershipRole]:
+    """
+    Return the user's effective role in an organization with a single query.
+
+    The organization owner is OWNER regardless of membership rows; otherwise
+    the role of the user's active membership, or None if the user has no
+    access (or the organization does not exist). Granted roles are cached
+    for a short TTL.
+    """
+    key = (user_id, organization_id)
+    cached_role = _effective_role_cache.get(key)
+    if cached_role is not None:
+        return cached_role
+
+    result = await db.execute(
+        select(Organization.owner_id, OrgMembership.role)
+        .outerjoin(
+            OrgMembership,
+            and_(
+                OrgMembership.organization_id == Organization.id,
+                OrgMembership.user_id == user_id,
+                OrgMembership.is_active == True,
+            ),
+        )
+        .where(Organization.id == organization_id)
+    )
+    row = result.first()
+    if row is None:
+        return None
+    role = OrgMembershipRole.OWNER if row.owner_id == user_id else row.role
+    if role is not None:
+        _effective_role_cache.set(key, role)
+    return role
+
+
 def _role_rank(role: OrgMembershipRole) -> int:
-    order = [OrgMembershipRole.VIEWER, OrgMembershipRole.MEMBER, OrgMembershipRole.ADMIN, OrgMembershipRole.OWNER]
-    return order.index(role)
+    return _ROLE_RANKS[role]
+
+
+def has_min_role(role: OrgMembershipRole, minimum: OrgMembershipRole) -> bool:
+    """Return True if role rank >= minimum."""
+    return _role_rank(role) >= _role_rank(minimum)
 
 
 async def require_role(
@@ -42,16 +175,15 @@ async def require_role(
     """Ensure the user has any role in allowed sequence. Raises 403 otherwise.
     Special case: if no membership rows exist yet and user is the org.owner, allow.
     """
-    org = await ensure_org_exists(db, organization_id)
-    membership = await get_membership(db, user_id, organization_id)
-    if membership is None:
+    owner_id, role = await resolve_org_access(db, user_id, organization_id)
+    if role is None:
         # Allow implicit owner bootstrap
-        if getattr(org, "owner_id", None) == user_id and OrgMembershipRole.OWNER in allowed:
-            return membership  # None, but owner accepted
+        if owner_id == user_id and OrgMembershipRole.OWNER in allowed:
+            return None  # owner accepted without a membership row
         raise HTTPException(status_code=403, detail="Not a member of organization")
-    if membership.role not in allowed:
+    if role not in allowed:
         raise HTTPException(status_code=403, detail="Insufficient role")
-    return membership
+    return OrgMembership(user_id=user_id, organization_id=organization_id, role=role)
 
 
 async def require_min_role(
@@ -60,22 +192,33 @@ async def require_min_role(
     organization_id: str,
     minimum: OrgMembershipRole,
 ) -> OrgMembership:
-    """Ensure membership role rank >= minimum."""
-    org = await ensure_org_exists(db, organization_id)
-    membership = await get_membership(db, user_id, organization_id)
-    if membership is None:
-        if getattr(org, "owner_id", None) == user_id and minimum == OrgMembershipRole.OWNER:
-            return membership
+    """
+    Ensure membership role rank >= minimum.
+
+    Roles of existing memberships are cached for a short TTL. The returned
+    OrgMembership is a transient carrier of user, org and role only.
+    """
+    cached_role = _membership_role_cache.get((user_id, organization_id))
+    if cached_role is not None:
+        if _role_rank(cached_role) < _role_rank(minimum):
+            raise HTTPException(status_code=403, detail="Insufficient role")
+        return OrgMembership(user_id=user_id, organization_id=organization_id, role=cached_role)
+
+    owner_id, role = await resolve_org_access(db, user_id, organization_id)
+    if role is None:
+        if owner_id == user_id and minimum == OrgMembershipRole.OWNER:
+            return None
         raise HTTPException(status_code=403, detail="Not a member of organization")
-    if _role_rank(membership.role) < _role_rank(minimum):
+    _membership_role_cache.set((user_id, organization_id), role)
+    if _role_rank(role) < _role_rank(minimum):
         raise HTTPException(status_code=403, detail="Insufficient role")
-    return membership
+    return OrgMembership(user_id=user_id, organization_id=organization_id, role=role)
 
 
 def is_admin_or_owner(membership: OrgMembership | None) -> bool:
     if membership is None:
         return False
-    return membership.role in (OrgMembershipRole.ADMIN, OrgMembershipRole.OWNER)
+    return membership.role in ADMIN_ROLES
 
 
 async def resolve_meeting_org_id(db: AsyncSession, meeting: Meeting) -> Optional[str]:
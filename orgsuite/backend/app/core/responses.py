@@ -0,0 +1,73 @@
+"""
+Fast response classes: orjson-rendered JSON for hot list endpoints and a
+zero-copy capable file response for downloads.
+"""
+import os
+from decimal import Decimal
+from typing import Any
+
+import anyio
+import orjson
+from fastapi.responses import FileResponse, JSONResponse
+from pydantic import BaseModel
+from starlette.types import Receive, Scope, Send
+
+
+def orjson_default(obj: Any) -> Any:
+    """Serialize types orjson does not handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, Decimal):
+        # Match Pydantic's JSON output for Decimal fields
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Returning this from an endpoint bypasses FastAPI's response_model
+    validation and jsonable_encoder pass. datetime, UUID and Enum values
+    are serialized natively; Pydantic models and Decimal via orjson_default.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=orjson_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z,
+        )
+
+
+class ZeroCopyFileResponse(FileResponse):
+    """
+    File response that lets the ASGI server send the file with sendfile(2).
+
+    When the server advertises the `http.response.zerocopysend` extension,
+    full (non-range) GET responses hand the open file to the server instead
+    of reading it through the event loop. Otherwise, including for range
+    and HEAD requests, this behaves exactly like FileResponse, which itself
+    uses `http.response.pathsend` when available.
+    """
+    chunk_size = 1024 * 1024  # fallback read size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or "http.response.zerocopysend" not in scope.get("extensions", {})
+            or scope["method"].upper() != "GET"
+            or any(name == b"range" for name, _ in scope.get("headers", []))
+        ):
+            await super().__call__(scope, receive, send)
+            return
+
+        if self.stat_result is None:
+            self.set_stat_headers(await anyio.to_thread.run_sync(os.stat, self.path))
+
+        with open(self.path, "rb") as file:
+            await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+            await send({"type": "http.response.zerocopysend", "file": file, "more_body": False})
+        if self.background is not None:
+            await self.background()
@@ -4,6 +4,7 @@ Database base configuration and utilities.
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy import MetaData
+from sqlalchemy.dialects import postgresql, sqlite
 from app.core.config import settings
 
 # Naming convention for constraints
@@ -23,11 +24,21 @@ class Base(DeclarativeBase):
     metadata = metadata
 
 
+# Pool tuning applies to the PostgreSQL queue pool; SQLite picks its own pool
+_pool_options = {} if settings.DATABASE_URL.startswith("sqlite") else {
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_timeout": settings.DB_POOL_TIMEOUT,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+    "pool_pre_ping": True,
+}
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
-    future=True
+    future=True,
+    **_pool_options
 )
 
 # Create async session factory
@@ -51,6 +62,17 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+def upsert_insert(db: AsyncSession, table):
+    """
+    Return a dialect-specific INSERT construct that supports ON CONFLICT.
+
+    PostgreSQL is used in production; SQLite backs the test suite.
+    """
+    if db.bind.dialect.name == "sqlite":
+        return sqlite.insert(table)
+    return postgresql.insert(table)
+
+
 async def init_db() -> None:
     """Initialize database tables."""
     async with engine.begin() as conn:
@@ -0,0 +1,29 @@
+"""
+Add composite indexes for activity list queries
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+# revision identifiers
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create composite indexes on activities."""
+    op.create_index('ix_activities_org_created', 'activities', ['organization_id', 'created'])
+    op.create_index('ix_activities_org_opportunity', 'activities', ['organization_id', 'opportunity_id'])
+    op.create_index('ix_activities_org_type', 'activities', ['organization_id', 'type'])
+
+
+def downgrade() -> None:
+    """Drop composite indexes on activities."""
+    op.drop_index('ix_activities_org_type', table_name='activities')
+    op.drop_index('ix_activities_org_opportunity', table_name='activities')
+    op.drop_index('ix_activities_org_created', table_name='activities')
@@ -0,0 +1,31 @@
+"""
+Add composite index for metric list queries
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+# revision identifiers
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace ix_metrics_org_archived with an index that also covers the list ordering."""
+    op.create_index(
+        'ix_metrics_org_archived_order',
+        'metrics',
+        ['organization_id', 'is_archived', 'sort_order', 'name'],
+    )
+    op.drop_index('ix_metrics_org_archived', table_name='metrics')
+
+
+def downgrade() -> None:
+    """Restore ix_metrics_org_archived."""
+    op.create_index('ix_metrics_org_archived', 'metrics', ['organization_id', 'is_archived'])
+    op.drop_index('ix_metrics_org_archived_order', table_name='metrics')
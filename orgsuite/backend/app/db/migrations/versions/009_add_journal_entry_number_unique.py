@@ -0,0 +1,62 @@
+"""
+Add unique index on journal entry numbers per organization
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+# revision identifiers
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Renumber duplicate entry numbers, then enforce uniqueness per organization."""
+    # Numbers used to be COUNT + 1, which repeats after a delete or under
+    # concurrent creates. Keep the oldest entry of each duplicate group and
+    # give the rest fresh JE- numbers above the organization's highest one.
+    op.execute("""
+        WITH ranked AS (
+            SELECT id, organization_id, created,
+                   row_number() OVER (
+                       PARTITION BY organization_id, entry_number ORDER BY created, id
+                   ) AS dup_rank
+            FROM journal_entries
+            WHERE entry_number IS NOT NULL
+        ),
+        renumbered AS (
+            SELECT id, organization_id,
+                   row_number() OVER (PARTITION BY organization_id ORDER BY created, id) AS seq
+            FROM ranked
+            WHERE dup_rank > 1
+        ),
+        highest AS (
+            SELECT organization_id,
+                   max(CASE WHEN entry_number ~ '^JE-[0-9]+$'
+                            THEN substring(entry_number FROM 4)::bigint ELSE 0 END) AS max_number
+            FROM journal_entries
+            GROUP BY organization_id
+        )
+        UPDATE journal_entries AS je
+        SET entry_number = 'JE-' || lpad(n.number, greatest(6, length(n.number)), '0')
+        FROM renumbered AS r
+        JOIN highest AS h ON h.organization_id = r.organization_id
+        CROSS JOIN LATERAL (SELECT (h.max_number + r.seq)::text AS number) AS n
+        WHERE je.id = r.id
+    """)
+    op.create_index(
+        'uq_journal_entries_org_entry_number',
+        'journal_entries',
+        ['organization_id', 'entry_number'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop uq_journal_entries_org_entry_number."""
+    op.drop_index('uq_journal_entries_org_entry_number', table_name='journal_entries')
@@ -0,0 +1,37 @@
+"""
+Add composite indexes for file and journal entry list queries
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+# revision identifiers
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create composite indexes matching the list filters and ordering."""
+    op.create_index('ix_files_org_created', 'files', ['organization_id', 'created'])
+    op.create_index(
+        'ix_journal_entries_org_date',
+        'journal_entries',
+        ['organization_id', 'entry_date', 'created'],
+    )
+    op.create_index(
+        'ix_journal_entries_org_status_date',
+        'journal_entries',
+        ['organization_id', 'status', 'entry_date', 'created'],
+    )
+
+
+def downgrade() -> None:
+    """Drop the list indexes."""
+    op.drop_index('ix_journal_entries_org_status_date', table_name='journal_entries')
+    op.drop_index('ix_journal_entries_org_date', table_name='journal_entries')
+    op.drop_index('ix_files_org_created', table_name='files')
@@ -0,0 +1,31 @@
+"""
+Add partial index for active account lookups
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-17
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index active accounts by (organization_id, id) for journal line validation."""
+    op.create_index(
+        'ix_accounts_org_id_active',
+        'accounts',
+        ['organization_id', 'id'],
+        postgresql_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    """Drop ix_accounts_org_id_active."""
+    op.drop_index('ix_accounts_org_id_active', table_name='accounts')
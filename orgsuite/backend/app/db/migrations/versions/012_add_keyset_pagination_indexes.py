@@ -0,0 +1,34 @@
+"""
+Add composite indexes for keyset pagination of meetings and agenda items
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+# revision identifiers
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create indexes matching the list sort keys."""
+    op.create_index(
+        'ix_agenda_items_meeting_order_id',
+        'agenda_items',
+        ['meeting_id', 'order', 'id'],
+    )
+    # (start_time, id) also serves every lookup on start_time alone
+    op.create_index('ix_meetings_start_time_id', 'meetings', ['start_time', 'id'])
+    op.drop_index('ix_meetings_start_time', table_name='meetings')
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination indexes and restore ix_meetings_start_time."""
+    op.create_index('ix_meetings_start_time', 'meetings', ['start_time'])
+    op.drop_index('ix_meetings_start_time_id', table_name='meetings')
+    op.drop_index('ix_agenda_items_meeting_order_id', table_name='agenda_items')
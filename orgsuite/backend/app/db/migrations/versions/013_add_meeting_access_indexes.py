@@ -0,0 +1,27 @@
+"""
+Add indexes for looking up a user's meetings
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+# revision identifiers
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index meetings by creator and participants by user."""
+    op.create_index('ix_meetings_created_by_id', 'meetings', ['created_by_id'])
+    op.create_index('ix_participants_user_id', 'participants', ['user_id'])
+
+
+def downgrade() -> None:
+    """Drop the meeting access indexes."""
+    op.drop_index('ix_participants_user_id', table_name='participants')
+    op.drop_index('ix_meetings_created_by_id', table_name='meetings')
@@ -0,0 +1,37 @@
+"""
+Add full-text search vector and trigram indexes for meeting search
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+# revision identifiers
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add meetings.search_vec with a GIN index, plus trigram indexes on title and description."""
+    op.execute(
+        "ALTER TABLE meetings ADD COLUMN search_vec tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('simple', "
+        "coalesce(title, '') || ' ' || coalesce(description, ''))) STORED"
+    )
+    op.execute("CREATE INDEX ix_meetings_search_vec ON meetings USING GIN (search_vec)")
+    # Partial-word matches on title and description
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE INDEX ix_meetings_title_trgm ON meetings USING GIN (title gin_trgm_ops)")
+    op.execute("CREATE INDEX ix_meetings_description_trgm ON meetings USING GIN (description gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    """Drop the meeting search indexes and column."""
+    op.drop_index('ix_meetings_description_trgm', table_name='meetings')
+    op.drop_index('ix_meetings_title_trgm', table_name='meetings')
+    op.drop_index('ix_meetings_search_vec', table_name='meetings')
+    op.drop_column('meetings', 'search_vec')
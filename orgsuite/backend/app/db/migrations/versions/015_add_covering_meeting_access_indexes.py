@@ -0,0 +1,31 @@
+"""
+Make the meeting access indexes cover the meeting id
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+# revision identifiers
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace the single-column access indexes with (key, meeting id) ones."""
+    op.drop_index('ix_participants_user_id', table_name='participants')
+    op.create_index('ix_participants_user_meeting', 'participants', ['user_id', 'meeting_id'])
+    op.drop_index('ix_meetings_created_by_id', table_name='meetings')
+    op.create_index('ix_meetings_created_by_id', 'meetings', ['created_by_id', 'id'])
+
+
+def downgrade() -> None:
+    """Restore the single-column access indexes."""
+    op.drop_index('ix_meetings_created_by_id', table_name='meetings')
+    op.create_index('ix_meetings_created_by_id', 'meetings', ['created_by_id'])
+    op.drop_index('ix_participants_user_meeting', table_name='participants')
+    op.create_index('ix_participants_user_id', 'participants', ['user_id'])
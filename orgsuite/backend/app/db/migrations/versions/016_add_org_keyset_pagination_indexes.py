@@ -0,0 +1,35 @@
+"""
+Add indexes for keyset pagination of organizations and memberships
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+# revision identifiers
+revision = '016'
+down_revision = '015'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the (..., created, id) indexes used by the cursor-paginated lists."""
+    op.create_index('ix_organizations_created_id', 'organizations', ['created', 'id'])
+    op.create_index(
+        'ix_org_memberships_user_active_created', 'org_memberships',
+        ['user_id', 'is_active', 'created', 'id']
+    )
+    op.create_index(
+        'ix_org_memberships_org_active_role_created', 'org_memberships',
+        ['organization_id', 'is_active', 'role', 'created', 'id']
+    )
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination indexes."""
+    op.drop_index('ix_org_memberships_org_active_role_created', table_name='org_memberships')
+    op.drop_index('ix_org_memberships_user_active_created', table_name='org_memberships')
+    op.drop_index('ix_organizations_created_id', table_name='organizations')
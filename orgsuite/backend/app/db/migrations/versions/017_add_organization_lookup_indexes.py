@@ -0,0 +1,35 @@
+"""
+Add owner and search indexes on organizations
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+# revision identifiers
+revision = '017'
+down_revision = '016'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index organizations.owner_id, plus trigram indexes for the ILIKE search."""
+    op.create_index('ix_organizations_owner_id', 'organizations', ['owner_id'])
+    # list_organizations matches name OR description, so both need an index
+    # for the planner to use a BitmapOr instead of a sequential scan
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE INDEX ix_organizations_name_trgm ON organizations USING GIN (name gin_trgm_ops)")
+    op.execute(
+        "CREATE INDEX ix_organizations_description_trgm ON organizations "
+        "USING GIN (description gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Drop the organization lookup indexes."""
+    op.drop_index('ix_organizations_description_trgm', table_name='organizations')
+    op.drop_index('ix_organizations_name_trgm', table_name='organizations')
+    op.drop_index('ix_organizations_owner_id', table_name='organizations')
@@ -3,7 +3,7 @@ Chart of Accounts model for double-entry bookkeeping.
 """
 from typing import Optional, TYPE_CHECKING
 from enum import Enum
-from sqlalchemy import String, Text, ForeignKey, Boolean, Integer, Enum as SQLEnum
+from sqlalchemy import String, Text, ForeignKey, Boolean, Integer, Index, text, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import BaseModel
 
@@ -60,6 +60,10 @@ class Account(BaseModel):
     for double-entry bookkeeping.
     """
     __tablename__ = "accounts"
+    __table_args__ = (
+        # Journal line validation looks up active accounts by id within an org
+        Index("ix_accounts_org_id_active", "organization_id", "id", postgresql_where=text("is_active")),
+    )
 
     # Organization relation
     organization_id: Mapped[str] = mapped_column(
@@ -7,7 +7,7 @@ such as calls, emails, meetings, notes, and tasks.
 from typing import Optional, TYPE_CHECKING
 from enum import Enum
 from datetime import datetime
-from sqlalchemy import String, Text, ForeignKey, DateTime, Enum as SQLEnum
+from sqlalchemy import String, Text, ForeignKey, DateTime, Index, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import BaseModel
 
@@ -35,6 +35,12 @@ class Activity(BaseModel):
     calls, emails, meetings, notes, and tasks.
     """
     __tablename__ = "activities"
+    __table_args__ = (
+        # Backs list_activities: WHERE organization_id = ? ORDER BY created DESC
+        Index("ix_activities_org_created", "organization_id", "created"),
+        Index("ix_activities_org_opportunity", "organization_id", "opportunity_id"),
+        Index("ix_activities_org_type", "organization_id", "type"),
+    )
 
     # Organization relation
     organization_id: Mapped[str] = mapped_column(
@@ -2,7 +2,7 @@
 Agenda item model.
 """
 from typing import Optional, TYPE_CHECKING
-from sqlalchemy import String, Text, Integer, ForeignKey, Enum
+from sqlalchemy import String, Text, Integer, ForeignKey, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 from app.models.base import BaseModel
@@ -34,6 +34,10 @@ class AgendaItemStatus(str, enum.Enum):
 class AgendaItem(BaseModel):
     """Agenda item within a meeting."""
     __tablename__ = "agenda_items"
+    __table_args__ = (
+        # list_agenda_items: keyset pagination on (order, id) within a meeting
+        Index("ix_agenda_items_meeting_order_id", "meeting_id", "order", "id"),
+    )
 
     meeting_id: Mapped[str] = mapped_column(
         String(15),
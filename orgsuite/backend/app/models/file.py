@@ -2,7 +2,7 @@
 File/document model.
 """
 from typing import Optional, TYPE_CHECKING
-from sqlalchemy import String, Text, Integer, ForeignKey, Enum
+from sqlalchemy import String, Text, Integer, ForeignKey, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 from app.models.base import BaseModel
@@ -27,6 +27,10 @@ class FileType(str, enum.Enum):
 class File(BaseModel):
     """File/document metadata."""
     __tablename__ = "files"
+    __table_args__ = (
+        # list_files: filter by organization, newest first
+        Index("ix_files_org_created", "organization_id", "created"),
+    )
 
     # File storage
     file: Mapped[str] = mapped_column(String(500), nullable=False)  # File path
@@ -4,7 +4,7 @@ Journal Entry model for double-entry bookkeeping.
 from typing import Optional, TYPE_CHECKING
 from datetime import date
 from enum import Enum
-from sqlalchemy import String, Text, ForeignKey, Boolean, Date, Enum as SQLEnum
+from sqlalchemy import String, Text, ForeignKey, Boolean, Date, Index, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import BaseModel
 
@@ -29,6 +29,13 @@ class JournalEntry(BaseModel):
     Each journal entry must balance (total debits = total credits).
     """
     __tablename__ = "journal_entries"
+    __table_args__ = (
+        Index("uq_journal_entries_org_entry_number", "organization_id", "entry_number", unique=True),
+        # list_journal_entries: ORDER BY entry_date DESC, created DESC per org,
+        # optionally narrowed by status
+        Index("ix_journal_entries_org_date", "organization_id", "entry_date", "created"),
+        Index("ix_journal_entries_org_status_date", "organization_id", "status", "entry_date", "created"),
+    )
 
     # Organization relation
     organization_id: Mapped[str] = mapped_column(
@@ -3,7 +3,8 @@ Meeting model.
 """
 from typing import Optional, TYPE_CHECKING
 from datetime import datetime
-from sqlalchemy import String, Text, Boolean, Integer, ForeignKey, DateTime, Enum, JSON
+from sqlalchemy import String, Text, Boolean, Integer, ForeignKey, DateTime, Enum, JSON, Index, DDL, column, event
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 from app.models.base import BaseModel
@@ -46,6 +47,12 @@ class MeetingType(str, enum.Enum):
 class Meeting(BaseModel):
     """Meeting model."""
     __tablename__ = "meetings"
+    __table_args__ = (
+        # list_meetings: keyset pagination on (start_time, id), newest first
+        Index("ix_meetings_start_time_id", "start_time", "id"),
+        # list_meetings: ids of meetings created by the user (index-only)
+        Index("ix_meetings_created_by_id", "created_by_id", "id"),
+    )
 
     # Optional direct organization linkage (may be NULL for legacy records using committee only)
     organization_id: Mapped[Optional[str]] = mapped_column(
@@ -67,7 +74,7 @@ class Meeting(BaseModel):
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Timing
-    start_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+    start_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     end_time: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     status: Mapped[MeetingStatus] = mapped_column(
@@ -166,3 +173,25 @@ class Meeting(BaseModel):
 
     def __repr__(self) -> str:
         return f"<Meeting {self.title}>"
+
+
+# Generated full-text vector over title and description (PostgreSQL only).
+# It is not a mapped attribute, so ORM loads never select it and SQLite
+# schemas simply lack it; meeting_search_clause reads it on PostgreSQL.
+Meeting.search_vec = column("search_vec", TSVECTOR, _selectable=Meeting.__table__)
+
+# create_all builds the same column and GIN index as migration 014
+event.listen(
+    Meeting.__table__,
+    "after_create",
+    DDL(
+        "ALTER TABLE meetings ADD COLUMN search_vec tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('simple', "
+        "coalesce(title, '') || ' ' || coalesce(description, ''))) STORED"
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    Meeting.__table__,
+    "after_create",
+    DDL("CREATE INDEX ix_meetings_search_vec ON meetings USING GIN (search_vec)").execute_if(dialect="postgresql"),
+)
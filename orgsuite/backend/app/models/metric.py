@@ -7,7 +7,7 @@ Metrics can be manual (user-entered values) or automatic (calculated from other
 from typing import Optional, TYPE_CHECKING, List
 from enum import Enum
 from decimal import Decimal
-from sqlalchemy import String, Text, ForeignKey, Numeric, Integer, Boolean, Enum as SQLEnum
+from sqlalchemy import String, Text, ForeignKey, Numeric, Integer, Boolean, Index, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import BaseModel
 
@@ -41,6 +41,11 @@ class Metric(BaseModel):
     - Automatic: Values calculated from other modules (future)
     """
     __tablename__ = "metrics"
+    __table_args__ = (
+        # Backs list_metrics: WHERE organization_id = ? AND is_archived = ?
+        # ORDER BY sort_order, name
+        Index("ix_metrics_org_archived_order", "organization_id", "is_archived", "sort_order", "name"),
+    )
 
     # Organization relation
     organization_id: Mapped[str] = mapped_column(
@@ -6,7 +6,7 @@ Each metric can have multiple values over time, allowing tracking of trends.
 from typing import Optional, TYPE_CHECKING
 from datetime import date
 from decimal import Decimal
-from sqlalchemy import String, Text, ForeignKey, Numeric, Date
+from sqlalchemy import String, Text, ForeignKey, Numeric, Date, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import BaseModel
 
@@ -22,6 +22,11 @@ class MetricValue(BaseModel):
     Each value represents a point-in-time snapshot of a metric.
     """
     __tablename__ = "metric_values"
+    __table_args__ = (
+        # Backs recent-history and list_metric_values lookups per metric,
+        # scanned backwards for ORDER BY effective_date DESC
+        Index("ix_metric_values_metric_date", "metric_id", "effective_date"),
+    )
 
     # Metric relation
     metric_id: Mapped[str] = mapped_column(
@@ -3,7 +3,7 @@ Organization membership model.
 """
 from typing import Optional, TYPE_CHECKING
 from datetime import datetime
-from sqlalchemy import String, Boolean, ForeignKey, DateTime, Enum, JSON, UniqueConstraint
+from sqlalchemy import String, Boolean, ForeignKey, DateTime, Enum, JSON, UniqueConstraint, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 from app.models.base import BaseModel
@@ -26,6 +26,10 @@ class OrgMembership(BaseModel):
     __tablename__ = "org_memberships"
     __table_args__ = (
         UniqueConstraint("organization_id", "user_id", name="uq_org_memberships_org_user"),
+        # get_my_memberships: keyset pagination on (created, id), newest first
+        Index("ix_org_memberships_user_active_created", "user_id", "is_active", "created", "id"),
+        # get_org_members: keyset pagination on (role, created, id)
+        Index("ix_org_memberships_org_active_role_created", "organization_id", "is_active", "role", "created", "id"),
     )
 
     organization_id: Mapped[str] = mapped_column(
@@ -2,7 +2,7 @@
 Organization model.
 """
 from typing import Optional, TYPE_CHECKING
-from sqlalchemy import String, Text, ForeignKey, JSON
+from sqlalchemy import String, Text, ForeignKey, JSON, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import BaseModel
 
@@ -25,6 +25,10 @@ if TYPE_CHECKING:
 class Organization(BaseModel):
     """Organization model."""
     __tablename__ = "organizations"
+    __table_args__ = (
+        # list_organizations: keyset pagination on (created, id), newest first
+        Index("ix_organizations_created_id", "created", "id"),
+    )
 
     name: Mapped[str] = mapped_column(String(200), unique=True, nullable=False, index=True)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -35,7 +39,8 @@ class Organization(BaseModel):
     owner_id: Mapped[str] = mapped_column(
         String(15),
         ForeignKey("users.id", ondelete="CASCADE"),
-        nullable=False
+        nullable=False,
+        index=True
     )
 
     # Relationships
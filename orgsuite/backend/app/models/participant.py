@@ -3,7 +3,7 @@ Participant model - tracks meeting attendance.
 """
 from typing import Optional, TYPE_CHECKING
 from datetime import datetime
-from sqlalchemy import String, Boolean, Integer, ForeignKey, DateTime, Enum, UniqueConstraint
+from sqlalchemy import String, Boolean, Integer, ForeignKey, DateTime, Enum, UniqueConstraint, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 from app.models.base import BaseModel
@@ -35,6 +35,9 @@ class Participant(BaseModel):
     __tablename__ = "participants"
     __table_args__ = (
         UniqueConstraint("meeting_id", "user_id", name="uq_participants_meeting_user"),
+        # list_meetings: ids of meetings the user participates in (the unique
+        # constraint leads with meeting_id, so it cannot serve this lookup)
+        Index("ix_participants_user_meeting", "user_id", "meeting_id"),
     )
 
     meeting_id: Mapped[str] = mapped_column(
@@ -106,9 +106,13 @@ class MeetingV1ListResponse(BaseModel):
     """Paginated meeting list - v1 API format."""
     page: int
     perPage: int
-    totalItems: int
-    totalPages: int
+    # Only counted when the request sets includeTotal
+    totalItems: Optional[int] = None
+    totalPages: Optional[int] = None
     items: list[MeetingV1Response]
+    # Pass back as `cursor` to fetch the following page
+    nextCursor: Optional[str] = None
+    hasMore: bool = False
 
 
 # ============================================================================
@@ -211,9 +215,13 @@ class AgendaItemV1ListResponse(BaseModel):
     """Paginated agenda item list - v1 API format."""
     page: int
     perPage: int
-    totalItems: int
-    totalPages: int
+    # Only counted when the request sets includeTotal
+    totalItems: Optional[int] = None
+    totalPages: Optional[int] = None
     items: list[AgendaItemV1Response]
+    # Pass back as `cursor` to fetch the following page
+    nextCursor: Optional[str] = None
+    hasMore: bool = False
 
 
 # ============================================================================
@@ -69,9 +69,13 @@ class OrgMembershipListResponse(BaseModel):
     """Schema for paginated organization membership list response."""
     page: int
     perPage: int
-    totalItems: int
-    totalPages: int
+    # Not counted for cursor requests
+    totalItems: Optional[int] = None
+    totalPages: Optional[int] = None
     items: List[OrgMembershipResponse]
+    # Pass back as `cursor` to fetch the following page
+    nextCursor: Optional[str] = None
+    hasMore: bool = False
 
 
 class AddMemberByEmailRequest(BaseModel):
@@ -46,6 +46,10 @@ class OrganizationV1ListResponse(BaseModel):
     """Paginated organization list - v1 API format."""
     page: int
     perPage: int
-    totalItems: int
-    totalPages: int
+    # Not counted for cursor requests
+    totalItems: Optional[int] = None
+    totalPages: Optional[int] = None
     items: list[OrganizationV1Response]
+    # Pass back as `cursor` to fetch the following page
+    nextCursor: Optional[str] = None
+    hasMore: bool = False
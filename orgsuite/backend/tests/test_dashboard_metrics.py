@@ -0,0 +1,199 @@
+"""
+Tests for Dashboard metrics endpoints.
+"""
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+from app.models.organization import Organization
+from app.models.org_membership import OrgMembership, OrgMembershipRole
+from app.core.security import get_password_hash, create_access_token
+
+
+METRICS_URL = "/api/v1/dashboard/metrics"
+
+
+async def create_metric(client: AsyncClient, headers: dict, org_id: str, name: str = "Members") -> dict:
+    response = await client.post(
+        METRICS_URL,
+        json={"organization_id": org_id, "name": name},
+        headers=headers
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+async def add_value(client: AsyncClient, headers: dict, org_id: str, metric_id: str, value, effective_date: str):
+    response = await client.post(
+        f"{METRICS_URL}/{metric_id}/values?organization_id={org_id}",
+        json={"value": value, "effective_date": effective_date},
+        headers=headers
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+class TestMetricsList:
+    """Tests for listing metrics."""
+
+    @pytest.mark.asyncio
+    async def test_list_metrics_recent_history(
+        self, client: AsyncClient, auth_headers: dict, test_org: Organization
+    ):
+        """Test that only the five most recent values are returned per metric."""
+        metric = await create_metric(client, auth_headers, test_org.id)
+        for day in range(1, 8):
+            await add_value(client, auth_headers, test_org.id, metric["id"], day, f"2024-01-0{day}")
+
+        response = await client.get(
+            f"{METRICS_URL}?organization_id={test_org.id}",
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["total"] == 1
+        item = data["items"][0]
+        assert item["latest_value"]["effective_date"] == "2024-01-07"
+        assert [v["effective_date"] for v in item["recent_history"]] == [
+            "2024-01-07", "2024-01-06", "2024-01-05", "2024-01-04", "2024-01-03"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_list_metrics_reflects_writes(
+        self, client: AsyncClient, auth_headers: dict, test_org: Organization
+    ):
+        """Test that cached lists are refreshed after a metric write."""
+        url = f"{METRICS_URL}?organization_id={test_org.id}"
+        assert (await client.get(url, headers=auth_headers)).json()["total"] == 0
+
+        metric = await create_metric(client, auth_headers, test_org.id)
+        assert (await client.get(url, headers=auth_headers)).json()["total"] == 1
+
+        await add_value(client, auth_headers, test_org.id, metric["id"], "12.50", "2024-02-01")
+        data = (await client.get(url, headers=auth_headers)).json()
+        assert data["items"][0]["latest_value"]["value"] == "12.50"
+
+        response = await client.delete(
+            f"{METRICS_URL}/{metric['id']}?organization_id={test_org.id}",
+            headers=auth_headers
+        )
+        assert response.status_code == 204
+        assert (await client.get(url, headers=auth_headers)).json()["total"] == 0
+
+    @pytest.mark.asyncio
+    async def test_list_metrics_not_modified(
+        self, client: AsyncClient, auth_headers: dict, test_org: Organization
+    ):
+        """Test that a matching If-None-Match returns 304 until the list changes."""
+        url = f"{METRICS_URL}?organization_id={test_org.id}"
+        response = await client.get(url, headers=auth_headers)
+        etag = response.headers["etag"]
+
+        response = await client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 304
+
+        await create_metric(client, auth_headers, test_org.id)
+        response = await client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    @pytest.mark.asyncio
+    async def test_list_metrics_non_member(
+        self, client: AsyncClient, db_session: AsyncSession, test_org: Organization
+    ):
+        """Test that non-members cannot list metrics."""
+        other_user = User(
+            email="outsider@example.com",
+            name="Outsider",
+            password_hash=get_password_hash("TestPass123"),
+            verified=True,
+        )
+        db_session.add(other_user)
+        await db_session.flush()
+        headers = {"Authorization": f"Bearer {create_access_token(subject=other_user.id)}"}
+
+        response = await client.get(
+            f"{METRICS_URL}?organization_id={test_org.id}",
+            headers=headers
+        )
+        assert response.status_code == 403
+
+
+class TestMetricsWrite:
+    """Tests for creating and updating metrics."""
+
+    @pytest.mark.asyncio
+    async def test_setup_metrics(
+        self, client: AsyncClient, auth_headers: dict, test_org: Organization
+    ):
+        """Test creating several metrics at once from the setup wizard."""
+        response = await client.post(
+            f"{METRICS_URL}/setup",
+            json={
+                "organization_id": test_org.id,
+                "metrics": [
+                    {"name": "Revenue", "value_type": "currency"},
+                    {"name": "Members", "value_type": "number"},
+                ],
+            },
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["metrics_created"] == 2
+        assert [m["name"] for m in data["metrics"]] == ["Revenue", "Members"]
+        assert [m["sort_order"] for m in data["metrics"]] == [1, 2]
+        assert all(m["latest_value"] is None for m in data["metrics"])
+
+    @pytest.mark.asyncio
+    async def test_update_metric_viewer_forbidden(
+        self, client: AsyncClient, db_session: AsyncSession, auth_headers: dict, test_org: Organization
+    ):
+        """Test that viewers cannot update metrics."""
+        metric = await create_metric(client, auth_headers, test_org.id)
+
+        viewer = User(
+            email="viewer@example.com",
+            name="Viewer",
+            password_hash=get_password_hash("TestPass123"),
+            verified=True,
+        )
+        db_session.add(viewer)
+        await db_session.flush()
+        db_session.add(OrgMembership(
+            organization_id=test_org.id,
+            user_id=viewer.id,
+            role=OrgMembershipRole.VIEWER,
+            is_active=True,
+        ))
+        await db_session.flush()
+        headers = {"Authorization": f"Bearer {create_access_token(subject=viewer.id)}"}
+
+        response = await client.put(
+            f"{METRICS_URL}/{metric['id']}?organization_id={test_org.id}",
+            json={"name": "Renamed"},
+            headers=headers
+        )
+        assert response.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_add_value_wrong_org(
+        self, client: AsyncClient, db_session: AsyncSession, auth_headers: dict,
+        test_org: Organization, test_user: User
+    ):
+        """Test that values cannot be added to a metric through another organization."""
+        metric = await create_metric(client, auth_headers, test_org.id)
+
+        other_org = Organization(name="Other Organization", owner_id=test_user.id)
+        db_session.add(other_org)
+        await db_session.flush()
+
+        response = await client.post(
+            f"{METRICS_URL}/{metric['id']}/values?organization_id={other_org.id}",
+            json={"value": 1},
+            headers=auth_headers
+        )
+        assert response.status_code == 404
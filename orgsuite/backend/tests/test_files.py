@@ -8,6 +8,15 @@ from app.core.config import settings
 settings.UPLOAD_DIR = os.path.abspath("./test_uploads")
 
 
+def stored_files(root: str) -> set[str]:
+    """Return every file path under root, relative to it."""
+    return {
+        os.path.relpath(os.path.join(dirpath, name), root)
+        for dirpath, _, names in os.walk(root)
+        for name in names
+    }
+
+
 @pytest.mark.asyncio
 async def test_file_crud(client: AsyncClient, auth_headers: dict, test_org):
     # Upload a file
@@ -69,3 +78,80 @@ async def test_file_crud(client: AsyncClient, auth_headers: dict, test_org):
     )
     assert list_resp2.status_code == 200
     assert list_resp2.json()["totalItems"] == 0
+
+
+@pytest.mark.asyncio
+async def test_file_upload_size(client: AsyncClient, auth_headers: dict, test_org, monkeypatch):
+    # Multi-chunk upload records the full size on disk and in the record
+    content = os.urandom(1024 * 1024 * 2 + 123)
+    resp = await client.post(
+        "/api/collections/files/records",
+        headers=auth_headers,
+        files={"upload": ("big.bin", content, "application/octet-stream")},
+        data={"organization": test_org.id},
+    )
+    assert resp.status_code == 200, resp.text
+    record = resp.json()
+    assert record["file_size"] == len(content)
+    # Stored under two hex bucket levels derived from the file id
+    fid = record["id"]
+    assert record["file"] == os.path.join(test_org.id, "files", fid[:2], fid[2:4], f"{fid}_big.bin")
+    with open(os.path.join(settings.UPLOAD_DIR, record["file"]), "rb") as f:
+        assert f.read() == content
+
+    # Uploads over MAX_UPLOAD_SIZE are rejected and nothing is left behind
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE", 1024)
+    org_dir = os.path.join(settings.UPLOAD_DIR, test_org.id, "files")
+    before = stored_files(org_dir)
+    resp = await client.post(
+        "/api/collections/files/records",
+        headers=auth_headers,
+        files={"upload": ("too_big.bin", b"x" * 2048, "application/octet-stream")},
+        data={"organization": test_org.id},
+    )
+    assert resp.status_code == 413
+    assert stored_files(org_dir) == before
+
+
+@pytest.mark.asyncio
+async def test_file_download_accel_redirect(client: AsyncClient, auth_headers: dict, test_org, monkeypatch):
+    resp = await client.post(
+        "/api/collections/files/records",
+        headers=auth_headers,
+        files={"upload": ("report.pdf", b"%PDF-1.4", "application/pdf")},
+        data={"organization": test_org.id},
+    )
+    assert resp.status_code == 200, resp.text
+    record = resp.json()
+
+    # With a prefix configured the body is left for nginx to send
+    monkeypatch.setattr(settings, "X_ACCEL_REDIRECT_PREFIX", "/_protected_uploads/")
+    dl_resp = await client.get(
+        f"/api/collections/files/records/{record['id']}/download",
+        headers=auth_headers,
+    )
+    assert dl_resp.status_code == 200
+    assert dl_resp.content == b""
+    assert dl_resp.headers["x-accel-redirect"] == f"/_protected_uploads/{record['file']}"
+    assert dl_resp.headers["content-type"] == "application/pdf"
+    assert dl_resp.headers["content-disposition"] == 'attachment; filename="report.pdf"'
+
+
+@pytest.mark.asyncio
+async def test_file_download_missing(client: AsyncClient, auth_headers: dict, test_org):
+    resp = await client.post(
+        "/api/collections/files/records",
+        headers=auth_headers,
+        files={"upload": ("gone.txt", b"bye", "text/plain")},
+        data={"organization": test_org.id},
+    )
+    assert resp.status_code == 200, resp.text
+    record = resp.json()
+    os.remove(os.path.join(settings.UPLOAD_DIR, record["file"]))
+
+    dl_resp = await client.get(
+        f"/api/collections/files/records/{record['id']}/download",
+        headers=auth_headers,
+    )
+    assert dl_resp.status_code == 404
+    assert dl_resp.json()["detail"] == "Stored file missing"
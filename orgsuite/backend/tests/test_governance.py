@@ -12,9 +12,14 @@ Tests cover:
 import pytest
 import pytest_asyncio
 from datetime import datetime, timezone, timedelta
+from types import SimpleNamespace
 from httpx import AsyncClient
+from sqlalchemy import select, create_mock_engine
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.v1.governance.meetings import meeting_search_clause
+from app.core.pagination import encode_cursor
 from app.models.user import User
 from app.models.organization import Organization
 from app.models.committee import Committee
@@ -261,13 +266,103 @@ class TestMeetings:
     async def test_list_meetings(self, client: AsyncClient, auth_headers: dict, test_meeting: Meeting):
         """Test listing meetings."""
         response = await client.get(
-            "/api/v1/governance/meetings",
+            "/api/v1/governance/meetings?includeTotal=true",
             headers=auth_headers,
         )
         assert response.status_code == 200
         data = response.json()
         assert data["totalItems"] >= 1
 
+    async def test_list_meetings_without_total(self, client: AsyncClient, auth_headers: dict, test_meeting: Meeting):
+        """Test that the total count is skipped unless requested."""
+        response = await client.get(
+            "/api/v1/governance/meetings",
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["totalItems"] is None
+        assert data["totalPages"] is None
+        assert len(data["items"]) >= 1
+
+    async def test_list_meetings_cursor(
+        self, client: AsyncClient, db_session: AsyncSession, auth_headers: dict,
+        test_committee: Committee, test_user: User
+    ):
+        """Test paging meetings with a cursor, including tied start times."""
+        start_time = datetime.now(timezone.utc) + timedelta(days=1)
+        for i in range(5):
+            db_session.add(Meeting(
+                title=f"Meeting {i}",
+                start_time=start_time - timedelta(hours=i // 2),
+                status=MeetingStatus.SCHEDULED,
+                committee_id=test_committee.id,
+                created_by_id=test_user.id,
+            ))
+        await db_session.flush()
+
+        response = await client.get("/api/v1/governance/meetings?perPage=2&includeTotal=true", headers=auth_headers)
+        data = response.json()
+        assert data["totalItems"] == 5
+        assert data["hasMore"] is True
+        seen = [m["id"] for m in data["items"]]
+
+        while data["nextCursor"]:
+            response = await client.get(
+                f"/api/v1/governance/meetings?perPage=2&cursor={data['nextCursor']}",
+                headers=auth_headers,
+            )
+            assert response.status_code == 200
+            data = response.json()
+            assert data["totalItems"] is None
+            seen += [m["id"] for m in data["items"]]
+
+        assert data["hasMore"] is False
+        assert len(seen) == len(set(seen)) == 5
+
+    async def test_list_meetings_search(self, client: AsyncClient, auth_headers: dict, test_meeting: Meeting):
+        """Test filtering meetings by a search term."""
+        response = await client.get("/api/v1/governance/meetings?search=test", headers=auth_headers)
+        assert [m["id"] for m in response.json()["items"]] == [test_meeting.id]
+
+        response = await client.get("/api/v1/governance/meetings?search=budget", headers=auth_headers)
+        assert response.json()["items"] == []
+
+    async def test_meeting_search_clause_postgresql(self):
+        """Test the PostgreSQL search branch, which the SQLite suite never runs."""
+        dialect = postgresql.dialect()
+        db = SimpleNamespace(bind=SimpleNamespace(dialect=dialect))
+        sql = str(select(Meeting.id).where(meeting_search_clause(db, "budg")).compile(dialect=dialect))
+        assert "meetings.search_vec @@ plainto_tsquery(" in sql
+        assert "meetings.description ILIKE" in sql
+        assert sql.count("FROM meetings") == 1
+
+        # create_all adds the generated column that the clause reads
+        statements = []
+        engine = create_mock_engine(
+            "postgresql://",
+            lambda ddl, *args, **kwargs: statements.append(str(ddl.compile(dialect=dialect))),
+        )
+        Meeting.__table__.create(engine, checkfirst=False)
+        assert any("ADD COLUMN search_vec tsvector" in s for s in statements)
+
+    async def test_list_meetings_invalid_cursor(self, client: AsyncClient, auth_headers: dict):
+        """Test that a malformed cursor is rejected."""
+        response = await client.get(
+            "/api/v1/governance/meetings?cursor=not-a-cursor",
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+
+    async def test_list_meetings_tampered_cursor(self, client: AsyncClient, auth_headers: dict):
+        """Test that a cursor holding values of the wrong type is rejected."""
+        cursor = encode_cursor({"start_time": "2026-01-01T00:00:00+00:00", "id": 5})
+        response = await client.get(
+            f"/api/v1/governance/meetings?cursor={cursor}",
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+
     async def test_get_meeting(self, client: AsyncClient, auth_headers: dict, test_meeting: Meeting):
         """Test getting a meeting."""
         response = await client.get(
@@ -408,13 +503,31 @@ class TestAgendaItems:
     async def test_list_agenda_items(self, client: AsyncClient, auth_headers: dict, test_meeting: Meeting, test_agenda_item: AgendaItem):
         """Test listing agenda items."""
         response = await client.get(
-            f"/api/v1/governance/agenda-items?meeting_id={test_meeting.id}",
+            f"/api/v1/governance/agenda-items?meeting_id={test_meeting.id}&includeTotal=true",
             headers=auth_headers,
         )
         assert response.status_code == 200
         data = response.json()
         assert data["totalItems"] >= 1
 
+    async def test_list_agenda_items_cursor(
+        self, client: AsyncClient, db_session: AsyncSession, auth_headers: dict, test_meeting: Meeting
+    ):
+        """Test paging agenda items with a cursor in agenda order."""
+        for i in range(3):
+            db_session.add(AgendaItem(meeting_id=test_meeting.id, title=f"Item {i}", order=i))
+        await db_session.flush()
+
+        url = f"/api/v1/governance/agenda-items?meeting_id={test_meeting.id}&perPage=2"
+        data = (await client.get(url, headers=auth_headers)).json()
+        assert [item["title"] for item in data["items"]] == ["Item 0", "Item 1"]
+        assert data["hasMore"] is True
+
+        data = (await client.get(f"{url}&cursor={data['nextCursor']}", headers=auth_headers)).json()
+        assert [item["title"] for item in data["items"]] == ["Item 2"]
+        assert data["hasMore"] is False
+        assert data["nextCursor"] is None
+
     async def test_update_agenda_item(self, client: AsyncClient, auth_headers: dict, test_agenda_item: AgendaItem):
         """Test updating an agenda item."""
         response = await client.patch(
@@ -214,6 +214,72 @@ class TestOrganizationsPagination:
         assert data["page"] == 1
         assert data["perPage"] == 10
 
+    @pytest.mark.asyncio
+    async def test_cursor_pagination(self, client: AsyncClient, auth_headers: dict):
+        """Test walking the organization list with nextCursor."""
+        for i in range(3):
+            response = await client.post(
+                "/api/v1/organizations",
+                json={"name": f"Cursor Org {i}"},
+                headers=auth_headers
+            )
+            assert response.status_code == 201
+
+        response = await client.get("/api/v1/organizations?perPage=2", headers=auth_headers)
+        first = response.json()
+        assert first["totalItems"] == 3
+        assert first["hasMore"] is True
+
+        response = await client.get(
+            f"/api/v1/organizations?perPage=2&cursor={first['nextCursor']}",
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        second = response.json()
+        assert second["totalItems"] is None
+        assert second["hasMore"] is False
+        assert second["nextCursor"] is None
+
+        names = [org["name"] for org in first["items"] + second["items"]]
+        assert sorted(names) == ["Cursor Org 0", "Cursor Org 1", "Cursor Org 2"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self, client: AsyncClient, auth_headers: dict):
+        """Test that a malformed cursor is rejected."""
+        response = await client.get("/api/v1/organizations?cursor=bogus", headers=auth_headers)
+        assert response.status_code == 400
+
+
+class TestMyMemberships:
+    """Test the current user's membership list."""
+
+    @pytest.mark.asyncio
+    async def test_my_memberships_reflect_writes(
+        self, client: AsyncClient, auth_headers: dict, test_org
+    ):
+        """Test that the cached list is refreshed after organization writes."""
+        url = "/api/v1/governance/org-memberships/my"
+        data = (await client.get(url, headers=auth_headers)).json()
+        assert [m["organization"]["name"] for m in data["items"]] == ["Test Organization"]
+
+        response = await client.post(
+            "/api/v1/organizations",
+            json={"name": "Second Organization"},
+            headers=auth_headers
+        )
+        assert response.status_code == 201
+        data = (await client.get(url, headers=auth_headers)).json()
+        assert data["totalItems"] == 2
+
+        response = await client.patch(
+            f"/api/v1/organizations/{test_org.id}",
+            json={"name": "Renamed Organization"},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = (await client.get(url, headers=auth_headers)).json()
+        assert "Renamed Organization" in [m["organization"]["name"] for m in data["items"]]
+
 
 class TestOrganizationsAuth:
     """Test Organization authentication requirements."""
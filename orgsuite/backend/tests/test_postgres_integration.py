@@ -310,6 +310,16 @@ class TestPostgresGovernance:
         assert reopen_response.status_code == 200
         assert reopen_response.json()["status"] == "in_progress"
 
+    async def test_search_meetings(self, pg_client: AsyncClient, pg_auth_headers: dict, pg_test_meeting):
+        """Test meeting search against the generated search_vec column."""
+        for term, expected in (("postgresql", [pg_test_meeting.id]), ("postgr", [pg_test_meeting.id]), ("budget", [])):
+            response = await pg_client.get(
+                f"/api/v1/governance/meetings?search={term}",
+                headers=pg_auth_headers,
+            )
+            assert response.status_code == 200
+            assert [m["id"] for m in response.json()["items"]] == expected
+
 
 class TestPostgresDonations:
     """PostgreSQL integration tests for Donations."""
@@ -617,7 +617,7 @@ test.describe('Governance API: Meetings', () => {
     });
 
     // List meetings
-    const listResponse = await request.get('/api/v1/governance/meetings', {
+    const listResponse = await request.get('/api/v1/governance/meetings?includeTotal=true', {
       headers: { 'Authorization': `Bearer ${authState.token}` }
     });
     expect(listResponse.status()).toBe(200);
@@ -719,7 +719,7 @@ test.describe('Governance API: Agenda Items', () => {
     expect(item.title).toBe('Opening Remarks');
 
     // List agenda items
-    const listResponse = await request.get(`/api/v1/governance/agenda-items?meeting_id=${meeting.id}`, {
+    const listResponse = await request.get(`/api/v1/governance/agenda-items?meeting_id=${meeting.id}&includeTotal=true`, {
       headers: { 'Authorization': `Bearer ${authState.token}` }
     });
     expect(listResponse.status()).toBe(200);